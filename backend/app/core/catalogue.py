@@ -0,0 +1,94 @@
+"""
+Catalogue version marker.
+
+Anything that rewrites the catalogue (scripts/import_excel.py,
+scripts/cleanup_duplicates.py) bumps a counter in the `catalogue_meta`
+collection. The API polls it at most every CATALOGUE_VERSION_POLL_SECONDS and
+notifies subscribers (result caches, in-process indexes) when it changes.
+"""
+
+import os
+import threading
+import time
+from typing import Callable, List, Optional
+
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.database import Database
+
+CATALOGUE_META_COLLECTION = "catalogue_meta"
+CATALOGUE_VERSION_ID = "catalogue"
+
+CATALOGUE_VERSION_POLL_SECONDS = float(os.getenv("CATALOGUE_VERSION_POLL_SECONDS", "5"))
+
+
+def get_catalogue_version(db: Database) -> int:
+    doc = db[CATALOGUE_META_COLLECTION].find_one(
+        {"_id": CATALOGUE_VERSION_ID}, {"version": 1}
+    )
+    return doc.get("version", 0) if doc else 0
+
+
+async def get_catalogue_version_async(db: AsyncDatabase) -> int:
+    doc = await db[CATALOGUE_META_COLLECTION].find_one(
+        {"_id": CATALOGUE_VERSION_ID}, {"version": 1}
+    )
+    return doc.get("version", 0) if doc else 0
+
+
+def bump_catalogue_version(db: Database) -> None:
+    db[CATALOGUE_META_COLLECTION].update_one(
+        {"_id": CATALOGUE_VERSION_ID},
+        {"$inc": {"version": 1}, "$currentDate": {"updatedAt": True}},
+        upsert=True,
+    )
+
+
+class VersionWatcher:
+    def __init__(self, poll_seconds: float):
+        self._poll_seconds = poll_seconds
+        self._lock = threading.Lock()
+        self._subscribers: List[Callable[[], None]] = []
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+
+    def subscribe(self, callback: Callable[[], None]) -> None:
+        self._subscribers.append(callback)
+
+    def check(self, db: Database) -> None:
+        """
+        Re-read the version marker if the last read is older than the poll
+        interval, and notify subscribers when it changed.
+        """
+        if time.monotonic() - self._checked_at < self._poll_seconds:
+            return
+        with self._lock:
+            if time.monotonic() - self._checked_at < self._poll_seconds:
+                return
+            version = get_catalogue_version(db)
+            self._checked_at = time.monotonic()
+            changed = self._version is not None and version != self._version
+            self._version = version
+
+        if changed:
+            self.notify()
+
+    async def check_async(self, db: AsyncDatabase) -> None:
+        """
+        `check` for the async data layer. The poll slot is claimed before the
+        read so concurrent requests don't all hit the database.
+        """
+        if time.monotonic() - self._checked_at < self._poll_seconds:
+            return
+        self._checked_at = time.monotonic()
+        version = await get_catalogue_version_async(db)
+        changed = self._version is not None and version != self._version
+        self._version = version
+        if changed:
+            self.notify()
+
+    def notify(self) -> None:
+        for callback in self._subscribers:
+            callback()
+
+
+watcher = VersionWatcher(CATALOGUE_VERSION_POLL_SECONDS)
@@ -1,15 +1,129 @@
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from pymongo import MongoClient
+from typing import Optional
+from pymongo import AsyncMongoClient, MongoClient
+from pymongo.asynchronous.database import AsyncDatabase
+import asyncio
 import os
+import time
+
+from app.core import metrics, slowlog
 
 MONGO_URI = os.getenv("MONGO_URI")
 DB_NAME = os.getenv("DB_NAME", "aston_cs_research_portal")
 
+# "sync" serves the API from threadpool handlers over MongoClient, "async"
+# from coroutine handlers over AsyncMongoClient (see main.py).
+DB_DRIVER = os.getenv("DB_DRIVER", "sync")
+
+# Connection pool, shared by both drivers. Each option is only passed when
+# its variable is set, so options in MONGO_URI (or PyMongo's defaults) apply
+# otherwise.
+MONGO_CLIENT_OPTIONS = {
+    "maxPoolSize": "MONGO_MAX_POOL_SIZE",
+    "minPoolSize": "MONGO_MIN_POOL_SIZE",
+    "maxIdleTimeMS": "MONGO_MAX_IDLE_TIME_MS",
+    "serverSelectionTimeoutMS": "MONGO_SERVER_SELECTION_TIMEOUT_MS",
+}
+# Connections opened with concurrent pings at startup, so the first requests
+# after a deploy or cold start don't pay for DNS, TLS and the handshake.
+MONGO_WARMUP_CONNECTIONS = int(os.getenv("MONGO_WARMUP_CONNECTIONS", "1"))
+
+
+def client_options() -> dict:
+    options = {
+        option: int(os.environ[variable])
+        for option, variable in MONGO_CLIENT_OPTIONS.items()
+        if os.getenv(variable)
+    }
+    listeners = []
+    if metrics.METRICS_ENABLED:
+        listeners.append(metrics.command_metrics)
+    if slowlog.SLOW_QUERY_ENABLED:
+        listeners.append(slowlog.slow_query_log)
+    if listeners:
+        options["event_listeners"] = listeners
+    return options
+
+
+def _warmup_count(client) -> int:
+    max_pool_size = client.options.pool_options.max_pool_size
+    return max(0, min(MONGO_WARMUP_CONNECTIONS, max_pool_size))
+
 
 @lru_cache(maxsize=1)
 def get_client():
-    return MongoClient(MONGO_URI)
+    return MongoClient(MONGO_URI, **client_options())
 
 
 def get_db():
     return get_client()[DB_NAME]
+
+
+def ping() -> float:
+    """
+    Round trip of a `ping` command in ms.
+    """
+    start = time.perf_counter()
+    get_client().admin.command("ping")
+    return (time.perf_counter() - start) * 1000
+
+
+def warm_up() -> int:
+    """
+    Open MONGO_WARMUP_CONNECTIONS pooled connections. The pings run
+    concurrently, so each one checks out its own connection.
+    """
+    count = _warmup_count(get_client())
+    if count:
+        with ThreadPoolExecutor(max_workers=count) as pool:
+            list(pool.map(lambda _: ping(), range(count)))
+    return count
+
+
+def close_client() -> None:
+    if get_client.cache_info().currsize:
+        get_client().close()
+        get_client.cache_clear()
+
+
+# --------------------------------------------------------
+# Async driver — the client is opened/closed by the app lifespan
+# --------------------------------------------------------
+_async_client: Optional[AsyncMongoClient] = None
+
+
+def open_async_client() -> AsyncMongoClient:
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncMongoClient(MONGO_URI, **client_options())
+    return _async_client
+
+
+async def close_async_client() -> None:
+    global _async_client
+    if _async_client is not None:
+        await _async_client.close()
+        _async_client = None
+
+
+def get_async_client() -> AsyncMongoClient:
+    if _async_client is None:
+        raise RuntimeError("Async MongoDB client is not open (app lifespan not run)")
+    return _async_client
+
+
+def get_async_db() -> AsyncDatabase:
+    return get_async_client()[DB_NAME]
+
+
+async def ping_async() -> float:
+    start = time.perf_counter()
+    await get_async_client().admin.command("ping")
+    return (time.perf_counter() - start) * 1000
+
+
+async def warm_up_async() -> int:
+    count = _warmup_count(get_async_client())
+    await asyncio.gather(*(ping_async() for _ in range(count)))
+    return count
@@ -0,0 +1,262 @@
+"""
+MongoDB indexes the API and the import scripts depend on, declared in one
+place.
+
+    python -m app.core.indexes [create]   create every declared index
+    python -m app.core.indexes verify     list declared indexes that are missing
+    python -m app.core.indexes explain    IXSCAN / COLLSCAN per service query
+
+Creation is idempotent. The API verifies the indexes at startup and logs a
+warning for each missing one; set ENSURE_INDEXES_ON_STARTUP=true to have it
+create them instead.
+"""
+
+import argparse
+import logging
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from pymongo import ASCENDING, TEXT, IndexModel
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.database import Database
+
+logger = logging.getLogger(__name__)
+
+ENSURE_INDEXES_ON_STARTUP = os.getenv("ENSURE_INDEXES_ON_STARTUP", "") == "true"
+
+# Weighted text indexes behind `GET /api/v1/search?mode=text`.
+# A collection can only have one text index, so these names are fixed.
+TEXT_INDEXES = {
+    "publications": IndexModel(
+        [("title", TEXT), ("keywords", TEXT)],
+        name="publications_text",
+        weights={"title": 10, "keywords": 5},
+    ),
+    "faculties": IndexModel(
+        [("name", TEXT), ("researchInterest", TEXT)],
+        name="faculties_text",
+        weights={"name": 10, "researchInterest": 5},
+    ),
+}
+
+INDEXES: Dict[str, List[IndexModel]] = {
+    "departments": [
+        # department detail: find_one({slug, isComputerScienceRelated})
+        IndexModel([("slug", ASCENDING)], name="departments_slug"),
+        # department list
+        IndexModel([("isComputerScienceRelated", ASCENDING)], name="departments_cs"),
+    ],
+    "faculties": [
+        # faculties of a department (multikey)
+        IndexModel([("departmentIds", ASCENDING)], name="faculties_departmentIds"),
+        TEXT_INDEXES["faculties"],
+    ],
+    "publications": [
+        # publications of a faculty (multikey)
+        IndexModel([("authors", ASCENDING)], name="publications_authors"),
+        # dedup key of import_excel.py and cleanup_duplicates.py
+        IndexModel(
+            [("title", ASCENDING), ("kind", ASCENDING)], name="publications_title_kind"
+        ),
+        TEXT_INDEXES["publications"],
+    ],
+}
+
+
+def ensure_indexes(db: Database) -> List[str]:
+    """
+    Create every declared index that is missing. Safe to run repeatedly;
+    returns the names created. An index that already exists under another
+    name is left alone: MongoDB refuses a second index on the same key, and
+    a second text index on any key.
+    """
+    created = []
+    for collection, models in INDEXES.items():
+        missing = _missing(collection, db[collection].index_information())
+        todo = [m for m in models if m.document["name"] in missing]
+        if todo:
+            created.extend(db[collection].create_indexes(todo))
+    return created
+
+
+def _is_text(model: IndexModel) -> bool:
+    return TEXT in model.document["key"].values()
+
+
+def _matches(model: IndexModel, info: dict) -> bool:
+    """
+    Whether an index_information entry is the declared index. A text index
+    is stored under the key _fts/_ftsx whatever its fields, so text indexes
+    are compared by their fields and weights instead.
+    """
+    if _is_text(model):
+        is_text = dict(info["key"]).get("_fts") == TEXT
+        return is_text and info.get("weights") == model.document.get("weights")
+    return list(model.document["key"].items()) == info["key"]
+
+
+def _missing(collection: str, existing: Dict[str, dict]) -> List[str]:
+    """
+    Declared indexes of `collection` not present in `existing` (the output
+    of index_information) under their name or as an equivalent index.
+    """
+    missing = []
+    for model in INDEXES[collection]:
+        name = model.document["name"]
+        if name not in existing and not any(
+            _matches(model, info) for info in existing.values()
+        ):
+            missing.append(name)
+    return missing
+
+
+def missing_indexes(db: Database) -> Dict[str, List[str]]:
+    report = {c: _missing(c, db[c].index_information()) for c in INDEXES}
+    return {c: names for c, names in report.items() if names}
+
+
+async def missing_indexes_async(db: AsyncDatabase) -> Dict[str, List[str]]:
+    report = {c: _missing(c, await db[c].index_information()) for c in INDEXES}
+    return {c: names for c, names in report.items() if names}
+
+
+def warn_missing(missing: Dict[str, List[str]]) -> None:
+    for collection, names in missing.items():
+        for name in names:
+            logger.warning(
+                "Missing MongoDB index %s.%s; run `python -m app.core.indexes`",
+                collection,
+                name,
+            )
+
+
+# --------------------------------------------------------
+# explain
+# --------------------------------------------------------
+def service_queries(db: Database) -> List[Tuple[str, str, dict, Optional[dict]]]:
+    """
+    (label, collection, filter, sort) for the queries the services and import
+    scripts run, with sample values taken from the database.
+    """
+    dept = db["departments"].find_one({}, {"slug": 1}) or {}
+    fac = db["faculties"].find_one({}, {"_id": 1}) or {}
+    pub = db["publications"].find_one({}, {"title": 1, "kind": 1}) or {}
+    dept_id = dept.get("_id", ObjectId())
+    fac_id = fac.get("_id", ObjectId())
+    pub_id = pub.get("_id", ObjectId())
+    regex = re.compile(".*learning.*", re.IGNORECASE)
+
+    return [
+        ("departments list", "departments", {"isComputerScienceRelated": True}, None),
+        (
+            "department by slug",
+            "departments",
+            {"slug": dept.get("slug", ""), "isComputerScienceRelated": True},
+            None,
+        ),
+        (
+            "faculties of department",
+            "faculties",
+            {"departmentIds": {"$in": [dept_id]}},
+            None,
+        ),
+        ("faculty by id", "faculties", {"_id": fac_id}, None),
+        ("authors of a page", "faculties", {"_id": {"$in": [fac_id]}}, None),
+        ("publications page", "publications", {"_id": {"$gt": pub_id}}, {"_id": 1}),
+        ("publication by id", "publications", {"_id": pub_id}, None),
+        ("publications of faculty", "publications", {"authors": fac_id}, None),
+        (
+            "publication dedup key",
+            "publications",
+            {"title": pub.get("title", ""), "kind": pub.get("kind", "")},
+            None,
+        ),
+        (
+            "search (regex)",
+            "publications",
+            {"$or": [{"title": regex}, {"keywords": regex}]},
+            None,
+        ),
+        ("search (text)", "publications", {"$text": {"$search": "learning"}}, None),
+    ]
+
+
+def _stages(plan: dict) -> List[dict]:
+    stages = [plan]
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            stages.extend(_stages(plan[key]))
+    for child in plan.get("inputStages", []):
+        stages.extend(_stages(child))
+    return stages
+
+
+def summarize_plan(winning_plan: dict) -> str:
+    """
+    COLLSCAN if any part of the plan scans the collection, otherwise the
+    index scans (with index names) it uses.
+    """
+    stages = _stages(winning_plan)
+    names = [s.get("stage") for s in stages]
+    if "COLLSCAN" in names:
+        return "COLLSCAN"
+    scans = [
+        f"{s['stage']} {s['indexName']}" if s.get("indexName") else s["stage"]
+        for s in stages
+        if s.get("stage") in ("IXSCAN", "EXPRESS_IXSCAN", "IDHACK", "TEXT_MATCH")
+    ]
+    return ", ".join(scans) or "/".join(n for n in names if n)
+
+
+def explain_report(db: Database) -> List[Tuple[str, str, str]]:
+    rows = []
+    for label, collection, query, sort in service_queries(db):
+        command = {"find": collection, "filter": query}
+        if sort:
+            command["sort"] = sort
+        try:
+            result = db.command("explain", command, verbosity="queryPlanner")
+            plan = summarize_plan(result["queryPlanner"]["winningPlan"])
+        except Exception as exc:
+            plan = f"error: {exc}"
+        rows.append((label, collection, plan))
+    return rows
+
+
+def main():
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    from app.core.db import get_db
+
+    parser = argparse.ArgumentParser(prog="python -m app.core.indexes")
+    parser.add_argument(
+        "command", nargs="?", default="create", choices=["create", "verify", "explain"]
+    )
+    args = parser.parse_args()
+    db = get_db()
+
+    if args.command == "create":
+        names = ensure_indexes(db)
+        print(
+            "✅ Indexes ensured on", db.name + ":", ", ".join(names) or "none missing"
+        )
+    elif args.command == "verify":
+        missing = missing_indexes(db)
+        if not missing:
+            print("✅ All declared indexes exist on", db.name)
+        for collection, names in missing.items():
+            print(f"❌ {collection}: missing {', '.join(names)}")
+        raise SystemExit(1 if missing else 0)
+    else:
+        rows = explain_report(db)
+        width = max(len(label) for label, _, _ in rows)
+        for label, collection, plan in rows:
+            marker = "❌" if plan == "COLLSCAN" else "✅"
+            print(f"{marker} {label.ljust(width)}  {collection:<13} {plan}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""
+Request and MongoDB command metrics, exposed in Prometheus text format on
+`GET /metrics`.
+
+- MetricsMiddleware records a latency histogram per route template and a
+  count per (route, status). Unmatched paths share one "unmatched" label so
+  scanners can't blow up the label set.
+- CommandMetrics is a PyMongo CommandListener, registered on every client in
+  app.core.db, that records count, duration histogram, failures and returned
+  documents per (collection, command).
+
+Recording is a dict lookup, a bisect and a few integer increments under a
+lock, so it stays on in production; METRICS_ENABLED=false turns both off.
+"""
+
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Tuple
+
+from pymongo import monitoring
+from starlette.routing import Match
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true") != "false"
+
+# seconds, Prometheus convention
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+
+class Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)  # last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name: str, labels: str) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, n in zip(LATENCY_BUCKETS, self.counts):
+            cumulative += n
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum{{{labels}}} {self.sum:.6f}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+
+
+# --------------------------------------------------------
+# HTTP requests
+# --------------------------------------------------------
+class RequestMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latency: Dict[Tuple[str, str], Histogram] = {}
+        self._status: Dict[Tuple[str, str, int], int] = {}
+
+    def record(self, method: str, route: str, status: int, seconds: float) -> None:
+        with self._lock:
+            hist = self._latency.get((method, route))
+            if hist is None:
+                hist = self._latency[(method, route)] = Histogram()
+            hist.observe(seconds)
+            key = (method, route, status)
+            self._status[key] = self._status.get(key, 0) + 1
+
+    def render(self) -> List[str]:
+        lines = [
+            "# HELP http_request_duration_seconds Request latency by route",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            for (method, route), hist in sorted(self._latency.items()):
+                lines += hist.render(
+                    "http_request_duration_seconds", _labels(method=method, route=route)
+                )
+            lines += [
+                "# HELP http_requests_total Requests by route and status code",
+                "# TYPE http_requests_total counter",
+            ]
+            for (method, route, status), n in sorted(self._status.items()):
+                labels = _labels(method=method, route=route, status=status)
+                lines.append(f"http_requests_total{{{labels}}} {n}")
+        return lines
+
+
+_PATH_PARAM = re.compile(r"{(\w+)(?::\w+)?}")
+
+
+def _route_template(scope) -> str:
+    route = scope.get("route")
+    if route is None:
+        # Starlette < 0.35 doesn't record the matched route in the scope
+        for candidate in scope["app"].router.routes:
+            if candidate.matches(scope)[0] == Match.FULL:
+                route = candidate
+                break
+    template = getattr(route, "path", None)
+    if not template:
+        return "unmatched"
+
+    # routes of an included router may only know their own path; the prefix
+    # is what precedes the concrete route path in the request path
+    params = scope.get("path_params", {})
+    concrete = _PATH_PARAM.sub(
+        lambda m: str(params.get(m.group(1), m.group(0))), template
+    )
+    path = scope.get("path", "")
+    if concrete != path and path.endswith(concrete):
+        return path[: -len(concrete)] + template
+    return template
+
+
+class MetricsMiddleware:
+    """
+    Plain ASGI middleware (not BaseHTTPMiddleware), so streaming responses
+    pass through untouched; their latency runs until the last chunk is sent.
+    """
+
+    def __init__(self, app, metrics: RequestMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.metrics.record(
+                scope["method"],
+                _route_template(scope),
+                status,
+                time.perf_counter() - start,
+            )
+
+
+# --------------------------------------------------------
+# MongoDB commands
+# --------------------------------------------------------
+class _CommandStats:
+    __slots__ = ("latency", "failures", "documents")
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.failures = 0
+        self.documents = 0
+
+
+def _collection(event: monitoring.CommandStartedEvent) -> str:
+    if event.command_name == "getMore":
+        target = event.command.get("collection")
+    else:
+        target = event.command.get(event.command_name)
+    return target if isinstance(target, str) else ""
+
+
+def _returned_documents(reply) -> int:
+    cursor = reply.get("cursor") if hasattr(reply, "get") else None
+    if not cursor:
+        return 0
+    return len(cursor.get("firstBatch") or cursor.get("nextBatch") or ())
+
+
+class CommandMetrics(monitoring.CommandListener):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], _CommandStats] = {}
+        # (connection, request id) -> (collection, command) of running commands
+        self._running: Dict[tuple, Tuple[str, str]] = {}
+
+    def _finish(self, event, duration_micros: int, documents: int, failed: bool):
+        key = self._running.pop((event.connection_id, event.request_id), None)
+        if key is None:
+            return
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _CommandStats()
+            stats.latency.observe(duration_micros / 1_000_000)
+            stats.documents += documents
+            if failed:
+                stats.failures += 1
+
+    def started(self, event):
+        self._running[(event.connection_id, event.request_id)] = (
+            _collection(event),
+            event.command_name,
+        )
+
+    def succeeded(self, event):
+        self._finish(
+            event, event.duration_micros, _returned_documents(event.reply), False
+        )
+
+    def failed(self, event):
+        self._finish(event, event.duration_micros, 0, True)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            return self._render(sorted(self._stats.items()))
+
+    def _render(self, items) -> List[str]:
+        lines = [
+            "# HELP mongodb_command_duration_seconds MongoDB command latency",
+            "# TYPE mongodb_command_duration_seconds histogram",
+        ]
+        for (collection, command), stats in items:
+            lines += stats.latency.render(
+                "mongodb_command_duration_seconds",
+                _labels(collection=collection, command=command),
+            )
+        for name, help_text, attr in (
+            ("mongodb_command_failures_total", "Failed MongoDB commands", "failures"),
+            (
+                "mongodb_documents_returned_total",
+                "Documents returned in cursor batches",
+                "documents",
+            ),
+        ):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            for (collection, command), stats in items:
+                labels = _labels(collection=collection, command=command)
+                lines.append(f"{name}{{{labels}}} {getattr(stats, attr)}")
+        return lines
+
+
+# --------------------------------------------------------
+# Gauges/counters owned by other modules
+# --------------------------------------------------------
+def render_family(
+    name: str, help_text: str, metric_type: str, samples: Iterable[Tuple[str, float]]
+) -> List[str]:
+    """
+    One metric family from (labels, value) pairs, labels already rendered.
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+    for labels, value in samples:
+        lines.append(f"{name}{{{labels}}} {value}" if labels else f"{name} {value}")
+    return lines
+
+
+request_metrics = RequestMetrics()
+command_metrics = CommandMetrics()
+
+
+def render(extra: Iterable[str] = ()) -> str:
+    lines = request_metrics.render() + command_metrics.render() + list(extra)
+    return "\n".join(lines) + "\n"
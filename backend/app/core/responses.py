@@ -0,0 +1,55 @@
+"""
+Response serialisation.
+
+Handlers build their payload with `send_response` and return it through
+`json_response`, which encodes it with orjson in one pass. Returning a Response
+skips FastAPI's per-request validation and `jsonable_encoder` walk over the
+payload; the typed `Envelope[...]` models are still declared as
+`response_model`, so they define the documented contract in OpenAPI. That
+contract is not enforced at runtime: fields must be declared in the order the
+services emit them, and benchmarks/bench_serialisation.py fails if the served
+publication page and its declared envelope disagree.
+"""
+
+from typing import Any, Generic, List, Optional, TypeVar
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.core.utils import send_response
+
+T = TypeVar("T")
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str)
+
+
+class Envelope(BaseModel, Generic[T]):
+    statusCode: int
+    success: bool
+    message: Optional[str] = None
+    meta: Optional[dict] = None
+    data: T
+
+
+class ListMeta(BaseModel):
+    total: int
+
+
+class ListEnvelope(Envelope[List[T]], Generic[T]):
+    meta: Optional[ListMeta] = None
+
+
+def json_response(
+    data: Any,
+    status_code: int = 200,
+    message: Optional[str] = None,
+    meta: Optional[dict] = None,
+) -> ORJSONResponse:
+    return ORJSONResponse(
+        send_response(data, status_code=status_code, message=message, meta=meta),
+        status_code=status_code,
+    )
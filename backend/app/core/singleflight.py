@@ -0,0 +1,127 @@
+"""
+Request coalescing ("single-flight").
+
+When several threads ask for the same key at the same time, only the first
+one runs the computation; the others wait for it and share its result (or
+its exception). Nothing is cached: once the call finishes, the next caller
+starts a fresh one. AsyncSingleFlight does the same for coroutines running on
+one event loop.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Union
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> dict:
+        with self._lock:
+            calls = self.executions + self.coalesced
+            return {
+                "calls": calls,
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "inFlight": len(self._calls),
+            }
+
+
+class AsyncSingleFlight:
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        future = self._calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+            # shield: a cancelled waiter must not cancel the shared call
+            return await asyncio.shield(future)
+
+        self.executions += 1
+        future = self._calls[key] = asyncio.ensure_future(fn())
+
+        def forget(_):
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+        future.add_done_callback(forget)
+        return await asyncio.shield(future)
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.executions + self.coalesced,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "inFlight": len(self._calls),
+        }
+
+
+_groups: Dict[str, Union[SingleFlight, AsyncSingleFlight]] = {}
+
+
+def group(name: str) -> SingleFlight:
+    """
+    Named, process-wide SingleFlight, created on first use.
+    """
+    if name not in _groups:
+        _groups[name] = SingleFlight(name)
+    return _groups[name]
+
+
+def async_group(name: str) -> AsyncSingleFlight:
+    """
+    Named AsyncSingleFlight, reported in `stats()` as "<name>_async".
+    """
+    key = f"{name}_async"
+    if key not in _groups:
+        _groups[key] = AsyncSingleFlight(key)
+    return _groups[key]
+
+
+def stats() -> Dict[str, dict]:
+    return {name: g.stats() for name, g in _groups.items()}
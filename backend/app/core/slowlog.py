@@ -0,0 +1,240 @@
+"""
+Slow-query log.
+
+Every query command (find, aggregate, getMore, ...) that takes longer than
+SLOW_QUERY_MS is logged on the "app.slowlog" logger as one JSON object with
+the collection, command, duration, filter shape (values replaced by "?") and
+the route of the request that issued it.
+
+With SLOW_QUERY_EXPLAIN_SAMPLE > 0 that fraction of slow queries is also
+explained (queryPlanner, on a background thread, never inside the driver
+callback) and the record carries a summary of the winning plan.
+
+Each (collection, command, shape) is logged at most once per
+SLOW_QUERY_LOG_INTERVAL_SECONDS; the next record reports how many were
+suppressed in between, so one bad query can't flood the log.
+"""
+
+import contextvars
+import json
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from pymongo import monitoring
+
+from app.core.metrics import _route_template
+
+logger = logging.getLogger("app.slowlog")
+
+# <= 0 disables the log
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+SLOW_QUERY_EXPLAIN_SAMPLE = float(os.getenv("SLOW_QUERY_EXPLAIN_SAMPLE", "0"))
+SLOW_QUERY_LOG_INTERVAL_SECONDS = float(
+    os.getenv("SLOW_QUERY_LOG_INTERVAL_SECONDS", "60")
+)
+
+SLOW_QUERY_ENABLED = SLOW_QUERY_MS > 0
+
+QUERY_COMMANDS = {"find", "aggregate", "getMore", "count", "distinct"}
+
+# keys worth keeping from the started event, for the shape and for explain
+_EXPLAINABLE_KEYS = {
+    "find": ("filter", "sort", "projection", "skip", "limit", "hint"),
+    "aggregate": ("pipeline", "hint"),
+    "count": ("query",),
+    "distinct": ("key", "query"),
+}
+
+# ASGI scope of the request being served, set by RequestContextMiddleware
+current_scope: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar(
+    "current_scope", default=None
+)
+
+
+class RequestContextMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = current_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_scope.reset(token)
+
+
+def shape(value: Any) -> Any:
+    """
+    Query structure without its values: {"slug": "?", "_id": {"$in": ["?"]}}.
+    """
+    if isinstance(value, dict):
+        return {k: shape(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [shape(value[0])] if value else []
+    return "?"
+
+
+def _query_shape(command_name: str, command: dict) -> Optional[dict]:
+    keys = _EXPLAINABLE_KEYS.get(command_name)
+    if not keys:
+        return None
+    shaped = {k: shape(command[k]) for k in keys if k in command and k != "hint"}
+    if "pipeline" in command:
+        # every stage, not just the first one
+        shaped["pipeline"] = [shape(stage) for stage in command["pipeline"]]
+    return shaped
+
+
+def _plan_summary(explained: dict) -> str:
+    from app.core.indexes import summarize_plan
+
+    planner = explained.get("queryPlanner")
+    if planner is None:
+        # aggregate: the find part of the pipeline sits in the first stage
+        stages = explained.get("stages") or [{}]
+        planner = stages[0].get("$cursor", {}).get("queryPlanner", {})
+    return summarize_plan(planner.get("winningPlan", {}))
+
+
+class _Pending:
+    __slots__ = ("collection", "command_name", "database", "command", "scope")
+
+    def __init__(self, collection, command_name, database, command, scope):
+        self.collection = collection
+        self.command_name = command_name
+        self.database = database
+        self.command = command
+        self.scope = scope
+
+
+class SlowQueryLog(monitoring.CommandListener):
+    def __init__(
+        self,
+        threshold_ms: float,
+        explain_sample: float = 0.0,
+        interval_seconds: float = 60.0,
+        max_shapes: int = 1000,
+    ):
+        self.threshold_micros = threshold_ms * 1000
+        self.explain_sample = explain_sample
+        self.interval = interval_seconds
+        self.max_shapes = max_shapes
+        self._running: Dict[tuple, _Pending] = {}
+        self._lock = threading.Lock()
+        # shape key -> (last logged at, suppressed since)
+        self._last: Dict[str, Tuple[float, int]] = {}
+        self._explainer: Optional[ThreadPoolExecutor] = None
+
+    # -- listener ------------------------------------------------------
+    def started(self, event):
+        if event.command_name not in QUERY_COMMANDS:
+            return
+        if event.command_name == "getMore":
+            collection = event.command.get("collection")
+            command = {}
+        else:
+            collection = event.command.get(event.command_name)
+            keys = _EXPLAINABLE_KEYS.get(event.command_name, ())
+            command = {k: event.command[k] for k in keys if k in event.command}
+        self._running[(event.connection_id, event.request_id)] = _Pending(
+            collection if isinstance(collection, str) else "",
+            event.command_name,
+            event.database_name,
+            command,
+            current_scope.get(),
+        )
+
+    def succeeded(self, event):
+        self._finish(event)
+
+    def failed(self, event):
+        self._finish(event)
+
+    def _finish(self, event):
+        pending = self._running.pop((event.connection_id, event.request_id), None)
+        if pending is None or event.duration_micros < self.threshold_micros:
+            return
+
+        query_shape = _query_shape(pending.command_name, pending.command)
+        key = json.dumps(
+            [pending.collection, pending.command_name, query_shape], sort_keys=True
+        )
+        suppressed = self._admit(key)
+        if suppressed is None:
+            return
+
+        # resolved only now: most commands are fast and never need it
+        scope = pending.scope
+        route = f"{scope['method']} {_route_template(scope)}" if scope else None
+        record = {
+            "event": "slow_query",
+            "collection": pending.collection,
+            "command": pending.command_name,
+            "durationMs": round(event.duration_micros / 1000, 2),
+            "thresholdMs": self.threshold_micros / 1000,
+            "shape": query_shape,
+            "route": route,
+            "failed": isinstance(event, monitoring.CommandFailedEvent),
+            "suppressed": suppressed,
+        }
+        if pending.command and random.random() < self.explain_sample:
+            # never run a command from inside the driver callback
+            self._explain_pool().submit(self._explain_and_emit, pending, record)
+        else:
+            self._emit(record)
+
+    # -- rate limiting -------------------------------------------------
+    def _admit(self, key: str) -> Optional[int]:
+        """
+        None if `key` was logged within the interval (and count it as
+        suppressed), else the number suppressed since its last record.
+        """
+        now = time.monotonic()
+        with self._lock:
+            last_at, suppressed = self._last.get(key, (None, 0))
+            if last_at is not None and now - last_at < self.interval:
+                self._last[key] = (last_at, suppressed + 1)
+                return None
+            if key not in self._last and len(self._last) >= self.max_shapes:
+                self._last.clear()
+            self._last[key] = (now, 0)
+            return suppressed
+
+    # -- output --------------------------------------------------------
+    def _explain_pool(self) -> ThreadPoolExecutor:
+        if self._explainer is None:
+            self._explainer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="slowlog-explain"
+            )
+        return self._explainer
+
+    def _explain_and_emit(self, pending: _Pending, record: dict) -> None:
+        from app.core.db import get_client
+
+        command = {pending.command_name: pending.collection, **pending.command}
+        if pending.command_name == "aggregate":
+            command["cursor"] = {}
+        try:
+            explained = get_client()[pending.database].command(
+                "explain", command, verbosity="queryPlanner"
+            )
+            record["plan"] = _plan_summary(explained)
+        except Exception as exc:
+            record["plan"] = f"explain failed: {exc}"
+        self._emit(record)
+
+    def _emit(self, record: dict) -> None:
+        logger.warning(json.dumps(record, default=str))
+
+
+slow_query_log = SlowQueryLog(
+    SLOW_QUERY_MS, SLOW_QUERY_EXPLAIN_SAMPLE, SLOW_QUERY_LOG_INTERVAL_SECONDS
+)
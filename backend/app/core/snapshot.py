@@ -0,0 +1,672 @@
+"""
+In-memory read snapshot of the catalogue.
+
+With CATALOGUE_SNAPSHOT=true the API loads departments, faculties and
+publications once at startup and serves every read endpoint from memory;
+only search `mode=text` still goes to MongoDB, since it needs the text index
+scores. The structures are kept compact so the 1M-publication catalogue
+fits comfortably in one process:
+
+- the `_id`s of a collection are packed, sorted, 12 bytes each into one
+  bytes object; everywhere else a document is its position in that table;
+- references (authors, departments, publication lists) are CSR adjacency
+  arrays of positions (`array("I")`), not lists of ObjectIds;
+- repeated strings (kinds, positions, slugs) are interned and keywords are
+  ids into one vocabulary.
+
+A background thread polls the catalogue version marker every
+CATALOGUE_VERSION_POLL_SECONDS. When it changes, a new snapshot is built
+next to the serving one and swapped in with a single reference assignment,
+so requests never see a half-built catalogue (memory briefly holds both).
+
+References to documents that don't exist (e.g. an author id whose faculty
+was deleted) are dropped at build time, as the MongoDB joins drop them.
+"""
+
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from bson import ObjectId
+from pymongo.database import Database
+
+from app.core import catalogue
+from app.core.text import tokenize
+from app.modules.search.index import (
+    InvertedIndex,
+    faculty_tokens,
+    publication_tokens,
+)
+
+logger = logging.getLogger(__name__)
+
+CATALOGUE_SNAPSHOT = os.getenv("CATALOGUE_SNAPSHOT", "") == "true"
+
+DEPARTMENT_COLLECTION = "departments"
+FACULTY_COLLECTION = "faculties"
+PUBLICATION_COLLECTION = "publications"
+
+BATCH_SIZE = 5000
+
+# (page positions, total matches, whether the total hit count_cap)
+PositionPage = Tuple[List[int], int, bool]
+
+
+def _binary(value: Any) -> Optional[bytes]:
+    try:
+        return ObjectId(value).binary
+    except Exception:
+        return None
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class IdTable:
+    """
+    Sorted ObjectIds packed into one bytes object. Positions are the ids the
+    rest of the snapshot uses; bisect maps an ObjectId back to its position.
+    """
+
+    def __init__(self, binaries: List[bytes]):
+        self._blob = b"".join(binaries)
+
+    def __len__(self) -> int:
+        return len(self._blob) // 12
+
+    def __getitem__(self, pos: int) -> bytes:
+        start = pos * 12
+        return self._blob[start : start + 12]
+
+    def position(self, value: Any) -> Optional[int]:
+        """
+        Position of an ObjectId (or its hex string), None if absent/invalid.
+        """
+        binary = _binary(value)
+        if binary is None:
+            return None
+        pos = bisect_left(self, binary)
+        return pos if pos < len(self) and self[pos] == binary else None
+
+    def after(self, oid: ObjectId) -> int:
+        """
+        First position with an id greater than `oid`.
+        """
+        return bisect_right(self, oid.binary)
+
+    def hex(self, pos: int) -> str:
+        return self[pos].hex()
+
+    def object_id(self, pos: int) -> ObjectId:
+        return ObjectId(self[pos])
+
+
+class Adjacency:
+    """
+    CSR adjacency lists: the neighbours of node i are
+    targets[offsets[i]:offsets[i + 1]].
+    """
+
+    def __init__(self):
+        self.offsets = array("I", [0])
+        self.targets = array("I")
+
+    def append(self, neighbours: Iterable[int]) -> None:
+        self.targets.extend(neighbours)
+        self.offsets.append(len(self.targets))
+
+    def __getitem__(self, node: int) -> array:
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def inverted(self, size: int) -> "Adjacency":
+        """
+        Reverse edges: for each of `size` target nodes, its distinct sources
+        in ascending order.
+        """
+        sources: List[array] = [array("I") for _ in range(size)]
+        for node in range(len(self)):
+            for target in sorted(set(self[node])):
+                sources[target].append(node)
+        inverted = Adjacency()
+        for neighbours in sources:
+            inverted.append(neighbours)
+        return inverted
+
+
+def _resolve(values: Iterable[Any], positions: Dict[bytes, int]) -> List[int]:
+    """
+    Positions of the referenced documents in reference order, duplicates and
+    dangling references dropped.
+    """
+    resolved = []
+    seen = set()
+    for value in values or ():
+        pos = positions.get(_binary(value))
+        if pos is not None and pos not in seen:
+            seen.add(pos)
+            resolved.append(pos)
+    return resolved
+
+
+def _resolve_all(values: Iterable[Any], positions: Dict[bytes, int]) -> List[int]:
+    """
+    Like `_resolve` but keeps duplicates, for exporting stored arrays as-is.
+    """
+    resolved = []
+    for value in values or ():
+        pos = positions.get(_binary(value))
+        if pos is not None:
+            resolved.append(pos)
+    return resolved
+
+
+class Snapshot:
+    def __init__(self, version: int):
+        self.version = version
+        self.build_seconds = 0.0
+        self._footprint: Optional[int] = None
+
+        # departments: (name, slug, type, description, isComputerScienceRelated)
+        self.departments = IdTable([])
+        self.department_fields: List[tuple] = []
+        self.department_by_slug: Dict[str, int] = {}
+        self.department_faculties = Adjacency()
+
+        self.faculties = IdTable([])
+        self.faculty_names: List[Optional[str]] = []
+        self.faculty_positions: List[Optional[str]] = []
+        self.faculty_interests: List[Optional[str]] = []
+        self.faculty_departments = Adjacency()
+        self.faculty_articles = Adjacency()
+        self.faculty_conference_papers = Adjacency()
+        self.faculty_postings = InvertedIndex()
+
+        self.publications = IdTable([])
+        self.publication_titles: List[Optional[str]] = []
+        self.publication_kinds: List[Optional[str]] = []
+        self.publication_keywords = Adjacency()
+        self.publication_authors = Adjacency()
+        self.publication_postings = InvertedIndex()
+        self.keywords: List[str] = []
+
+    # -- build -------------------------------------------------------------
+    @classmethod
+    def build(cls, db: Database, version: int) -> "Snapshot":
+        start = time.perf_counter()
+        snap = cls(version)
+        departments = snap._load_departments(db)
+        faculties = snap._load_faculty_ids(db)
+        publications = snap._load_publications(db, faculties)
+        snap._load_faculties(db, departments, publications)
+        snap.department_faculties = snap.faculty_departments.inverted(
+            len(snap.departments)
+        )
+        snap.publication_postings.sort_terms()
+        snap.faculty_postings.sort_terms()
+        snap.build_seconds = time.perf_counter() - start
+        return snap
+
+    def _load_departments(self, db: Database) -> Dict[bytes, int]:
+        docs = list(db[DEPARTMENT_COLLECTION].find({}).sort("_id", 1))
+        self.departments = IdTable([d["_id"].binary for d in docs])
+        for pos, d in enumerate(docs):
+            cs_related = d.get("isComputerScienceRelated")
+            slug = _intern(d.get("slug"))
+            self.department_fields.append(
+                (
+                    d.get("name"),
+                    slug,
+                    _intern(d.get("type")),
+                    d.get("description"),
+                    cs_related,
+                )
+            )
+            if cs_related is True:
+                # find_one returns the first match in natural order
+                self.department_by_slug.setdefault(slug, pos)
+        return {d["_id"].binary: pos for pos, d in enumerate(docs)}
+
+    def _load_faculty_ids(self, db: Database) -> Dict[bytes, int]:
+        cursor = (
+            db[FACULTY_COLLECTION]
+            .find({}, {"_id": 1})
+            .sort("_id", 1)
+            .batch_size(BATCH_SIZE)
+        )
+        binaries = [d["_id"].binary for d in cursor]
+        self.faculties = IdTable(binaries)
+        return {b: pos for pos, b in enumerate(binaries)}
+
+    def _load_publications(
+        self, db: Database, faculties: Dict[bytes, int]
+    ) -> Dict[bytes, int]:
+        cursor = (
+            db[PUBLICATION_COLLECTION]
+            .find({}, {"title": 1, "kind": 1, "keywords": 1, "authors": 1})
+            .sort("_id", 1)
+            .batch_size(BATCH_SIZE)
+        )
+        binaries = []
+        vocabulary: Dict[str, int] = {}
+        for pos, doc in enumerate(cursor):
+            binaries.append(doc["_id"].binary)
+            self.publication_titles.append(doc.get("title"))
+            self.publication_kinds.append(_intern(doc.get("kind")))
+            keyword_ids = []
+            for keyword in doc.get("keywords") or ():
+                kid = vocabulary.get(keyword)
+                if kid is None:
+                    kid = vocabulary[keyword] = len(self.keywords)
+                    self.keywords.append(sys.intern(keyword))
+                keyword_ids.append(kid)
+            self.publication_keywords.append(keyword_ids)
+            self.publication_authors.append(_resolve(doc.get("authors"), faculties))
+            self.publication_postings.add_postings(pos, publication_tokens(doc))
+        self.publications = IdTable(binaries)
+        return {b: pos for pos, b in enumerate(binaries)}
+
+    def _load_faculties(
+        self,
+        db: Database,
+        departments: Dict[bytes, int],
+        publications: Dict[bytes, int],
+    ) -> None:
+        projection = {
+            "name": 1,
+            "position": 1,
+            "researchInterest": 1,
+            "departmentIds": 1,
+            "articleIds": 1,
+            "conferencePaperIds": 1,
+        }
+        cursor = (
+            db[FACULTY_COLLECTION]
+            .find({}, projection)
+            .sort("_id", 1)
+            .batch_size(BATCH_SIZE)
+        )
+        count = 0
+        for pos, doc in enumerate(cursor):
+            if pos >= len(self.faculties) or doc["_id"].binary != self.faculties[pos]:
+                raise RuntimeError("faculties changed while the snapshot was built")
+            self.faculty_names.append(doc.get("name"))
+            self.faculty_positions.append(_intern(doc.get("position")))
+            self.faculty_interests.append(doc.get("researchInterest"))
+            self.faculty_departments.append(
+                _resolve_all(doc.get("departmentIds"), departments)
+            )
+            self.faculty_articles.append(
+                _resolve_all(doc.get("articleIds"), publications)
+            )
+            self.faculty_conference_papers.append(
+                _resolve_all(doc.get("conferencePaperIds"), publications)
+            )
+            self.faculty_postings.add_postings(pos, faculty_tokens(doc))
+            count += 1
+        if count != len(self.faculties):
+            raise RuntimeError("faculties changed while the snapshot was built")
+
+    # -- serialisation (same shapes as the MongoDB services) --------------
+    def _department_summary(self, d: int) -> dict:
+        name, slug = self.department_fields[d][:2]
+        return {"_id": self.departments.hex(d), "name": name, "slug": slug}
+
+    def _faculty_summary(self, f: int) -> dict:
+        return {
+            "_id": self.faculties.hex(f),
+            "name": self.faculty_names[f],
+            "position": self.faculty_positions[f],
+        }
+
+    def _faculty_search_item(self, f: int) -> dict:
+        return {
+            **self._faculty_summary(f),
+            "researchInterest": self.faculty_interests[f],
+        }
+
+    def _publication_summary(self, p: int) -> dict:
+        return {
+            "_id": self.publications.hex(p),
+            "title": self.publication_titles[p],
+            "kind": self.publication_kinds[p],
+            "keywords": [self.keywords[k] for k in self.publication_keywords[p]],
+        }
+
+    def _publication(self, p: int) -> dict:
+        return {
+            **self._publication_summary(p),
+            "authors": [self._faculty_summary(f) for f in self.publication_authors[p]],
+        }
+
+    # -- departments -------------------------------------------------------
+    def all_departments(self) -> List[dict]:
+        return [
+            self._department_summary(d)
+            for d, fields in enumerate(self.department_fields)
+            if fields[4] is True
+        ]
+
+    def department_detail(self, slug: str) -> Optional[dict]:
+        d = self.department_by_slug.get(slug)
+        if d is None:
+            return None
+        name, slug, kind, description, cs_related = self.department_fields[d]
+        return {
+            "_id": self.departments.hex(d),
+            "name": name,
+            "slug": slug,
+            "type": kind,
+            "description": description,
+            "isComputerScienceRelated": cs_related,
+            "faculties": [
+                self._faculty_summary(f) for f in self.department_faculties[d]
+            ],
+        }
+
+    # -- faculties ---------------------------------------------------------
+    def faculty_profile(self, faculty_id: str) -> Optional[dict]:
+        f = self.faculties.position(faculty_id)
+        if f is None:
+            return None
+        publications = sorted(
+            set(self.faculty_articles[f]) | set(self.faculty_conference_papers[f])
+        )
+        return {
+            "_id": self.faculties.hex(f),
+            "name": self.faculty_names[f],
+            "position": self.faculty_positions[f],
+            "researchInterest": self.faculty_interests[f],
+            "departments": [
+                self._department_summary(d)
+                for d in sorted(set(self.faculty_departments[f]))
+            ],
+            "articles": [
+                self._publication_summary(p)
+                for p in publications
+                if self.publication_kinds[p] == "article"
+            ],
+            "conferencePapers": [
+                self._publication_summary(p)
+                for p in publications
+                if self.publication_kinds[p] == "conference"
+            ],
+        }
+
+    def iter_faculties(self) -> Iterator[dict]:
+        for f in range(len(self.faculties)):
+            yield {
+                "_id": self.faculties.hex(f),
+                "name": self.faculty_names[f],
+                "position": self.faculty_positions[f],
+                "researchInterest": self.faculty_interests[f],
+                "departmentIds": [
+                    self.departments.hex(d) for d in self.faculty_departments[f]
+                ],
+                "articleIds": [
+                    self.publications.hex(p) for p in self.faculty_articles[f]
+                ],
+                "conferencePaperIds": [
+                    self.publications.hex(p) for p in self.faculty_conference_papers[f]
+                ],
+            }
+
+    # -- publications ------------------------------------------------------
+    def publications_page(
+        self, limit: int, after: Optional[ObjectId]
+    ) -> Tuple[List[dict], Optional[ObjectId]]:
+        start = self.publications.after(after) if after is not None else 0
+        stop = min(start + limit, len(self.publications))
+        page = [self._publication(p) for p in range(start, stop)]
+        next_after = None
+        if stop < len(self.publications) and stop > start:
+            next_after = self.publications.object_id(stop - 1)
+        return page, next_after
+
+    def count_publications(self) -> int:
+        return len(self.publications)
+
+    def iter_publications(self) -> Iterator[dict]:
+        for p in range(len(self.publications)):
+            yield self._publication(p)
+
+    def publication(self, pub_id: str) -> Optional[dict]:
+        p = self.publications.position(pub_id)
+        return self._publication(p) if p is not None else None
+
+    # -- search ------------------------------------------------------------
+    def _search(
+        self,
+        postings: InvertedIndex,
+        size: int,
+        fields: Callable[[int], Iterable[Optional[str]]],
+        q: str,
+        limit: int,
+        offset: int,
+        mode: str,
+        op: str,
+        count_cap: Optional[int],
+    ) -> Optional[PositionPage]:
+        """
+        The search services' `_search_page` over the snapshot. None when the
+        query has to go to MongoDB: text mode, or a pattern Python's `re`
+        rejects (MongoDB reports the error).
+        """
+        if mode == "text":
+            return None
+        if mode == "index":
+            tokens = tokenize(q)
+            if tokens:
+                matches = postings.positions(tokens, op)
+                return matches[offset : offset + limit], len(matches), False
+
+        try:
+            search = re.compile(f".*{q}.*", re.IGNORECASE).search
+        except re.error:
+            return None
+        page: List[int] = []
+        counted = 0
+        for pos in range(size):
+            if not any(value and search(value) for value in fields(pos)):
+                continue
+            if offset <= counted < offset + limit:
+                page.append(pos)
+            counted += 1
+            # the page is never capped, only the count ($facet semantics)
+            if count_cap and counted >= max(count_cap, offset + limit):
+                break
+        total = min(counted, count_cap) if count_cap else counted
+        return page, total, bool(count_cap) and total >= count_cap
+
+    def search_publications(
+        self,
+        q: str,
+        limit: int,
+        offset: int,
+        mode: str,
+        op: str,
+        count_cap: Optional[int],
+    ) -> Optional[Tuple[List[dict], int, bool]]:
+        def fields(p: int) -> Iterable[Optional[str]]:
+            yield self.publication_titles[p]
+            for k in self.publication_keywords[p]:
+                yield self.keywords[k]
+
+        result = self._search(
+            self.publication_postings,
+            len(self.publications),
+            fields,
+            q,
+            limit,
+            offset,
+            mode,
+            op,
+            count_cap,
+        )
+        if result is None:
+            return None
+        page, total, capped = result
+        return [self._publication(p) for p in page], total, capped
+
+    def search_faculties(
+        self,
+        q: str,
+        limit: int,
+        offset: int,
+        mode: str,
+        op: str,
+        count_cap: Optional[int],
+    ) -> Optional[Tuple[List[dict], int, bool]]:
+        result = self._search(
+            self.faculty_postings,
+            len(self.faculties),
+            lambda f: (self.faculty_names[f], self.faculty_interests[f]),
+            q,
+            limit,
+            offset,
+            mode,
+            op,
+            count_cap,
+        )
+        if result is None:
+            return None
+        page, total, capped = result
+        return [self._faculty_search_item(f) for f in page], total, capped
+
+    # -- footprint ---------------------------------------------------------
+    def footprint(self) -> int:
+        """
+        Approximate bytes held by the snapshot (shared objects, e.g. interned
+        strings, counted once). Computed on first call, then cached.
+        """
+        if self._footprint is None:
+            self._footprint = _deep_size(
+                [v for k, v in vars(self).items() if k != "_footprint"]
+            )
+        return self._footprint
+
+    def stats(self) -> dict:
+        return {
+            "version": self.version,
+            "departments": len(self.departments),
+            "faculties": len(self.faculties),
+            "publications": len(self.publications),
+            "keywords": len(self.keywords),
+            "buildSeconds": round(self.build_seconds, 3),
+            "approxBytes": self.footprint(),
+        }
+
+
+def _deep_size(root: Any) -> int:
+    seen = set()
+    total = 0
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+            stack.extend(vars(obj).values())
+    return total
+
+
+class SnapshotHolder:
+    """
+    The serving snapshot plus the background thread that replaces it when
+    the catalogue version changes.
+    """
+
+    def __init__(self, poll_seconds: float):
+        self._poll_seconds = poll_seconds
+        self._snapshot: Optional[Snapshot] = None
+        self._build_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.reloads = 0
+        self.failures = 0
+
+    @property
+    def current(self) -> Optional[Snapshot]:
+        return self._snapshot
+
+    def load(self, db: Database) -> Snapshot:
+        """
+        Build a snapshot if there is none or the version marker moved on,
+        then swap it in. Returns the serving snapshot.
+        """
+        with self._build_lock:
+            # read before building: an import that finishes mid-build bumps
+            # the marker again and triggers the next reload
+            version = catalogue.get_catalogue_version(db)
+            snap = self._snapshot
+            if snap is None or snap.version != version:
+                snap = Snapshot.build(db, version)
+                self._snapshot = snap
+                logger.info(
+                    "Catalogue snapshot v%s: %d publications, %d faculties in %.2fs",
+                    version,
+                    len(snap.publications),
+                    len(snap.faculties),
+                    snap.build_seconds,
+                )
+            return snap
+
+    def start(self, db: Database) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(db,), name="catalogue-snapshot", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self, db: Database) -> None:
+        while not self._stop.wait(self._poll_seconds):
+            previous = self._snapshot
+            try:
+                if self.load(db) is not previous:
+                    self.reloads += 1
+                    # caches filled from the old snapshot must go too
+                    catalogue.watcher.notify()
+            except Exception as exc:
+                self.failures += 1
+                logger.warning("Catalogue snapshot reload failed: %s", exc)
+
+    def stats(self) -> dict:
+        snap = self._snapshot
+        return {
+            "loaded": snap is not None,
+            "reloads": self.reloads,
+            "failures": self.failures,
+            **(snap.stats() if snap is not None else {}),
+        }
+
+
+holder = SnapshotHolder(catalogue.CATALOGUE_VERSION_POLL_SECONDS)
+
+
+def current() -> Optional[Snapshot]:
+    """
+    The snapshot to serve reads from, or None to query MongoDB.
+    """
+    return holder.current if CATALOGUE_SNAPSHOT else None
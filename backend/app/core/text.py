@@ -0,0 +1,178 @@
+"""
+Text normalisation shared by ingestion (scripts/import_excel.py: stored
+`keywords`, department slugs and heuristics) and search (index and query
+tokens), so both sides always agree on what a token is.
+
+Optional keyword features, read from the environment on both sides; change
+them together and re-import:
+
+- KEYWORD_STEMMING=true: light plural stemming ("networks" -> "network")
+- KEYWORD_BIGRAMS=true: adjacent keyword pairs ("neural network") as extra
+  tokens, so an `and` query for two words also requires them side by side
+"""
+
+import functools
+import os
+import re
+import string
+from typing import Callable, Iterable, List, Optional
+
+KEYWORD_STEMMING = os.getenv("KEYWORD_STEMMING", "") == "true"
+KEYWORD_BIGRAMS = os.getenv("KEYWORD_BIGRAMS", "") == "true"
+
+STOP_WORDS = frozenset(
+    {
+        "a",
+        "an",
+        "the",
+        "in",
+        "on",
+        "of",
+        "for",
+        "and",
+        "or",
+        "to",
+        "with",
+        "by",
+        "from",
+        "at",
+        "as",
+        "into",
+        "about",
+        "over",
+        "under",
+        "between",
+        "through",
+        "without",
+        "within",
+        "across",
+        "is",
+        "are",
+        "be",
+        "this",
+        "that",
+        "these",
+        "those",
+        "overview",
+    }
+)
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+# byte table for ASCII text: letters lowercased, digits kept, every other
+# byte a space
+_ALNUM = string.ascii_lowercase + string.digits
+_ASCII_TABLE = bytes(
+    ord(c.lower()) if c.lower() in _ALNUM else 32 for c in map(chr, range(256))
+)
+
+
+# tokenize drops these: stop words plus every token of one or two characters,
+# so one set lookup per word does both filters
+_DROP = (
+    STOP_WORDS | frozenset(_ALNUM) | frozenset(a + b for a in _ALNUM for b in _ALNUM)
+)
+
+
+def normalise(text: str) -> str:
+    """
+    Lowercase and replace every character outside [a-z0-9] with a space.
+    ASCII text (nearly every title) is lowercased and cleaned in one
+    bytes.translate pass; anything else goes through the equivalent regex.
+    """
+    if text.isascii():
+        return text.encode().translate(_ASCII_TABLE).decode()
+    return _NON_ALNUM.sub(" ", text.lower())
+
+
+def light_stem(token: str) -> str:
+    """
+    Harman's S-stemmer: strips plural endings only, so it never merges
+    unrelated words the way a full stemmer can.
+    """
+    if len(token) > 3:
+        if token.endswith("ies") and not token.endswith(("eies", "aies")):
+            return token[:-3] + "y"
+        if token.endswith("es") and not token.endswith(("aes", "ees", "oes")):
+            return token[:-1]
+        if token.endswith("s") and not token.endswith(("us", "ss")):
+            return token[:-1]
+    return token
+
+
+def tokenize(
+    text: str, stem: Optional[bool] = None, bigrams: Optional[bool] = None
+) -> List[str]:
+    """
+    Lowercase, split on non-alphanumerics, drop stop words and tokens of two
+    characters or fewer, dedupe preserving order. stem and bigrams default
+    to KEYWORD_STEMMING and KEYWORD_BIGRAMS; bigrams follow the unigrams and
+    only join words that were adjacent in the text.
+
+    The default path costs about half of the old per-regex version per
+    title (benchmarks/bench_text.py); most of what is left is the split
+    and dedupe themselves.
+    """
+    stem = KEYWORD_STEMMING if stem is None else stem
+    bigrams = KEYWORD_BIGRAMS if bigrams is None else bigrams
+    words = normalise(text).split()
+    if not (stem or bigrams):
+        # dedupe first: fewer words left to filter
+        return [t for t in dict.fromkeys(words) if t not in _DROP]
+
+    kept = [
+        (i, light_stem(t) if stem else t) for i, t in enumerate(words) if t not in _DROP
+    ]
+    tokens = [t for _, t in kept]
+    if bigrams:
+        tokens.extend(
+            f"{a} {b}" for (i, a), (j, b) in zip(kept, kept[1:]) if j == i + 1
+        )
+    return list(dict.fromkeys(tokens))
+
+
+def slugify(value: str) -> str:
+    """
+    Lowercase, "&" -> "and", runs of anything else but [a-z0-9] -> "-".
+    """
+    return "-".join(normalise(value.strip().replace("&", "and")).split())
+
+
+MAX_CODE_POINT = chr(0x10FFFF)
+
+
+def prefix_end(prefix: str) -> Optional[str]:
+    """
+    The smallest string greater than every string starting with `prefix`,
+    or None when there is none (a prefix of only U+10FFFF): with bisect,
+    the range of a sorted list that starts with `prefix`.
+    """
+    stem = prefix.rstrip(MAX_CODE_POINT)
+    if not stem:
+        return None
+    return stem[:-1] + chr(ord(stem[-1]) + 1)
+
+
+def phrase_matcher(phrases: Iterable[str]) -> Callable[[str], bool]:
+    """
+    A case-insensitive "contains any of these phrases" test. Phrases that
+    contain another phrase can never decide a match and are dropped. On a
+    new text it costs about what a substring scan over the phrases does (an
+    alternation regex was slower for a short list); the speed-up comes from
+    memoising per text, since the same affiliation strings come up on
+    thousands of rows.
+    """
+    lowered = {p.lower() for p in phrases}
+    needed = tuple(
+        p for p in sorted(lowered) if not any(q != p and q in p for q in lowered)
+    )
+
+    @functools.lru_cache(maxsize=4096)
+    def matches(text: str) -> bool:
+        lower = text.lower()
+        for phrase in needed:
+            if phrase in lower:
+                return True
+        return False
+
+    return matches
@@ -1,4 +1,8 @@
-from typing import Any, Optional
+import base64
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Optional
+
+import orjson
+from bson import ObjectId
 
 
 def send_response(
@@ -18,3 +22,52 @@ def send_response(
         "meta": meta,
         "data": data,
     }
+
+
+def encode_cursor(oid: ObjectId) -> str:
+    """
+    Opaque, URL-safe pagination cursor for a keyset position on `_id`.
+    """
+    return base64.urlsafe_b64encode(oid.binary).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Optional[ObjectId]:
+    """
+    Inverse of `encode_cursor`; returns None for anything that is not a cursor.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii"))
+        return ObjectId(raw)
+    except Exception:
+        return None
+
+
+def ndjson_stream(records: Iterable[dict], lines_per_chunk: int = 500) -> Iterator[bytes]:
+    """
+    Encode records as newline-delimited JSON, yielding a few hundred lines per
+    chunk so a StreamingResponse never holds more than one chunk in memory.
+    """
+    buffer = []
+    for record in records:
+        buffer.append(orjson.dumps(record, default=str))
+        if len(buffer) >= lines_per_chunk:
+            yield b"\n".join(buffer) + b"\n"
+            buffer = []
+    if buffer:
+        yield b"\n".join(buffer) + b"\n"
+
+
+async def ndjson_stream_async(
+    records: AsyncIterable[dict], lines_per_chunk: int = 500
+) -> AsyncIterator[bytes]:
+    """
+    `ndjson_stream` for records produced by an async generator.
+    """
+    buffer = []
+    async for record in records:
+        buffer.append(orjson.dumps(record, default=str))
+        if len(buffer) >= lines_per_chunk:
+            yield b"\n".join(buffer) + b"\n"
+            buffer = []
+    if buffer:
+        yield b"\n".join(buffer) + b"\n"
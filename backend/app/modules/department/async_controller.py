@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends, HTTPException
+from pymongo.asynchronous.database import AsyncDatabase
+
+from app.core.responses import ListEnvelope, json_response
+from . import async_service as service, schemas
+from app.core.db import get_async_db
+
+router = APIRouter()
+
+
+@router.get("/", response_model=ListEnvelope[schemas.DepartmentListItem])
+async def list_departments(db: AsyncDatabase = Depends(get_async_db)):
+    depts = await service.get_all_departments(db)
+    return json_response(
+        depts,
+        status_code=200,
+        message="Departments retrieved successfully",
+        meta={"total": len(depts)},
+    )
+
+
+@router.get("/{slug}", response_model=schemas.DepartmentDetailEnvelope)
+async def get_department(slug: str, db: AsyncDatabase = Depends(get_async_db)):
+    """
+    GET /api/v1/departments/{slug}
+    Returns a department with all its faculties
+    """
+    dept = await service.get_department_detail(db, slug)
+    if not dept:
+        raise HTTPException(status_code=404, detail="Department not found")
+
+    faculties = dept["faculties"]
+
+    return json_response(
+        {
+            "_id": dept["_id"],
+            "name": dept["name"],
+            "slug": dept["slug"],
+            "type": dept.get("type"),
+            "description": dept.get("description"),
+            "isComputerScienceRelated": dept.get("isComputerScienceRelated", True),
+            "faculties": faculties,
+        },
+        status_code=200,
+        message=f"Faculties for department '{dept['name']}' retrieved successfully",
+        meta={"total": len(faculties)},
+    )
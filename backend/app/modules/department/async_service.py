@@ -0,0 +1,76 @@
+from typing import List, Optional
+from pymongo.asynchronous.database import AsyncDatabase
+from bson import ObjectId
+
+from app.core import singleflight, snapshot
+from .service import DEPARTMENT_COLLECTION, FACULTY_COLLECTION
+
+detail_flight = singleflight.async_group("department_detail")
+
+
+async def get_all_departments(db: AsyncDatabase) -> List[dict]:
+    snap = snapshot.current()
+    if snap is not None:
+        return snap.all_departments()
+    cursor = db[DEPARTMENT_COLLECTION].find(
+        {"isComputerScienceRelated": True},
+        {"name": 1, "slug": 1},
+    )
+    return [
+        {"_id": str(d["_id"]), "name": d["name"], "slug": d["slug"]}
+        async for d in cursor
+    ]
+
+
+async def get_department_by_slug(db: AsyncDatabase, slug: str) -> Optional[dict]:
+    doc = await db[DEPARTMENT_COLLECTION].find_one(
+        {
+            "slug": slug,
+            "isComputerScienceRelated": True,
+        }
+    )
+    if not doc:
+        return None
+
+    return {
+        "_id": str(doc["_id"]),
+        "name": doc.get("name"),
+        "slug": doc.get("slug"),
+        "type": doc.get("type"),
+        "description": doc.get("description"),
+        "isComputerScienceRelated": doc.get("isComputerScienceRelated"),
+    }
+
+
+async def get_faculties_for_department(db: AsyncDatabase, dept_id: str) -> List[dict]:
+    try:
+        oid = ObjectId(dept_id)
+    except Exception:
+        return []
+
+    cursor = db[FACULTY_COLLECTION].find(
+        {"departmentIds": {"$in": [oid]}}, {"name": 1, "position": 1}
+    )
+    return [
+        {"_id": str(f["_id"]), "name": f.get("name"), "position": f.get("position")}
+        async for f in cursor
+    ]
+
+
+async def get_department_detail(db: AsyncDatabase, slug: str) -> Optional[dict]:
+    """
+    Department with all its faculties, or None if the slug is unknown.
+    Identical concurrent requests share one execution.
+    """
+    snap = snapshot.current()
+    if snap is not None:
+        return snap.department_detail(slug)
+    return await detail_flight.do(slug, lambda: _fetch_department_detail(db, slug))
+
+
+async def _fetch_department_detail(db: AsyncDatabase, slug: str) -> Optional[dict]:
+    dept = await get_department_by_slug(db, slug)
+    if not dept:
+        return None
+    faculties = await get_faculties_for_department(db, dept["_id"])
+    return {**dept, "faculties": faculties}
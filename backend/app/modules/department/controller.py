@@ -1,18 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException
 from pymongo.database import Database
-from typing import Dict, Any
 
-from app.core.utils import send_response
-from . import service
+from app.core.responses import ListEnvelope, json_response
+from . import service, schemas
 from app.core.db import get_db
 
 router = APIRouter()
 
 
-@router.get("/", response_model=dict)
+@router.get("/", response_model=ListEnvelope[schemas.DepartmentListItem])
 def list_departments(db: Database = Depends(get_db)):
     depts = service.get_all_departments(db)
-    return send_response(
+    return json_response(
         depts,
         status_code=200,
         message="Departments retrieved successfully",
@@ -20,20 +19,20 @@ def list_departments(db: Database = Depends(get_db)):
     )
 
 
-@router.get("/{slug}", response_model=dict)
-def get_department(slug: str, db: Database = Depends(get_db)) -> Dict[str, Any]:
+@router.get("/{slug}", response_model=schemas.DepartmentDetailEnvelope)
+def get_department(slug: str, db: Database = Depends(get_db)):
     """
     GET /api/v1/departments/{slug}
     Returns a department with all its faculties
     """
-    dept = service.get_department_by_slug(db, slug)
+    # department + its faculties
+    dept = service.get_department_detail(db, slug)
     if not dept:
         raise HTTPException(status_code=404, detail="Department not found")
 
-    # fetch faculties in this department
-    faculties = service.get_faculties_for_department(db, dept["_id"])
+    faculties = dept["faculties"]
 
-    return send_response(
+    return json_response(
         {
             "_id": dept["_id"],
             "name": dept["name"],
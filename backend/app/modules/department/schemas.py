@@ -1,17 +1,37 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional
+
+from app.core.responses import Envelope, ListMeta
 
 
 class DepartmentListItem(BaseModel):
-    _id: str
+    # pydantic treats a leading underscore as private, so `_id` is an alias
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str = Field(alias="_id")
     name: str
     slug: str
 
 
+class DepartmentFaculty(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str = Field(alias="_id")
+    name: Optional[str] = None
+    position: Optional[str] = None
+
+
 class DepartmentDetail(BaseModel):
-    _id: str
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str = Field(alias="_id")
     name: str
     slug: str
-    type: Optional[str]
-    description: Optional[str]
-    isComputerScienceRelated: Optional[bool]
+    type: Optional[str] = None
+    description: Optional[str] = None
+    isComputerScienceRelated: Optional[bool] = None
+    faculties: List[DepartmentFaculty] = Field(default_factory=list)
+
+
+class DepartmentDetailEnvelope(Envelope[DepartmentDetail]):
+    meta: ListMeta
@@ -2,11 +2,18 @@ from typing import List, Optional
 from pymongo.database import Database
 from bson import ObjectId
 
+from app.core import singleflight, snapshot
+
 DEPARTMENT_COLLECTION = "departments"
 FACULTY_COLLECTION = "faculties"
 
+detail_flight = singleflight.group("department_detail")
+
 
 def get_all_departments(db: Database) -> List[dict]:
+    snap = snapshot.current()
+    if snap is not None:
+        return snap.all_departments()
     cursor = db[DEPARTMENT_COLLECTION].find(
         {"isComputerScienceRelated": True},
         {"name": 1, "slug": 1},
@@ -55,3 +62,21 @@ def get_faculties_for_department(db: Database, dept_id: str) -> List[dict]:
             {"_id": str(f["_id"]), "name": f.get("name"), "position": f.get("position")}
         )
     return faculties
+
+
+def get_department_detail(db: Database, slug: str) -> Optional[dict]:
+    """
+    Department with all its faculties, or None if the slug is unknown.
+    Identical concurrent requests share one execution.
+    """
+    snap = snapshot.current()
+    if snap is not None:
+        return snap.department_detail(slug)
+    return detail_flight.do(slug, lambda: _fetch_department_detail(db, slug))
+
+
+def _fetch_department_detail(db: Database, slug: str) -> Optional[dict]:
+    dept = get_department_by_slug(db, slug)
+    if not dept:
+        return None
+    return {**dept, "faculties": get_faculties_for_department(db, dept["_id"])}
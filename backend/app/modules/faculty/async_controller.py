@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pymongo.asynchronous.database import AsyncDatabase
+from app.core.responses import Envelope, json_response
+from app.core.utils import ndjson_stream_async
+from app.modules.faculty import async_service as service, schemas
+from app.core.db import get_async_db
+
+router = APIRouter()
+
+
+@router.get("/export")
+async def export_faculties(
+    fmt: str = Query("ndjson", alias="format", pattern="^ndjson$"),
+    db: AsyncDatabase = Depends(get_async_db),
+):
+    """
+    GET /api/v1/faculties/export?format=ndjson
+    Streams the whole collection, one JSON faculty per line
+    """
+    return StreamingResponse(
+        ndjson_stream_async(service.iter_faculties(db)),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get("/{faculty_id}", response_model=Envelope[schemas.FacultyDetail])
+async def get_faculty(faculty_id: str, db: AsyncDatabase = Depends(get_async_db)):
+    faculty = await service.get_faculty_profile(db, faculty_id)
+    if not faculty:
+        raise HTTPException(status_code=404, detail="Faculty not found")
+
+    return json_response(
+        faculty, status_code=200, message="Faculty retrieved successfully"
+    )
@@ -0,0 +1,49 @@
+from typing import AsyncIterator, Optional
+from pymongo.asynchronous.database import AsyncDatabase
+from bson import ObjectId
+
+from app.core import snapshot
+
+from .service import (
+    EXPORT_BATCH_SIZE,
+    EXPORT_PROJECTION,
+    FACULTY_COLLECTION,
+    _profile_pipeline,
+    _serialize_export,
+    _serialize_profile,
+)
+
+
+async def get_faculty_profile(db: AsyncDatabase, faculty_id: str) -> Optional[dict]:
+    """
+    Faculty with its departments and publications in one aggregation, see
+    `service.get_faculty_profile`.
+    """
+    snap = snapshot.current()
+    if snap is not None:
+        return snap.faculty_profile(faculty_id)
+
+    try:
+        oid = ObjectId(faculty_id)
+    except Exception:
+        return None
+
+    cursor = await db[FACULTY_COLLECTION].aggregate(_profile_pipeline(oid))
+    docs = await cursor.to_list(length=1)
+    if not docs:
+        return None
+    return _serialize_profile(docs[0])
+
+
+async def iter_faculties(
+    db: AsyncDatabase, batch_size: int = EXPORT_BATCH_SIZE
+) -> AsyncIterator[dict]:
+    snap = snapshot.current()
+    if snap is not None:
+        for doc in snap.iter_faculties():
+            yield doc
+        return
+
+    cursor = db[FACULTY_COLLECTION].find({}, EXPORT_PROJECTION).batch_size(batch_size)
+    async for doc in cursor:
+        yield _serialize_export(doc)
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pymongo.database import Database
-from app.core.utils import send_response
+from app.core.responses import Envelope, json_response
+from app.core.utils import ndjson_stream
 from app.modules.faculty import service, schemas
 from app.core.db import get_db
 
@@ -9,38 +10,27 @@ from app.core.db import get_db
 router = APIRouter()
 
 
-@router.get("/{faculty_id}", response_model=dict)
+@router.get("/export")
+def export_faculties(
+    fmt: str = Query("ndjson", alias="format", pattern="^ndjson$"),
+    db: Database = Depends(get_db),
+):
+    """
+    GET /api/v1/faculties/export?format=ndjson
+    Streams the whole collection, one JSON faculty per line
+    """
+    return StreamingResponse(
+        ndjson_stream(service.iter_faculties(db)),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get("/{faculty_id}", response_model=Envelope[schemas.FacultyDetail])
 def get_faculty(faculty_id: str, db: Database = Depends(get_db)):
-    faculty = service.get_faculty_by_id(db, faculty_id)
+    faculty = service.get_faculty_profile(db, faculty_id)
     if not faculty:
         raise HTTPException(status_code=404, detail="Faculty not found")
 
-    departments = []
-    if faculty.get("departmentIds"):
-        departments = service.get_departments_by_ids(db, faculty["departmentIds"])
-
-    publications = []
-    if faculty.get("articleIds") or faculty.get("conferencePaperIds"):
-        ids = []
-        if faculty.get("articleIds"):
-            ids.extend(faculty["articleIds"])
-        if faculty.get("conferencePaperIds"):
-            ids.extend(faculty["conferencePaperIds"])
-        publications = service.get_publications_by_ids(db, ids)
-
-    articles = [p for p in publications if p.get("kind") == "article"]
-    conferences = [p for p in publications if p.get("kind") == "conference"]
-
-    result = {
-        "_id": faculty["_id"],
-        "name": faculty.get("name"),
-        "position": faculty.get("position"),
-        "researchInterest": faculty.get("researchInterest"),
-        "departments": departments,
-        "articles": articles,
-        "conferencePapers": conferences,
-    }
-
-    return send_response(
-        result, status_code=200, message="Faculty retrieved successfully"
+    return json_response(
+        faculty, status_code=200, message="Faculty retrieved successfully"
     )
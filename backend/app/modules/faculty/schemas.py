@@ -1,18 +1,38 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 
+from app.modules.department.schemas import DepartmentListItem
+
 
 class FacultyListItem(BaseModel):
-    _id: str
+    # pydantic treats a leading underscore as private, so `_id` is an alias
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str = Field(alias="_id")
     name: str
-    position: Optional[str]
+    position: Optional[str] = None
+
+
+class FacultyPublication(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str = Field(alias="_id")
+    title: Optional[str] = None
+    kind: Optional[str] = None
+    keywords: List[str] = Field(default_factory=list)
 
 
 class FacultyDetail(BaseModel):
-    _id: str
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str = Field(alias="_id")
     name: str
-    position: Optional[str]
-    researchInterest: Optional[str]
-    departments: List[dict]
-    articles: List[dict]
-    conferencePapers: List[dict]
+    position: Optional[str] = None
+    researchInterest: Optional[str] = None
+    departments: List[DepartmentListItem]
+    articles: List[FacultyPublication]
+    conferencePapers: List[FacultyPublication]
+
+
+class FacultySearchItem(FacultyListItem):
+    researchInterest: Optional[str] = None
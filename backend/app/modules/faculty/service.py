@@ -1,67 +1,148 @@
-from typing import Optional, List
+from typing import List, Optional, Iterator
 from pymongo.database import Database
 from bson import ObjectId
 
+from app.core import snapshot
+
 FACULTY_COLLECTION = "faculties"
 DEPARTMENT_COLLECTION = "departments"
 PUBLICATION_COLLECTION = "publications"
 
+EXPORT_BATCH_SIZE = 1000
+EXPORT_PROJECTION = {
+    "name": 1,
+    "position": 1,
+    "researchInterest": 1,
+    "departmentIds": 1,
+    "articleIds": 1,
+    "conferencePaperIds": 1,
+}
+
+
+def _kind_filter(kind: str) -> dict:
+    return {
+        "$filter": {
+            "input": "$publications",
+            "as": "p",
+            "cond": {"$eq": ["$$p.kind", kind]},
+        }
+    }
+
+
+def _serialize_publication(p: dict) -> dict:
+    return {
+        "_id": str(p["_id"]),
+        "title": p.get("title"),
+        "kind": p.get("kind"),
+        "keywords": p.get("keywords", []),
+    }
+
+
+def _profile_pipeline(oid: ObjectId) -> List[dict]:
+    return [
+        {"$match": {"_id": oid}},
+        # both id arrays feed one publications lookup
+        {
+            "$addFields": {
+                "publicationIds": {
+                    "$concatArrays": [
+                        {"$ifNull": ["$articleIds", []]},
+                        {"$ifNull": ["$conferencePaperIds", []]},
+                    ]
+                }
+            }
+        },
+        {
+            "$lookup": {
+                "from": DEPARTMENT_COLLECTION,
+                "localField": "departmentIds",
+                "foreignField": "_id",
+                "pipeline": [{"$project": {"name": 1, "slug": 1}}],
+                "as": "departments",
+            }
+        },
+        {
+            "$lookup": {
+                "from": PUBLICATION_COLLECTION,
+                "localField": "publicationIds",
+                "foreignField": "_id",
+                "pipeline": [{"$project": {"title": 1, "kind": 1, "keywords": 1}}],
+                "as": "publications",
+            }
+        },
+        {
+            "$project": {
+                "name": 1,
+                "position": 1,
+                "researchInterest": 1,
+                "departments": 1,
+                "articles": _kind_filter("article"),
+                "conferencePapers": _kind_filter("conference"),
+            }
+        },
+    ]
+
+
+def _serialize_profile(doc: dict) -> dict:
+    return {
+        "_id": str(doc["_id"]),
+        "name": doc.get("name"),
+        "position": doc.get("position"),
+        "researchInterest": doc.get("researchInterest"),
+        "departments": [
+            {"_id": str(d["_id"]), "name": d["name"], "slug": d["slug"]}
+            for d in doc["departments"]
+        ],
+        "articles": [_serialize_publication(p) for p in doc["articles"]],
+        "conferencePapers": [
+            _serialize_publication(p) for p in doc["conferencePapers"]
+        ],
+    }
+
+
+def get_faculty_profile(db: Database, faculty_id: str) -> Optional[dict]:
+    """
+    Faculty with its departments and publications (already split into
+    articles and conference papers) in a single aggregation round trip.
+    Uses `$lookup` with localField + pipeline, i.e. MongoDB 5.0+.
+    """
+    snap = snapshot.current()
+    if snap is not None:
+        return snap.faculty_profile(faculty_id)
 
-def get_faculty_by_id(db: Database, faculty_id: str) -> Optional[dict]:
     try:
         oid = ObjectId(faculty_id)
     except Exception:
         return None
 
-    doc = db[FACULTY_COLLECTION].find_one({"_id": oid})
+    doc = next(db[FACULTY_COLLECTION].aggregate(_profile_pipeline(oid)), None)
     if not doc:
         return None
+    return _serialize_profile(doc)
 
-    doc["_id"] = str(doc["_id"])
-    for key in ("departmentIds", "articleIds", "conferencePaperIds"):
-        if key in doc and isinstance(doc[key], list):
-            doc[key] = [str(x) for x in doc[key]]
 
-    return doc
+def _serialize_export(doc: dict) -> dict:
+    return {
+        "_id": str(doc["_id"]),
+        "name": doc.get("name"),
+        "position": doc.get("position"),
+        "researchInterest": doc.get("researchInterest"),
+        "departmentIds": [str(x) for x in doc.get("departmentIds", [])],
+        "articleIds": [str(x) for x in doc.get("articleIds", [])],
+        "conferencePaperIds": [str(x) for x in doc.get("conferencePaperIds", [])],
+    }
 
 
-def get_departments_by_ids(db: Database, ids: List[str]) -> List[dict]:
-    object_ids = []
-    for s in ids:
-        try:
-            object_ids.append(ObjectId(s))
-        except:
-            continue
+def iter_faculties(db: Database, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[dict]:
+    """
+    Stream every faculty document with ids stringified, `batch_size` documents
+    per cursor round trip.
+    """
+    snap = snapshot.current()
+    if snap is not None:
+        yield from snap.iter_faculties()
+        return
 
-    cursor = db[DEPARTMENT_COLLECTION].find(
-        {"_id": {"$in": object_ids}},
-        {"name": 1, "slug": 1},
-    )
-    return [
-        {"_id": str(d["_id"]), "name": d["name"], "slug": d["slug"]} for d in cursor
-    ]
-
-
-def get_publications_by_ids(db: Database, ids: List[str]) -> List[dict]:
-    object_ids = []
-    for s in ids:
-        try:
-            object_ids.append(ObjectId(s))
-        except:
-            continue
-
-    cursor = db[PUBLICATION_COLLECTION].find(
-        {"_id": {"$in": object_ids}},
-        {"title": 1, "kind": 1, "keywords": 1},
-    )
-    pubs = []
-    for p in cursor:
-        pubs.append(
-            {
-                "_id": str(p["_id"]),
-                "title": p.get("title"),
-                "kind": p.get("kind"),
-                "keywords": p.get("keywords", []),
-            }
-        )
-    return pubs
+    cursor = db[FACULTY_COLLECTION].find({}, EXPORT_PROJECTION).batch_size(batch_size)
+    for doc in cursor:
+        yield _serialize_export(doc)
@@ -0,0 +1,71 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from pymongo.asynchronous.database import AsyncDatabase
+from app.core.responses import Envelope, json_response
+from app.core.utils import (
+    encode_cursor,
+    decode_cursor,
+    ndjson_stream_async,
+)
+from app.modules.publication import async_service as service, schemas
+from app.modules.publication.service import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.db import get_async_db
+
+router = APIRouter()
+
+
+@router.get("/", response_model=schemas.PublicationPage)
+async def list_publications(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(
+        None, description="meta.nextCursor of the previous page"
+    ),
+    db: AsyncDatabase = Depends(get_async_db),
+):
+    after_id = None
+    if after:
+        after_id = decode_cursor(after)
+        if after_id is None:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    pubs, next_after = await service.get_publications_page(
+        db, limit=limit, after=after_id
+    )
+    return json_response(
+        pubs,
+        status_code=200,
+        message="Publications retrieved successfully",
+        meta={
+            "total": await service.count_publications(db),
+            "limit": limit,
+            "count": len(pubs),
+            "hasMore": next_after is not None,
+            "nextCursor": encode_cursor(next_after) if next_after else None,
+        },
+    )
+
+
+@router.get("/export")
+async def export_publications(
+    fmt: str = Query("ndjson", alias="format", pattern="^ndjson$"),
+    db: AsyncDatabase = Depends(get_async_db),
+):
+    """
+    GET /api/v1/publications/export?format=ndjson
+    Streams the whole collection, one JSON publication per line
+    """
+    return StreamingResponse(
+        ndjson_stream_async(service.iter_publications(db)),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get("/{pub_id}", response_model=Envelope[schemas.PublicationDetail])
+async def get_publication(pub_id: str, db: AsyncDatabase = Depends(get_async_db)):
+    pub = await service.get_publication_by_id(db, pub_id)
+    if not pub:
+        raise HTTPException(status_code=404, detail="Publication not found")
+    return json_response(
+        pub, status_code=200, message="Publication retrieved successfully"
+    )
@@ -0,0 +1,120 @@
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
+from pymongo.asynchronous.database import AsyncDatabase
+from bson import ObjectId
+
+from app.core import singleflight, snapshot
+from .service import (
+    AUTHOR_PROJECTION,
+    DEFAULT_PAGE_SIZE,
+    EXPORT_BATCH_SIZE,
+    EXPORT_PROJECTION,
+    FACULTY_COLLECTION,
+    PUBLICATION_COLLECTION,
+    _join_authors,
+    _to_object_ids,
+)
+
+page_flight = singleflight.async_group("publication_list")
+
+
+async def attach_authors(db: AsyncDatabase, docs: List[dict]) -> List[Dict[str, Any]]:
+    """
+    Async twin of `service.attach_authors`: one faculties query per batch.
+    """
+    author_ids_per_doc = [_to_object_ids(doc.get("authors", [])) for doc in docs]
+
+    unique_ids = {oid for ids in author_ids_per_doc for oid in ids}
+    faculty_docs = []
+    if unique_ids:
+        faculty_docs = await (
+            db[FACULTY_COLLECTION]
+            .find({"_id": {"$in": list(unique_ids)}}, AUTHOR_PROJECTION)
+            .to_list()
+        )
+    return _join_authors(docs, author_ids_per_doc, faculty_docs)
+
+
+async def get_publications_page(
+    db: AsyncDatabase,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[ObjectId] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[ObjectId]]:
+    """
+    Keyset page on `_id`, see `service.get_publications_page`.
+    """
+    snap = snapshot.current()
+    if snap is not None:
+        return snap.publications_page(limit, after)
+    return await page_flight.do(
+        (limit, after), lambda: _fetch_publications_page(db, limit, after)
+    )
+
+
+async def _fetch_publications_page(
+    db: AsyncDatabase, limit: int, after: Optional[ObjectId]
+) -> Tuple[List[Dict[str, Any]], Optional[ObjectId]]:
+    query = {"_id": {"$gt": after}} if after is not None else {}
+    docs = await (
+        db[PUBLICATION_COLLECTION].find(query).sort("_id", 1).limit(limit + 1)
+    ).to_list()
+
+    next_after = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        next_after = docs[-1]["_id"]
+
+    return await attach_authors(db, docs), next_after
+
+
+async def count_publications(db: AsyncDatabase) -> int:
+    snap = snapshot.current()
+    if snap is not None:
+        return snap.count_publications()
+    return await db[PUBLICATION_COLLECTION].estimated_document_count()
+
+
+async def iter_publications(
+    db: AsyncDatabase, batch_size: int = EXPORT_BATCH_SIZE
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream every publication with its authors, resolved once per batch.
+    """
+    snap = snapshot.current()
+    if snap is not None:
+        for pub in snap.iter_publications():
+            yield pub
+        return
+
+    cursor = (
+        db[PUBLICATION_COLLECTION].find({}, EXPORT_PROJECTION).batch_size(batch_size)
+    )
+
+    chunk = []
+    async for doc in cursor:
+        chunk.append(doc)
+        if len(chunk) >= batch_size:
+            for pub in await attach_authors(db, chunk):
+                yield pub
+            chunk = []
+    if chunk:
+        for pub in await attach_authors(db, chunk):
+            yield pub
+
+
+async def get_publication_by_id(
+    db: AsyncDatabase, pub_id: str
+) -> Optional[Dict[str, Any]]:
+    snap = snapshot.current()
+    if snap is not None:
+        return snap.publication(pub_id)
+
+    try:
+        oid = ObjectId(pub_id)
+    except Exception:
+        return None
+
+    doc = await db[PUBLICATION_COLLECTION].find_one({"_id": oid})
+    if not doc:
+        return None
+
+    return (await attach_authors(db, [doc]))[0]
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Optional
 from pymongo.database import Database
-from app.core.utils import send_response
+from app.core.responses import Envelope, json_response
+from app.core.utils import encode_cursor, decode_cursor, ndjson_stream
 from app.modules.publication import service, schemas
 from app.core.db import get_db
 
@@ -9,22 +11,53 @@ from app.core.db import get_db
 router = APIRouter()
 
 
-@router.get("/", response_model=dict)
-def list_publications(db: Database = Depends(get_db)):
-    pubs = service.get_all_publications(db)
-    return send_response(
+@router.get("/", response_model=schemas.PublicationPage)
+def list_publications(
+    limit: int = Query(service.DEFAULT_PAGE_SIZE, ge=1, le=service.MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None, description="meta.nextCursor of the previous page"),
+    db: Database = Depends(get_db),
+):
+    after_id = None
+    if after:
+        after_id = decode_cursor(after)
+        if after_id is None:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    pubs, next_after = service.get_publications_page(db, limit=limit, after=after_id)
+    return json_response(
         pubs,
         status_code=200,
         message="Publications retrieved successfully",
-        meta={"total": len(pubs)},
+        meta={
+            "total": service.count_publications(db),
+            "limit": limit,
+            "count": len(pubs),
+            "hasMore": next_after is not None,
+            "nextCursor": encode_cursor(next_after) if next_after else None,
+        },
+    )
+
+
+@router.get("/export")
+def export_publications(
+    fmt: str = Query("ndjson", alias="format", pattern="^ndjson$"),
+    db: Database = Depends(get_db),
+):
+    """
+    GET /api/v1/publications/export?format=ndjson
+    Streams the whole collection, one JSON publication per line
+    """
+    return StreamingResponse(
+        ndjson_stream(service.iter_publications(db)),
+        media_type="application/x-ndjson",
     )
 
 
-@router.get("/{pub_id}", response_model=dict)
+@router.get("/{pub_id}", response_model=Envelope[schemas.PublicationDetail])
 def get_publication(pub_id: str, db: Database = Depends(get_db)):
     pub = service.get_publication_by_id(db, pub_id)
     if not pub:
         raise HTTPException(status_code=404, detail="Publication not found")
-    return send_response(
+    return json_response(
         pub, status_code=200, message="Publication retrieved successfully"
     )
@@ -1,17 +1,33 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 
+from app.core.responses import Envelope
+from app.modules.faculty.schemas import FacultyListItem
 
-class PublicationBase(BaseModel):
+
+class PublicationListItem(BaseModel):
+    # pydantic treats a leading underscore as private, so `_id` is an alias
+    model_config = ConfigDict(populate_by_name=True)
+
+    # fields in the order the service emits them
+    id: str = Field(alias="_id")
     title: str
     kind: str
     keywords: List[str] = Field(default_factory=list)
-
-
-class PublicationListItem(PublicationBase):
-    _id: str
-    authors: List[dict]
+    authors: List[FacultyListItem]
 
 
 class PublicationDetail(PublicationListItem):
     pass
+
+
+class PublicationPageMeta(BaseModel):
+    total: int
+    limit: int
+    count: int
+    hasMore: bool
+    nextCursor: Optional[str] = None
+
+
+class PublicationPage(Envelope[List[PublicationListItem]]):
+    meta: PublicationPageMeta
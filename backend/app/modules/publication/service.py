@@ -1,47 +1,157 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from pymongo.database import Database
 from bson import ObjectId
 
+from app.core import singleflight, snapshot
+
 PUBLICATION_COLLECTION = "publications"
 FACULTY_COLLECTION = "faculties"
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+EXPORT_BATCH_SIZE = 1000
+
+AUTHOR_PROJECTION = {"_id": 1, "name": 1, "position": 1}
+EXPORT_PROJECTION = {"title": 1, "kind": 1, "keywords": 1, "authors": 1}
+
+page_flight = singleflight.group("publication_list")
+
+
+def _to_object_ids(values: Iterable[Any]) -> List[ObjectId]:
+    object_ids = []
+    for v in values:
+        try:
+            object_ids.append(ObjectId(v))
+        except Exception:
+            continue
+    return object_ids
+
+
+def _serialize_publication(doc: dict, authors: List[dict]) -> Dict[str, Any]:
+    return {
+        "_id": str(doc["_id"]),
+        "title": doc.get("title"),
+        "kind": doc.get("kind"),
+        "keywords": doc.get("keywords", []),
+        "authors": authors,
+    }
+
+
+def _join_authors(
+    docs: List[dict], author_ids_per_doc: List[List[ObjectId]], faculty_docs
+) -> List[Dict[str, Any]]:
+    faculties: Dict[ObjectId, dict] = {
+        f["_id"]: {
+            "_id": str(f["_id"]),
+            "name": f.get("name"),
+            "position": f.get("position"),
+        }
+        for f in faculty_docs
+    }
 
-def get_all_publications(db: Database) -> List[Dict[str, Any]]:
-    cursor = db[PUBLICATION_COLLECTION].find({})
     results = []
-    for doc in cursor:
-        pub_id = str(doc["_id"])
+    for doc, author_ids in zip(docs, author_ids_per_doc):
+        seen = set()
         authors = []
-        for a in doc.get("authors", []):
-            try:
-                authors.append(ObjectId(a))
-            except:
-                pass
-
-        faculty_cursor = db[FACULTY_COLLECTION].find(
-            {"_id": {"$in": authors}},
-            {"_id": 1, "name": 1, "position": 1},
-        )
+        for oid in author_ids:
+            if oid in faculties and oid not in seen:
+                seen.add(oid)
+                authors.append(faculties[oid])
+        results.append(_serialize_publication(doc, authors))
+    return results
 
-        author_list = [
-            {"_id": str(f["_id"]), "name": f.get("name"), "position": f.get("position")}
-            for f in faculty_cursor
-        ]
-
-        results.append(
-            {
-                "_id": pub_id,
-                "title": doc.get("title"),
-                "kind": doc.get("kind"),
-                "keywords": doc.get("keywords", []),
-                "authors": author_list,
-            }
+
+def attach_authors(db: Database, docs: List[dict]) -> List[Dict[str, Any]]:
+    """
+    Resolve the authors of a batch of publication documents.
+
+    All author ids of the batch are collected and fetched with a single
+    faculties query, then joined back onto each publication in memory, so a
+    page of N publications costs one faculty lookup instead of N.
+    """
+    author_ids_per_doc = [_to_object_ids(doc.get("authors", [])) for doc in docs]
+
+    unique_ids = {oid for ids in author_ids_per_doc for oid in ids}
+    faculty_docs = []
+    if unique_ids:
+        faculty_docs = db[FACULTY_COLLECTION].find(
+            {"_id": {"$in": list(unique_ids)}}, AUTHOR_PROJECTION
         )
+    return _join_authors(docs, author_ids_per_doc, faculty_docs)
 
-    return results
+
+def get_publications_page(
+    db: Database, limit: int = DEFAULT_PAGE_SIZE, after: Optional[ObjectId] = None
+) -> Tuple[List[Dict[str, Any]], Optional[ObjectId]]:
+    """
+    Keyset pagination on `_id`: returns one page of publications plus the `_id`
+    to continue after, or None on the last page. Every page is an index range
+    scan on `_id`, so deep pages cost the same as the first one.
+
+    Identical concurrent page requests share one execution.
+    """
+    snap = snapshot.current()
+    if snap is not None:
+        return snap.publications_page(limit, after)
+    return page_flight.do(
+        (limit, after), lambda: _fetch_publications_page(db, limit, after)
+    )
+
+
+def _fetch_publications_page(
+    db: Database, limit: int, after: Optional[ObjectId]
+) -> Tuple[List[Dict[str, Any]], Optional[ObjectId]]:
+    query = {"_id": {"$gt": after}} if after is not None else {}
+    docs = list(
+        db[PUBLICATION_COLLECTION].find(query).sort("_id", 1).limit(limit + 1)
+    )
+
+    next_after = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        next_after = docs[-1]["_id"]
+
+    return attach_authors(db, docs), next_after
+
+
+def count_publications(db: Database) -> int:
+    snap = snapshot.current()
+    if snap is not None:
+        return snap.count_publications()
+    # collection metadata count — O(1), unlike count_documents({})
+    return db[PUBLICATION_COLLECTION].estimated_document_count()
+
+
+def iter_publications(
+    db: Database, batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream every publication with its authors. The cursor fetches
+    `batch_size` documents per round trip and authors are resolved once per
+    batch, so memory stays flat regardless of collection size.
+    """
+    snap = snapshot.current()
+    if snap is not None:
+        yield from snap.iter_publications()
+        return
+
+    cursor = db[PUBLICATION_COLLECTION].find({}, EXPORT_PROJECTION).batch_size(batch_size)
+
+    chunk = []
+    for doc in cursor:
+        chunk.append(doc)
+        if len(chunk) >= batch_size:
+            yield from attach_authors(db, chunk)
+            chunk = []
+    if chunk:
+        yield from attach_authors(db, chunk)
 
 
 def get_publication_by_id(db: Database, pub_id: str) -> Optional[Dict[str, Any]]:
+    snap = snapshot.current()
+    if snap is not None:
+        return snap.publication(pub_id)
+
     try:
         oid = ObjectId(pub_id)
     except Exception:
@@ -51,27 +161,4 @@ def get_publication_by_id(db: Database, pub_id: str) -> Optional[Dict[str, Any]]
     if not doc:
         return None
 
-    authors = []
-    for a in doc.get("authors", []):
-        try:
-            authors.append(ObjectId(a))
-        except:
-            pass
-
-    faculty_cursor = db[FACULTY_COLLECTION].find(
-        {"_id": {"$in": authors}},
-        {"_id": 1, "name": 1, "position": 1},
-    )
-
-    author_list = [
-        {"_id": str(f["_id"]), "name": f.get("name"), "position": f.get("position")}
-        for f in faculty_cursor
-    ]
-
-    return {
-        "_id": str(doc["_id"]),
-        "title": doc.get("title"),
-        "kind": doc.get("kind"),
-        "keywords": doc.get("keywords", []),
-        "authors": author_list,
-    }
+    return attach_authors(db, [doc])[0]
@@ -0,0 +1,74 @@
+from fastapi import APIRouter, Query, Depends, HTTPException
+from typing import Literal, Optional
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import OperationFailure
+from app.core.responses import Envelope, json_response
+from app.core import catalogue
+from app.modules.search import async_service as service, schemas
+from app.modules.search.controller import search_stats
+from app.modules.search.suggest import MAX_SUGGESTIONS, suggester
+from app.core.db import get_async_db
+
+router = APIRouter()
+
+
+@router.get("/", response_model=schemas.SearchEnvelope)
+async def search(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    mode: Literal["index", "regex", "text"] = Query("index"),
+    op: Literal["and", "or"] = Query("and"),
+    count_cap: Optional[int] = Query(
+        None, ge=1, description="Stop counting matches after this many"
+    ),
+    db: AsyncDatabase = Depends(get_async_db),
+):
+    try:
+        results, meta = await service.cached_search_all(
+            db,
+            q,
+            limit=limit,
+            offset=offset,
+            mode=mode,
+            op=op,
+            count_cap=count_cap,
+        )
+    except OperationFailure as exc:
+        # 27 = IndexNotFound: text mode before `python -m app.core.indexes` ran
+        if exc.code == 27:
+            raise HTTPException(status_code=503, detail="Text search is not set up")
+        raise
+
+    return json_response(
+        results,
+        status_code=200,
+        message="Search results retrieved successfully",
+        meta=meta,
+    )
+
+
+@router.get("/suggest", response_model=schemas.SuggestEnvelope)
+async def suggest(
+    prefix: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=MAX_SUGGESTIONS),
+    db: AsyncDatabase = Depends(get_async_db),
+):
+    """
+    GET /api/v1/search/suggest?prefix=
+    Most frequent keywords, titles and faculty names starting with `prefix`
+    """
+    await catalogue.watcher.check_async(db)
+    suggestions = await suggester.complete_async(db, prefix, limit)
+    return json_response(
+        suggestions,
+        status_code=200,
+        message="Suggestions retrieved successfully",
+        meta={"total": len(suggestions)},
+    )
+
+
+# no database access, the sync handler is shared as-is
+router.add_api_route(
+    "/stats", search_stats, methods=["GET"], response_model=Envelope[dict]
+)
@@ -0,0 +1,205 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
+from bson import ObjectId
+
+from app.core import catalogue, singleflight, snapshot
+from app.core.text import tokenize
+from app.modules.publication.async_service import attach_authors
+from app.modules.search import index
+from .service import (
+    FACULTY_COLLECTION,
+    PUBLICATION_COLLECTION,
+    SearchPage,
+    _facet_pipeline,
+    _page_meta,
+    _regex_stages,
+    _serialize_faculty,
+    _text_stages,
+    _unpack_facet,
+    cache_hit_meta,
+    search_cache,
+    search_cache_key,
+)
+
+search_flight = singleflight.async_group("search")
+
+
+async def _find_in_order(
+    collection: AsyncCollection, ids: List[ObjectId]
+) -> List[dict]:
+    if not ids:
+        return []
+    docs = await collection.find({"_id": {"$in": ids}}).to_list()
+    by_id = {doc["_id"]: doc for doc in docs}
+    return [by_id[i] for i in ids if i in by_id]
+
+
+async def _facet_page(
+    collection: AsyncCollection,
+    stages: List[dict],
+    limit: int,
+    offset: int,
+    count_cap: Optional[int],
+) -> SearchPage:
+    pipeline = _facet_pipeline(stages, limit, offset, count_cap)
+    cursor = await collection.aggregate(pipeline)
+    return _unpack_facet((await cursor.to_list(length=1))[0], count_cap)
+
+
+async def _search_page(
+    collection: AsyncCollection,
+    holder: index.IndexHolder,
+    regex_fields: Tuple[str, str],
+    q: str,
+    limit: int,
+    offset: int,
+    mode: str,
+    op: str,
+    count_cap: Optional[int],
+) -> SearchPage:
+    if mode == "text":
+        return await _facet_page(collection, _text_stages(q), limit, offset, count_cap)
+
+    if mode == "index":
+        tokens = tokenize(q)
+        if tokens:
+            holder_index = await holder.get_async(collection.database)
+            ids = holder_index.search(tokens, op)
+            docs = await _find_in_order(collection, ids[offset : offset + limit])
+            return docs, len(ids), False
+
+    stages = _regex_stages(q, regex_fields)
+    return await _facet_page(collection, stages, limit, offset, count_cap)
+
+
+async def search_publications(
+    db: AsyncDatabase,
+    q: str,
+    limit: int = 20,
+    offset: int = 0,
+    mode: str = "index",
+    op: str = "and",
+    count_cap: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], int, bool]:
+    snap = snapshot.current()
+    if snap is not None:
+        # a regex query scans the whole snapshot; keep it off the event loop
+        result = await asyncio.to_thread(
+            snap.search_publications, q, limit, offset, mode, op, count_cap
+        )
+        if result is not None:
+            return result
+
+    docs, total, capped = await _search_page(
+        db[PUBLICATION_COLLECTION],
+        index.publication_index,
+        ("title", "keywords"),
+        q,
+        limit,
+        offset,
+        mode,
+        op,
+        count_cap,
+    )
+    return await attach_authors(db, docs), total, capped
+
+
+async def search_faculties(
+    db: AsyncDatabase,
+    q: str,
+    limit: int = 20,
+    offset: int = 0,
+    mode: str = "index",
+    op: str = "and",
+    count_cap: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], int, bool]:
+    snap = snapshot.current()
+    if snap is not None:
+        result = await asyncio.to_thread(
+            snap.search_faculties, q, limit, offset, mode, op, count_cap
+        )
+        if result is not None:
+            return result
+
+    docs, total, capped = await _search_page(
+        db[FACULTY_COLLECTION],
+        index.faculty_index,
+        ("name", "researchInterest"),
+        q,
+        limit,
+        offset,
+        mode,
+        op,
+        count_cap,
+    )
+    return [_serialize_faculty(doc) for doc in docs], total, capped
+
+
+async def _timed(coro: Awaitable) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    result = await coro
+    return result, round((time.perf_counter() - start) * 1000, 2)
+
+
+async def search_all(
+    db: AsyncDatabase,
+    q: str,
+    limit: int = 20,
+    offset: int = 0,
+    mode: str = "index",
+    op: str = "and",
+    count_cap: Optional[int] = None,
+) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Any]]:
+    """
+    Both searches run concurrently on the event loop (no worker threads);
+    the result shape matches `service.search_all`.
+    """
+    kwargs = dict(limit=limit, offset=offset, mode=mode, op=op, count_cap=count_cap)
+    (pub_page, pub_ms), (fac_page, fac_ms) = await asyncio.gather(
+        _timed(search_publications(db, q, **kwargs)),
+        _timed(search_faculties(db, q, **kwargs)),
+    )
+    pubs, pub_total, pub_capped = pub_page
+    facs, fac_total, fac_capped = fac_page
+
+    meta = {
+        "total": pub_total + fac_total,
+        "publications": _page_meta(pub_total, pub_capped, len(pubs), limit, offset),
+        "faculties": _page_meta(fac_total, fac_capped, len(facs), limit, offset),
+        "timings": {"publicationsMs": pub_ms, "facultiesMs": fac_ms},
+    }
+    return {"publications": pubs, "faculties": facs}, meta
+
+
+async def cached_search_all(
+    db: AsyncDatabase,
+    q: str,
+    limit: int = 20,
+    offset: int = 0,
+    mode: str = "index",
+    op: str = "and",
+    count_cap: Optional[int] = None,
+) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Any]]:
+    """
+    `search_all` behind the same result cache as the sync path.
+    """
+    await catalogue.watcher.check_async(db)
+
+    key = search_cache_key(q, limit, offset, mode, op, count_cap)
+    cached = search_cache.get(key)
+    if cached is not None:
+        data, meta = cached
+        return data, cache_hit_meta(meta)
+
+    async def compute():
+        result = await search_all(
+            db, q, limit=limit, offset=offset, mode=mode, op=op, count_cap=count_cap
+        )
+        search_cache.set(key, result)
+        return result
+
+    data, meta = await search_flight.do(key, compute)
+    return data, {**meta, "cache": "miss"}
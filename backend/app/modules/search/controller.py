@@ -1,27 +1,81 @@
-from fastapi import APIRouter, Query, Depends
-from typing import Dict, Any, Optional
+from fastapi import APIRouter, Query, Depends, HTTPException
+from typing import Literal, Optional
 from pymongo.database import Database
-from app.core.utils import send_response
-from app.modules.search import service
+from pymongo.errors import OperationFailure
+from app.core.responses import Envelope, json_response
+from app.core import catalogue
+from app.modules.search import service, schemas
+from app.modules.search.suggest import MAX_SUGGESTIONS, suggester
 from app.core.db import get_db
 
 
 router = APIRouter()
 
 
-@router.get("/", response_model=dict)
+@router.get("/", response_model=schemas.SearchEnvelope)
 def search(
     q: str = Query(..., min_length=1),
-    limit: Optional[int] = Query(20),
-    offset: Optional[int] = Query(0),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    mode: Literal["index", "regex", "text"] = Query("index"),
+    op: Literal["and", "or"] = Query("and"),
+    count_cap: Optional[int] = Query(
+        None, ge=1, description="Stop counting matches after this many"
+    ),
     db: Database = Depends(get_db),
-) -> Dict[str, Any]:
-    pubs = service.search_publications(db, q, limit=limit, offset=offset)
-    facs = service.search_faculties(db, q, limit=limit, offset=offset)
+):
+    try:
+        results, meta = service.cached_search_all(
+            db,
+            q,
+            limit=limit,
+            offset=offset,
+            mode=mode,
+            op=op,
+            count_cap=count_cap,
+        )
+    except OperationFailure as exc:
+        # 27 = IndexNotFound: text mode before `python -m app.core.indexes` ran
+        if exc.code == 27:
+            raise HTTPException(status_code=503, detail="Text search is not set up")
+        raise
 
-    return send_response(
-        {"publications": pubs, "faculties": facs},
+    return json_response(
+        results,
         status_code=200,
         message="Search results retrieved successfully",
-        meta={"total": len(pubs) + len(facs)},
+        meta=meta,
+    )
+
+
+@router.get("/suggest", response_model=schemas.SuggestEnvelope)
+def suggest(
+    prefix: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=MAX_SUGGESTIONS),
+    db: Database = Depends(get_db),
+):
+    """
+    GET /api/v1/search/suggest?prefix=
+    Most frequent keywords, titles and faculty names starting with `prefix`
+    """
+    catalogue.watcher.check(db)
+    suggestions = suggester.complete(db, prefix, limit)
+    return json_response(
+        suggestions,
+        status_code=200,
+        message="Suggestions retrieved successfully",
+        meta={"total": len(suggestions)},
+    )
+
+
+@router.get("/stats", response_model=Envelope[dict])
+def search_stats():
+    """
+    GET /api/v1/search/stats
+    Hit/miss counters of the search result cache
+    """
+    return json_response(
+        {"cache": service.search_cache.stats()},
+        status_code=200,
+        message="Search stats retrieved successfully",
     )
@@ -0,0 +1,324 @@
+"""
+In-process inverted index over publication and faculty terms.
+
+Each collection is scanned once into a table of document `_id`s plus one
+postings array per token (positions into that table, ascending). A query
+token matches every indexed token it is a prefix of ("lear" finds "learning"),
+found by binary search over the sorted tokens; a search is then an
+intersection (AND) or union (OR) of their postings, instead of an unanchored
+regex scan of the whole collection.
+An index is rebuilt in the background when the catalogue version marker
+changes; searches keep using the previous one until the new one is ready.
+"""
+
+import asyncio
+import logging
+import threading
+from array import array
+from bisect import bisect_left
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+from bson import ObjectId
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.database import Database
+
+from app.core import catalogue
+from app.core.text import prefix_end, tokenize
+
+logger = logging.getLogger(__name__)
+
+FACULTY_COLLECTION = "faculties"
+PUBLICATION_COLLECTION = "publications"
+
+
+class InvertedIndex:
+    def __init__(self):
+        self.doc_ids: List[ObjectId] = []
+        self.postings: Dict[str, array] = {}
+        self._terms: Optional[List[str]] = None  # sorted postings keys
+
+    def add(self, doc_id: ObjectId, tokens: Iterable[str]) -> None:
+        pos = len(self.doc_ids)
+        self.doc_ids.append(doc_id)
+        self.add_postings(pos, tokens)
+
+    def add_postings(self, pos: int, tokens: Iterable[str]) -> None:
+        """
+        Index `tokens` under position `pos` only; for callers that keep their
+        own position -> document table (positions must ascend).
+        """
+        for token in set(tokens):
+            postings = self.postings.get(token)
+            if postings is None:
+                postings = self.postings[token] = array("I")
+                self._terms = None
+            postings.append(pos)
+
+    def sort_terms(self) -> List[str]:
+        """
+        The indexed tokens, sorted; computed once per build (the first
+        prefix lookup does it otherwise).
+        """
+        if self._terms is None:
+            self._terms = sorted(self.postings)
+        return self._terms
+
+    def expand(self, prefix: str) -> List[str]:
+        """
+        Every indexed token starting with `prefix`, ascending.
+        """
+        terms = self.sort_terms()
+        lo = bisect_left(terms, prefix)
+        end = prefix_end(prefix)
+        hi = len(terms) if end is None else bisect_left(terms, end, lo)
+        return terms[lo:hi]
+
+    def _matches(self, prefix: str):
+        """
+        Positions of the documents with a token starting with `prefix`, or
+        None when there are none.
+        """
+        terms = self.expand(prefix)
+        if " " not in prefix:
+            # a bigram's documents all have its first word indexed too
+            terms = [t for t in terms if " " not in t]
+        if not terms:
+            return None
+        if len(terms) == 1:
+            return self.postings[terms[0]]
+        matched = set()
+        for term in terms:
+            matched.update(self.postings[term])
+        return matched
+
+    def positions(self, tokens: List[str], op: str = "and") -> List[int]:
+        """
+        Return the positions of matching documents, ascending. Each token
+        matches the indexed tokens it is a prefix of.
+        """
+        lists = [self._matches(t) for t in tokens]
+        if op == "and":
+            if not lists or any(p is None for p in lists):
+                return []
+            lists.sort(key=len)
+            matched = set(lists[0])
+            for p in lists[1:]:
+                matched.intersection_update(p)
+                if not matched:
+                    return []
+        else:
+            matched = set()
+            for p in lists:
+                if p is not None:
+                    matched.update(p)
+
+        return sorted(matched)
+
+    def search(self, tokens: List[str], op: str = "and") -> List[ObjectId]:
+        """
+        Return matching document ids in index (i.e. `_id`) order.
+        """
+        return [self.doc_ids[pos] for pos in self.positions(tokens, op)]
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+
+PUBLICATION_PROJECTION = {"title": 1, "keywords": 1}
+FACULTY_PROJECTION = {"name": 1, "researchInterest": 1}
+
+
+def publication_tokens(doc: dict) -> List[str]:
+    tokens = list(doc.get("keywords") or [])
+    tokens.extend(tokenize(doc.get("title") or ""))
+    return tokens
+
+
+def faculty_tokens(doc: dict) -> List[str]:
+    return tokenize(f"{doc.get('name') or ''} {doc.get('researchInterest') or ''}")
+
+
+def build_publication_index(db: Database) -> InvertedIndex:
+    index = InvertedIndex()
+    cursor = (
+        db[PUBLICATION_COLLECTION]
+        .find({}, PUBLICATION_PROJECTION)
+        .sort("_id", 1)
+        .batch_size(5000)
+    )
+    for doc in cursor:
+        index.add(doc["_id"], publication_tokens(doc))
+    return index
+
+
+def build_faculty_index(db: Database) -> InvertedIndex:
+    index = InvertedIndex()
+    cursor = (
+        db[FACULTY_COLLECTION]
+        .find({}, FACULTY_PROJECTION)
+        .sort("_id", 1)
+        .batch_size(5000)
+    )
+    for doc in cursor:
+        index.add(doc["_id"], faculty_tokens(doc))
+    return index
+
+
+BUILD_BATCH = 5000
+
+
+def _add_docs(
+    index: InvertedIndex, docs: List[dict], tokens: Callable[[dict], List[str]]
+) -> None:
+    for doc in docs:
+        index.add(doc["_id"], tokens(doc))
+
+
+async def _build_async(cursor, tokens: Callable[[dict], List[str]]) -> InvertedIndex:
+    """
+    Read on the event loop, tokenise in a worker thread one batch at a time,
+    so a rebuild never stalls other requests for longer than a batch read.
+    """
+    index = InvertedIndex()
+    batch: List[dict] = []
+    async for doc in cursor:
+        batch.append(doc)
+        if len(batch) >= BUILD_BATCH:
+            await asyncio.to_thread(_add_docs, index, batch, tokens)
+            batch = []
+    if batch:
+        await asyncio.to_thread(_add_docs, index, batch, tokens)
+    return index
+
+
+async def build_publication_index_async(db: AsyncDatabase) -> InvertedIndex:
+    cursor = (
+        db[PUBLICATION_COLLECTION]
+        .find({}, PUBLICATION_PROJECTION)
+        .sort("_id", 1)
+        .batch_size(BUILD_BATCH)
+    )
+    return await _build_async(cursor, publication_tokens)
+
+
+async def build_faculty_index_async(db: AsyncDatabase) -> InvertedIndex:
+    cursor = (
+        db[FACULTY_COLLECTION]
+        .find({}, FACULTY_PROJECTION)
+        .sort("_id", 1)
+        .batch_size(BUILD_BATCH)
+    )
+    return await _build_async(cursor, faculty_tokens)
+
+
+class IndexHolder:
+    """
+    Owns one index. The first search builds it; after that a catalogue
+    change (catalogue.watcher) bumps a generation counter and the next
+    search starts a rebuild in the background, while searches keep using
+    the current index. A rebuild that started before the latest
+    invalidation is discarded (unless there is nothing else to serve), so a
+    change that lands mid-build always gets a rebuild of its own. Readers
+    never see a half-built index: the reference is replaced atomically.
+    """
+
+    def __init__(
+        self,
+        builder: Callable[[Database], InvertedIndex],
+        async_builder: Callable[[AsyncDatabase], Awaitable[InvertedIndex]],
+    ):
+        self._builder = builder
+        self._async_builder = async_builder
+        self._lock = threading.Lock()  # guards the handover
+        self._build_lock = threading.Lock()  # one DB scan at a time
+        self._async_build_lock: Optional[asyncio.Lock] = None
+        self._index: Optional[InvertedIndex] = None
+        self._db_name: Optional[str] = None
+        self._generation = 0  # bumped by invalidate()
+        self._built_generation = 0  # generation the current index was built at
+        self._rebuilding = False
+        self._task: Optional[asyncio.Task] = None
+
+    def _needs_build(self, db) -> bool:
+        return self._index is None or self._db_name != db.name
+
+    def _is_current(self, db) -> bool:
+        return not self._needs_build(db) and self._built_generation == self._generation
+
+    def _install(self, db_name: str, generation: int, index: InvertedIndex) -> None:
+        with self._lock:
+            invalidated = generation != self._generation
+            if invalidated and self._index is not None and self._db_name == db_name:
+                return  # keep serving the current one; a newer build follows
+            self._index = index
+            self._db_name = db_name
+            self._built_generation = generation
+
+    def _rebuild(self, db: Database) -> None:
+        with self._build_lock:
+            generation = self._generation
+            if not self._is_current(db):
+                index = self._builder(db)
+                index.sort_terms()
+                self._install(db.name, generation, index)
+
+    async def _rebuild_async(self, db: AsyncDatabase) -> None:
+        if self._async_build_lock is None:
+            self._async_build_lock = asyncio.Lock()
+        async with self._async_build_lock:
+            generation = self._generation
+            if not self._is_current(db):
+                index = await self._async_builder(db)
+                await asyncio.to_thread(index.sort_terms)
+                self._install(db.name, generation, index)
+
+    def _rebuild_in_background(self, db: Database) -> None:
+        with self._lock:
+            if self._rebuilding:
+                return
+            self._rebuilding = True
+
+        def run():
+            try:
+                self._rebuild(db)
+            except Exception as exc:
+                logger.warning("Search index rebuild failed: %s", exc)
+            finally:
+                self._rebuilding = False
+
+        threading.Thread(target=run, name="search-index-rebuild", daemon=True).start()
+
+    async def _rebuild_logged(self, db: AsyncDatabase) -> None:
+        try:
+            await self._rebuild_async(db)
+        except Exception as exc:
+            logger.warning("Search index rebuild failed: %s", exc)
+
+    def get(self, db: Database) -> InvertedIndex:
+        if self._needs_build(db):
+            self._rebuild(db)  # nothing to serve yet
+            return self._index
+        index = self._index
+        if self._built_generation != self._generation:
+            self._rebuild_in_background(db)
+        return index
+
+    async def get_async(self, db: AsyncDatabase) -> InvertedIndex:
+        if self._needs_build(db):
+            await self._rebuild_async(db)
+        elif self._built_generation != self._generation and (
+            self._task is None or self._task.done()
+        ):
+            self._task = asyncio.create_task(self._rebuild_logged(db))
+        return self._index
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+
+
+publication_index = IndexHolder(build_publication_index, build_publication_index_async)
+faculty_index = IndexHolder(build_faculty_index, build_faculty_index_async)
+
+catalogue.watcher.subscribe(publication_index.invalidate)
+catalogue.watcher.subscribe(faculty_index.invalidate)
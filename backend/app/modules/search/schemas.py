@@ -0,0 +1,47 @@
+from pydantic import BaseModel
+from typing import List, Literal, Optional
+
+from app.core.responses import Envelope, ListMeta
+from app.modules.faculty.schemas import FacultySearchItem
+from app.modules.publication.schemas import PublicationListItem
+
+
+class SearchResults(BaseModel):
+    publications: List[PublicationListItem]
+    faculties: List[FacultySearchItem]
+
+
+class SearchPageMeta(BaseModel):
+    total: int
+    capped: bool
+    limit: int
+    offset: int
+    hasMore: bool
+
+
+class SearchTimings(BaseModel):
+    publicationsMs: float
+    facultiesMs: float
+
+
+class SearchMeta(BaseModel):
+    total: int
+    publications: SearchPageMeta
+    faculties: SearchPageMeta
+    # absent on cache hits
+    timings: Optional[SearchTimings] = None
+    cache: Optional[Literal["hit", "miss"]] = None
+
+
+class Suggestion(BaseModel):
+    text: str
+    type: Literal["title", "keyword", "faculty"]
+    count: int
+
+
+class SearchEnvelope(Envelope[SearchResults]):
+    meta: SearchMeta
+
+
+class SuggestEnvelope(Envelope[List[Suggestion]]):
+    meta: ListMeta
@@ -1,105 +1,299 @@
-from typing import List, Dict, Any
+import contextvars
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Optional, Tuple
+from pymongo.collection import Collection
 from pymongo.database import Database
 from bson import ObjectId, Regex
 
+from app.core import catalogue, singleflight, snapshot
+from app.core.cache import TTLCache
+from app.core.text import tokenize
+from app.modules.publication.service import attach_authors
+from app.modules.search import index
+
 FACULTY_COLLECTION = "faculties"
 PUBLICATION_COLLECTION = "publications"
 
+# Bounded pool for the faculties branch of `search_all`; the publications
+# branch runs on the request's own thread.
+SEARCH_WORKERS = int(os.getenv("SEARCH_WORKERS", "8"))
+_executor = ThreadPoolExecutor(max_workers=SEARCH_WORKERS, thread_name_prefix="search")
+
+# Result cache for `cached_search_all`, emptied whenever the catalogue changes.
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "1024"))
+SEARCH_CACHE_TTL_SECONDS = float(os.getenv("SEARCH_CACHE_TTL_SECONDS", "60"))
+search_cache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL_SECONDS)
+catalogue.watcher.subscribe(search_cache.clear)
+search_flight = singleflight.group("search")
+
+
+def _find_in_order(collection: Collection, ids: List[ObjectId]) -> List[dict]:
+    """
+    Fetch documents by `_id` and return them in the order of `ids`.
+    """
+    if not ids:
+        return []
+    by_id = {doc["_id"]: doc for doc in collection.find({"_id": {"$in": ids}})}
+    return [by_id[i] for i in ids if i in by_id]
+
+
+# (documents of the requested page, total matches, whether total was capped)
+SearchPage = Tuple[List[dict], int, bool]
+
+
+def _facet_pipeline(
+    stages: List[dict], limit: int, offset: int, count_cap: Optional[int]
+) -> List[dict]:
+    count_stages = [{"$limit": count_cap}] if count_cap else []
+    count_stages.append({"$count": "n"})
+    return stages + [
+        {
+            "$facet": {
+                "items": [{"$skip": offset}, {"$limit": limit}],
+                "total": count_stages,
+            }
+        }
+    ]
+
+
+def _unpack_facet(result: dict, count_cap: Optional[int]) -> SearchPage:
+    total = result["total"][0]["n"] if result["total"] else 0
+    return result["items"], total, bool(count_cap) and total >= count_cap
+
+
+def _facet_page(
+    collection: Collection,
+    stages: List[dict],
+    limit: int,
+    offset: int,
+    count_cap: Optional[int],
+) -> SearchPage:
+    """
+    Run `stages` once and return both the requested page and the match count
+    from a single `$facet` round trip. With `count_cap`, counting stops after
+    that many matches so very broad queries stay cheap.
+    """
+    pipeline = _facet_pipeline(stages, limit, offset, count_cap)
+    return _unpack_facet(next(collection.aggregate(pipeline)), count_cap)
+
+
+def _text_stages(q: str) -> List[dict]:
+    return [
+        {"$match": {"$text": {"$search": q}}},
+        {"$sort": {"score": {"$meta": "textScore"}}},
+    ]
+
+
+def _regex_stages(q: str, regex_fields: Tuple[str, str]) -> List[dict]:
+    query_regex = Regex(f".*{q}.*", "i")
+    return [{"$match": {"$or": [{f: {"$regex": query_regex}} for f in regex_fields]}}]
+
+
+def _search_page(
+    collection: Collection,
+    holder: index.IndexHolder,
+    regex_fields: Tuple[str, str],
+    q: str,
+    limit: int,
+    offset: int,
+    mode: str,
+    op: str,
+    count_cap: Optional[int],
+) -> SearchPage:
+    if mode == "text":
+        return _facet_page(collection, _text_stages(q), limit, offset, count_cap)
+
+    if mode == "index":
+        tokens = tokenize(q)
+        if tokens:
+            # the postings give an exact total for free, no cap needed
+            ids = holder.get(collection.database).search(tokens, op)
+            docs = _find_in_order(collection, ids[offset : offset + limit])
+            return docs, len(ids), False
+
+    stages = _regex_stages(q, regex_fields)
+    return _facet_page(collection, stages, limit, offset, count_cap)
+
 
 def search_publications(
-    db: Database, q: str, limit: int = 20, offset: int = 0
-) -> List[Dict[str, Any]]:
+    db: Database,
+    q: str,
+    limit: int = 20,
+    offset: int = 0,
+    mode: str = "index",
+    op: str = "and",
+    count_cap: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], int, bool]:
     """
     Search publications by title or keywords and include authors details.
+    Returns (page, total matches, whether the total hit `count_cap`).
+
+    In `index` mode the query is tokenised like the stored keywords and
+    answered from the inverted index (AND/OR over tokens, each also matching
+    the words it is a prefix of); queries without an indexable token (e.g.
+    "ai") fall back to the regex scan. `text` mode uses
+    the weighted text index and returns the best-scoring hits first.
     """
-    query_regex = Regex(f".*{q}.*", "i")
+    snap = snapshot.current()
+    if snap is not None:
+        result = snap.search_publications(q, limit, offset, mode, op, count_cap)
+        if result is not None:
+            return result
 
-    cursor = (
-        db[PUBLICATION_COLLECTION]
-        .find(
-            {
-                "$or": [
-                    {"title": {"$regex": query_regex}},
-                    {"keywords": {"$regex": query_regex}},
-                ]
-            }
-        )
-        .skip(offset)
-        .limit(limit)
+    docs, total, capped = _search_page(
+        db[PUBLICATION_COLLECTION],
+        index.publication_index,
+        ("title", "keywords"),
+        q,
+        limit,
+        offset,
+        mode,
+        op,
+        count_cap,
     )
+    # authors for the whole page are resolved with one faculties query
+    return attach_authors(db, docs), total, capped
 
-    results = []
-
-    for doc in cursor:
-        # stringify pub id
-        pub_id = str(doc["_id"])
-
-        # get authors field (may be list of ObjectIds or strings)
-        raw_authors = doc.get("authors", [])  # match your store field name
-
-        author_objs = []
-        if raw_authors:
-            # convert mixed types to ObjectId instances
-            obj_ids = []
-            for a in raw_authors:
-                try:
-                    obj_ids.append(ObjectId(a))
-                except Exception:
-                    continue
-
-            # fetch faculty records for authors
-            fac_cursor = db[FACULTY_COLLECTION].find(
-                {"_id": {"$in": obj_ids}}, {"name": 1, "position": 1}
-            )
-
-            for f in fac_cursor:
-                author_objs.append(
-                    {
-                        "_id": str(f["_id"]),
-                        "name": f.get("name"),
-                        "position": f.get("position"),
-                    }
-                )
-
-        results.append(
-            {
-                "_id": pub_id,
-                "title": doc.get("title"),
-                "kind": doc.get("kind"),
-                "keywords": doc.get("keywords", []),
-                "authors": author_objs,
-            }
-        )
 
-    return results
+def _serialize_faculty(doc: dict) -> Dict[str, Any]:
+    return {
+        "_id": str(doc["_id"]),
+        "name": doc.get("name"),
+        "position": doc.get("position"),
+        "researchInterest": doc.get("researchInterest"),
+    }
 
 
 def search_faculties(
-    db: Database, q: str, limit: int = 20, offset: int = 0
-) -> List[Dict[str, Any]]:
-    query_regex = Regex(f".*{q}.*", "i")
-    cursor = (
-        db[FACULTY_COLLECTION]
-        .find(
-            {
-                "$or": [
-                    {"name": {"$regex": query_regex}},
-                    {"researchInterest": {"$regex": query_regex}},
-                ]
-            }
-        )
-        .skip(offset)
-        .limit(limit)
+    db: Database,
+    q: str,
+    limit: int = 20,
+    offset: int = 0,
+    mode: str = "index",
+    op: str = "and",
+    count_cap: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], int, bool]:
+    snap = snapshot.current()
+    if snap is not None:
+        result = snap.search_faculties(q, limit, offset, mode, op, count_cap)
+        if result is not None:
+            return result
+
+    docs, total, capped = _search_page(
+        db[FACULTY_COLLECTION],
+        index.faculty_index,
+        ("name", "researchInterest"),
+        q,
+        limit,
+        offset,
+        mode,
+        op,
+        count_cap,
     )
+    return [_serialize_faculty(doc) for doc in docs], total, capped
 
-    results = []
-    for doc in cursor:
-        results.append(
-            {
-                "_id": str(doc["_id"]),
-                "name": doc.get("name"),
-                "position": doc.get("position"),
-                "researchInterest": doc.get("researchInterest"),
-            }
+
+def _timed(fn: Callable, *args, **kwargs) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, round((time.perf_counter() - start) * 1000, 2)
+
+
+def _page_meta(total: int, capped: bool, count: int, limit: int, offset: int):
+    return {
+        "total": total,
+        "capped": capped,
+        "limit": limit,
+        "offset": offset,
+        # a capped total is only a lower bound, so a full page may have more
+        "hasMore": offset + count < total or (capped and count == limit),
+    }
+
+
+def search_all(
+    db: Database,
+    q: str,
+    limit: int = 20,
+    offset: int = 0,
+    mode: str = "index",
+    op: str = "and",
+    count_cap: Optional[int] = None,
+) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Any]]:
+    """
+    Run the publication and faculty searches concurrently and return
+    ({"publications", "faculties"}, meta) where meta holds the total match
+    count and paging info per collection plus per-branch timings in ms.
+    """
+    kwargs = dict(limit=limit, offset=offset, mode=mode, op=op, count_cap=count_cap)
+    # copy the context so the branch's Mongo commands keep the request route
+    fac_future = _executor.submit(
+        contextvars.copy_context().run, _timed, search_faculties, db, q, **kwargs
+    )
+    (pubs, pub_total, pub_capped), pub_ms = _timed(search_publications, db, q, **kwargs)
+    (facs, fac_total, fac_capped), fac_ms = fac_future.result()
+
+    meta = {
+        "total": pub_total + fac_total,
+        "publications": _page_meta(pub_total, pub_capped, len(pubs), limit, offset),
+        "faculties": _page_meta(fac_total, fac_capped, len(facs), limit, offset),
+        "timings": {"publicationsMs": pub_ms, "facultiesMs": fac_ms},
+    }
+    return {"publications": pubs, "faculties": facs}, meta
+
+
+def search_cache_key(
+    q: str,
+    limit: int,
+    offset: int,
+    mode: str,
+    op: str = "and",
+    count_cap: Optional[int] = None,
+) -> tuple:
+    """
+    In index and text mode the query is tokenised case-insensitively, so
+    "Deep  Learning" and "deep learning" share an entry. Regex mode matches
+    `q` verbatim, so there the key keeps it as given.
+    """
+    if mode in ("index", "text"):
+        q = " ".join(q.lower().split())
+    return (q, limit, offset, mode, op, count_cap)
+
+
+def cache_hit_meta(meta: Dict[str, Any]) -> Dict[str, Any]:
+    return {**{k: v for k, v in meta.items() if k != "timings"}, "cache": "hit"}
+
+
+def cached_search_all(
+    db: Database,
+    q: str,
+    limit: int = 20,
+    offset: int = 0,
+    mode: str = "index",
+    op: str = "and",
+    count_cap: Optional[int] = None,
+) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Any]]:
+    """
+    `search_all` behind the TTL+LRU result cache. meta.cache says whether the
+    response was served from the cache; hits carry no timings, which belong
+    to the miss that filled the entry. Concurrent misses for the same key are
+    coalesced into one `search_all` call.
+    """
+    catalogue.watcher.check(db)
+
+    key = search_cache_key(q, limit, offset, mode, op, count_cap)
+    cached = search_cache.get(key)
+    if cached is not None:
+        data, meta = cached
+        return data, cache_hit_meta(meta)
+
+    def compute():
+        result = search_all(
+            db, q, limit=limit, offset=offset, mode=mode, op=op, count_cap=count_cap
         )
-    return results
+        search_cache.set(key, result)
+        return result
+
+    data, meta = search_flight.do(key, compute)
+    return data, {**meta, "cache": "miss"}
@@ -0,0 +1,268 @@
+"""
+Prefix autocomplete over publication keywords and titles and faculty names.
+
+Terms live in a sorted table (lowercased keys + bisect), so a completion is a
+binary search plus a scan of the matching range. Ranges for one- and
+two-character prefixes can span most of the table, so their top completions
+are precomputed. The table is only rescanned when the catalogue version
+changes, in the background, and only terms whose frequency changed are
+applied; completions keep coming from the previous table meanwhile.
+"""
+
+import asyncio
+import heapq
+import logging
+import threading
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.database import Database
+
+from app.core import catalogue
+from app.core.text import prefix_end
+
+logger = logging.getLogger(__name__)
+
+FACULTY_COLLECTION = "faculties"
+PUBLICATION_COLLECTION = "publications"
+
+MAX_SUGGESTIONS = 20
+SHORT_PREFIX_LEN = 2
+
+# key -> (display text, term type, frequency)
+Entry = Tuple[str, str, int]
+
+
+class TermTable:
+    def __init__(self):
+        self._keys: List[str] = []
+        self._entries: Dict[str, Entry] = {}
+        self._short_top: Dict[str, List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _range(self, prefix: str) -> Tuple[int, int]:
+        lo = bisect_left(self._keys, prefix)
+        end = prefix_end(prefix)
+        hi = len(self._keys) if end is None else bisect_left(self._keys, end, lo)
+        return lo, hi
+
+    def _top(self, prefix: str, n: int) -> List[str]:
+        lo, hi = self._range(prefix)
+        return heapq.nlargest(
+            n, self._keys[lo:hi], key=lambda k: (self._entries[k][2], -len(k))
+        )
+
+    def _refresh_short_prefixes(self, keys) -> None:
+        prefixes = {k[:i] for k in keys for i in range(1, SHORT_PREFIX_LEN + 1)}
+        for p in prefixes:
+            top = self._top(p, MAX_SUGGESTIONS)
+            if top:
+                self._short_top[p] = top
+            else:
+                self._short_top.pop(p, None)
+
+    def apply(self, entries: Dict[str, Entry]) -> int:
+        """
+        Make the table match `entries`, touching only keys that were added,
+        removed or changed. Returns the number of keys touched.
+        """
+        removed = [k for k in self._entries if k not in entries]
+        added = [k for k in entries if k not in self._entries]
+        updated = [
+            k
+            for k, e in entries.items()
+            if k in self._entries and self._entries[k] != e
+        ]
+
+        # a large diff (e.g. the first build) is cheaper as one sort than as
+        # many O(n) list inserts/deletes
+        if len(removed) + len(added) > len(self._keys) // 4:
+            self._keys = sorted(entries)
+        else:
+            for key in removed:
+                del self._keys[bisect_left(self._keys, key)]
+            for key in added:
+                insort(self._keys, key)
+
+        for key in removed:
+            del self._entries[key]
+        for key in added + updated:
+            self._entries[key] = entries[key]
+
+        changed = removed + added + updated
+        self._refresh_short_prefixes(changed)
+        return len(changed)
+
+    def complete(self, prefix: str, n: int = 10) -> List[dict]:
+        prefix = " ".join(prefix.lower().split())
+        if not prefix:
+            return []
+        if len(prefix) <= SHORT_PREFIX_LEN:
+            keys = self._short_top.get(prefix, [])[:n]
+        else:
+            keys = self._top(prefix, n)
+        return [
+            {"text": text, "type": kind, "count": count}
+            for text, kind, count in (self._entries[k] for k in keys)
+        ]
+
+
+class _TermCounter:
+    def __init__(self):
+        self.counts: Dict[str, int] = defaultdict(int)
+        self.display: Dict[str, Tuple[str, str]] = {}
+
+    def add(self, text: Optional[str], kind: str) -> None:
+        text = " ".join((text or "").split())
+        if not text:
+            return
+        key = text.lower()
+        self.counts[key] += 1
+        self.display.setdefault(key, (text, kind))
+
+    def add_publication(self, doc: dict) -> None:
+        self.add(doc.get("title"), "title")
+        for kw in doc.get("keywords") or []:
+            self.add(kw, "keyword")
+
+    def add_faculty(self, doc: dict) -> None:
+        self.add(doc.get("name"), "faculty")
+
+    def entries(self) -> Dict[str, Entry]:
+        return {
+            k: (self.display[k][0], self.display[k][1], c)
+            for k, c in self.counts.items()
+        }
+
+
+def collect_terms(db: Database) -> Dict[str, Entry]:
+    counter = _TermCounter()
+    pubs = db[PUBLICATION_COLLECTION].find({}, {"title": 1, "keywords": 1})
+    for doc in pubs.batch_size(5000):
+        counter.add_publication(doc)
+    facs = db[FACULTY_COLLECTION].find({}, {"name": 1})
+    for doc in facs.batch_size(5000):
+        counter.add_faculty(doc)
+    return counter.entries()
+
+
+async def collect_terms_async(db: AsyncDatabase) -> Dict[str, Entry]:
+    counter = _TermCounter()
+    pubs = db[PUBLICATION_COLLECTION].find({}, {"title": 1, "keywords": 1})
+    async for doc in pubs.batch_size(5000):
+        counter.add_publication(doc)
+    facs = db[FACULTY_COLLECTION].find({}, {"name": 1})
+    async for doc in facs.batch_size(5000):
+        counter.add_faculty(doc)
+    return counter.entries()
+
+
+class Suggester:
+    """
+    Owns the shared TermTable. The first completion builds it; after that a
+    catalogue change (catalogue.watcher) marks it stale and the next
+    completion starts a refresh in the background, which rescans only if
+    the version marker really moved. Until it lands, completions are served
+    from the current table.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()  # guards the table
+        self._refresh_lock = threading.Lock()  # one DB scan at a time
+        self._async_refresh_lock: Optional[asyncio.Lock] = None
+        self._table = TermTable()
+        self._db_name: Optional[str] = None
+        self._version: Optional[int] = None
+        self._stale = False
+        self._refreshing = False
+        self._task: Optional[asyncio.Task] = None
+
+    def _needs_build(self, db) -> bool:
+        return self._version is None or self._db_name != db.name
+
+    def _refresh(self, db: Database) -> None:
+        with self._refresh_lock:
+            # cleared before reading the marker: a change during the scan
+            # marks the table stale again
+            self._stale = False
+            try:
+                version = catalogue.get_catalogue_version(db)
+                if self._needs_build(db) or version != self._version:
+                    self._apply(db.name, version, collect_terms(db))
+            except Exception:
+                self._stale = True
+                raise
+
+    async def _refresh_async(self, db: AsyncDatabase) -> None:
+        if self._async_refresh_lock is None:
+            self._async_refresh_lock = asyncio.Lock()
+        async with self._async_refresh_lock:
+            self._stale = False
+            try:
+                version = await catalogue.get_catalogue_version_async(db)
+                if self._needs_build(db) or version != self._version:
+                    entries = await collect_terms_async(db)
+                    # applying sorts and diffs the whole table: off the loop
+                    await asyncio.to_thread(self._apply, db.name, version, entries)
+            except Exception:
+                self._stale = True
+                raise
+
+    def _apply(self, db_name: str, version: int, entries: Dict[str, Entry]) -> None:
+        with self._lock:
+            if self._db_name != db_name:
+                self._table = TermTable()
+            self._table.apply(entries)
+            self._db_name = db_name
+            self._version = version
+
+    def _refresh_in_background(self, db: Database) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                self._refresh(db)
+            except Exception as exc:
+                logger.warning("Suggestion table refresh failed: %s", exc)
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=run, name="suggest-refresh", daemon=True).start()
+
+    async def _refresh_logged(self, db: AsyncDatabase) -> None:
+        try:
+            await self._refresh_async(db)
+        except Exception as exc:
+            logger.warning("Suggestion table refresh failed: %s", exc)
+
+    def complete(self, db: Database, prefix: str, n: int = 10) -> List[dict]:
+        if self._needs_build(db):
+            self._refresh(db)  # nothing to serve yet
+        elif self._stale:
+            self._refresh_in_background(db)
+        with self._lock:
+            return self._table.complete(prefix, n)
+
+    async def complete_async(
+        self, db: AsyncDatabase, prefix: str, n: int = 10
+    ) -> List[dict]:
+        if self._needs_build(db):
+            await self._refresh_async(db)
+        elif self._stale and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._refresh_logged(db))
+        with self._lock:
+            return self._table.complete(prefix, n)
+
+    def invalidate(self) -> None:
+        self._stale = True
+
+
+suggester = Suggester()
+catalogue.watcher.subscribe(suggester.invalidate)
@@ -0,0 +1,350 @@
+"""
+Latency, throughput and MongoDB queries per request for every GET route of
+the API, driven in-process through httpx's ASGI transport (with the app
+lifespan, so warm-up and index checks run as in production).
+
+The routes come from the OpenAPI schema, so new endpoints are benchmarked
+without touching this file; a route with a required parameter this script
+can't fill fails the run instead of being skipped silently.
+
+    python -m benchmarks.bench_api [--scale 1k|100k|1m] [--stand-in]
+                                   [--requests N] [--concurrency N]
+                                   [--output FILE] [--compare FILE]
+
+By default the catalogue is seeded into BENCH_DB_NAME on BENCH_MONGO_URI.
+--stand-in uses an in-process mongomock database instead, which is enough to
+compare changes in the Python layers. It is sync-driver only, counts queries
+per collection call rather than per wire command, and routes that need
+operators mongomock lacks (`$lookup` with a pipeline, `$text`) show up in the
+error column.
+
+Results are written as JSON (benchmarks/results/ by default); pass a
+previous file to --compare to print the p50/p95 change per route.
+"""
+
+import argparse
+import asyncio
+import datetime
+import functools
+import json
+import os
+import platform
+import random
+import subprocess
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.common import (
+    BENCH_DB_NAME,
+    BENCH_MONGO_URI,
+    WORDS,
+    QueryCounter,
+    connect,
+    percentile,
+    print_table,
+    seed,
+)
+
+# publications, faculties, departments
+SCALES = {
+    "1k": (1_000, 100, 10),
+    "100k": (100_000, 5_000, 40),
+    "1m": (1_000_000, 20_000, 60),
+}
+
+# routes that stream a whole collection run this fraction of --requests
+EXPORT_SHARE = 50
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+class SampleValues:
+    """
+    Random values for path and query parameters, drawn from the seeded data
+    so detail routes hit real documents and the search cache rarely hits.
+    """
+
+    def __init__(self, db, rng: random.Random):
+        self.rng = rng
+        self.slugs = [d["slug"] for d in db["departments"].find({}, {"slug": 1})]
+        self.faculty_ids = [str(f["_id"]) for f in db["faculties"].find({}, {"_id": 1})]
+        self.pub_ids = [
+            str(p["_id"]) for p in db["publications"].find({}, {"_id": 1}).limit(50_000)
+        ]
+        self.makers: Dict[str, Callable[[], str]] = {
+            "slug": lambda: rng.choice(self.slugs),
+            "faculty_id": lambda: rng.choice(self.faculty_ids),
+            "pub_id": lambda: rng.choice(self.pub_ids),
+            "q": lambda: " ".join(rng.sample(WORDS, 2)),
+            "prefix": lambda: rng.choice(WORDS)[: rng.randint(2, 4)],
+        }
+
+    def path_for(self, template: str, parameters: List[dict]) -> str:
+        path = template
+        query = []
+        for param in parameters:
+            if not param.get("required"):
+                continue
+            maker = self.makers.get(param["name"])
+            if maker is None:
+                raise SystemExit(
+                    f"No sample value for required parameter {param['name']!r} "
+                    f"of {template}; add one to SampleValues.makers"
+                )
+            if param["in"] == "path":
+                path = path.replace("{" + param["name"] + "}", maker())
+            else:
+                query.append(f"{param['name']}={maker()}")
+        return path + ("?" + "&".join(query) if query else "")
+
+
+def get_routes(app) -> List[tuple]:
+    """
+    (template, parameters) for every GET operation in the OpenAPI schema.
+    """
+    routes = []
+    for template, operations in app.openapi()["paths"].items():
+        if "get" in operations:
+            routes.append((template, operations["get"].get("parameters", [])))
+    return routes
+
+
+# --------------------------------------------------------
+# Backends
+# --------------------------------------------------------
+def count_collection_calls(counter: Counter) -> None:
+    """
+    mongomock emits no command events; count the collection methods the
+    services call instead.
+    """
+    from mongomock.collection import Collection
+
+    for name in (
+        "find",
+        "find_one",
+        "aggregate",
+        "count_documents",
+        "estimated_document_count",
+        "distinct",
+    ):
+        original = getattr(Collection, name)
+
+        def counted(self, *args, _name=name, _original=original, **kwargs):
+            counter[_name] += 1
+            return _original(self, *args, **kwargs)
+
+        setattr(Collection, name, counted)
+
+
+def open_backend(stand_in: bool, counter: QueryCounter):
+    """
+    Point app.core.db at the benchmark database and return a sync handle to
+    it for seeding.
+    """
+    os.environ["MONGO_URI"] = BENCH_MONGO_URI
+    os.environ["DB_NAME"] = BENCH_DB_NAME
+    if not stand_in:
+        from pymongo import monitoring
+
+        # global listener: also covers the clients the app creates later
+        monitoring.register(counter)
+        return connect()[BENCH_DB_NAME]
+
+    if os.getenv("DB_DRIVER", "sync") != "sync":
+        raise SystemExit("--stand-in only supports DB_DRIVER=sync")
+    try:
+        import mongomock
+    except ImportError:
+        raise SystemExit("--stand-in needs mongomock: pip install mongomock")
+
+    from app.core import db
+
+    client = mongomock.MongoClient()
+    db.get_client = functools.lru_cache(maxsize=None)(lambda: client)
+    count_collection_calls(counter.commands)
+    return client[BENCH_DB_NAME]
+
+
+# --------------------------------------------------------
+# Load
+# --------------------------------------------------------
+async def bench_route(client, paths: List[str], concurrency: int, counter):
+    samples = []
+    errors = 0
+    queue = iter(paths)
+
+    async def worker():
+        nonlocal errors
+        for path in queue:
+            start = time.perf_counter()
+            response = await client.get(path)
+            samples.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    await client.get(paths[0])  # first call may build caches or indexes
+    counter.reset()
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    queries = counter.total
+
+    samples.sort()
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "rps": round(len(samples) / elapsed, 1),
+        "mean": round(sum(samples) / len(samples), 3),
+        "p50": round(percentile(samples, 0.50), 3),
+        "p95": round(percentile(samples, 0.95), 3),
+        "p99": round(percentile(samples, 0.99), 3),
+        "queriesPerRequest": round(queries / len(samples), 2),
+    }
+
+
+async def run(values: SampleValues, requests: int, concurrency: int, counter):
+    import httpx
+    from main import app
+
+    results = []
+    async with app.router.lifespan_context(app):
+        # an unhandled error counts as a failed request, not a failed run
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            for template, parameters in get_routes(app):
+                n = requests
+                if template.endswith("/export"):
+                    n = max(2, requests // EXPORT_SHARE)
+                paths = [values.path_for(template, parameters) for _ in range(n)]
+                result = await bench_route(client, paths, concurrency, counter)
+                results.append({"route": f"GET {template}", **result})
+    return results
+
+
+# --------------------------------------------------------
+# Output
+# --------------------------------------------------------
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: List[dict], baseline: Optional[dict]) -> None:
+    before = {r["route"]: r for r in (baseline or {}).get("routes", [])}
+    headers = ["route", "req", "err", "req/s", "p50 ms", "p95 ms", "p99 ms", "q/req"]
+    if baseline:
+        headers += ["Δp50", "Δp95"]
+    rows = []
+    for r in results:
+        row = [
+            r["route"],
+            r["requests"],
+            r["errors"],
+            f"{r['rps']:.0f}",
+            f"{r['p50']:.2f}",
+            f"{r['p95']:.2f}",
+            f"{r['p99']:.2f}",
+            f"{r['queriesPerRequest']:.1f}",
+        ]
+        if baseline:
+            old = before.get(r["route"])
+            for key in ("p50", "p95"):
+                row.append(
+                    f"{(r[key] / old[key] - 1) * 100:+.0f}%"
+                    if old and old[key]
+                    else "new"
+                )
+        rows.append(row)
+    print_table(headers, rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_api")
+    parser.add_argument("--scale", choices=list(SCALES), default="1k")
+    parser.add_argument(
+        "--stand-in", action="store_true", help="in-process mongomock database"
+    )
+    parser.add_argument("--requests", type=int, default=200, help="per route")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--output", help="results file (default: benchmarks/results/)")
+    parser.add_argument("--compare", help="previous results file to diff against")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    counter = QueryCounter()
+    bench_db = open_backend(args.stand_in, counter)
+    publications, faculties, departments = SCALES[args.scale]
+
+    start = time.perf_counter()
+    seed(
+        bench_db,
+        departments=departments,
+        faculties=faculties,
+        publications=publications,
+        random_seed=args.seed,
+    )
+    if not args.stand_in:
+        from app.core.indexes import ensure_indexes
+
+        ensure_indexes(bench_db)
+    seed_seconds = time.perf_counter() - start
+    values = SampleValues(bench_db, random.Random(args.seed))
+
+    results = asyncio.run(run(values, args.requests, args.concurrency, counter))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "revision": git_revision(),
+            "backend": "mongomock" if args.stand_in else "mongod",
+            "driver": os.getenv("DB_DRIVER", "sync"),
+            "scale": args.scale,
+            "publications": publications,
+            "faculties": faculties,
+            "departments": departments,
+            "requestsPerRoute": args.requests,
+            "concurrency": args.concurrency,
+            "seedSeconds": round(seed_seconds, 2),
+            "python": platform.python_version(),
+        },
+        "routes": results,
+    }
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = os.path.join(
+            RESULTS_DIR, f"api-{args.scale}-{report['meta']['backend']}-{stamp}.json"
+        )
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    meta = report["meta"]
+    print(
+        f"\n{meta['backend']} ({meta['driver']} driver), {args.scale}: "
+        f"{publications:,} publications, {faculties:,} faculties, "
+        f"{departments} departments; {args.requests} requests per route, "
+        f"{args.concurrency} concurrent\n"
+    )
+    print_results(results, baseline)
+    print(f"\nSaved {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Throughput and tail latency of the API under concurrent load with the sync
+driver (threadpool handlers over MongoClient) and the async driver (coroutine
+handlers over AsyncMongoClient).
+
+Each driver runs in its own subprocess, since DB_DRIVER is read when `main` is
+imported. Requests go through httpx's ASGI transport, so the numbers measure
+the app and the database, not a network stack.
+
+    python -m benchmarks.bench_async_load [requests] [concurrency]
+"""
+
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+from benchmarks.common import (
+    BENCH_DB_NAME,
+    BENCH_MONGO_URI,
+    connect,
+    percentile,
+    print_table,
+    seed,
+)
+
+DRIVERS = ["sync", "async"]
+
+
+def request_paths(db, n, rng):
+    """
+    A mix of detail and list requests over many distinct ids, so neither the
+    search cache nor single-flight coalescing hides the database work.
+    """
+    slugs = [d["slug"] for d in db["departments"].find({}, {"slug": 1})]
+    faculty_ids = [str(f["_id"]) for f in db["faculties"].find({}, {"_id": 1})]
+    pub_ids = [str(p["_id"]) for p in db["publications"].find({}, {"_id": 1})]
+    makers = [
+        lambda: f"/api/v1/faculties/{rng.choice(faculty_ids)}",
+        lambda: f"/api/v1/publications/{rng.choice(pub_ids)}",
+        lambda: f"/api/v1/publications/?limit={rng.randint(10, 50)}",
+        lambda: f"/api/v1/departments/{rng.choice(slugs)}",
+    ]
+    return [rng.choice(makers)() for _ in range(n)]
+
+
+async def run_load(paths, concurrency):
+    import httpx
+    from main import app
+
+    samples = []
+    errors = 0
+    queue = iter(paths)
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+
+            async def worker():
+                nonlocal errors
+                for path in queue:
+                    start = time.perf_counter()
+                    response = await client.get(path)
+                    samples.append((time.perf_counter() - start) * 1000)
+                    if response.status_code != 200:
+                        errors += 1
+
+            await client.get(paths[0])  # warm up the connection pool
+            start = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            elapsed = time.perf_counter() - start
+
+    samples.sort()
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "rps": len(samples) / elapsed,
+        "p50": percentile(samples, 0.50),
+        "p95": percentile(samples, 0.95),
+        "p99": percentile(samples, 0.99),
+    }
+
+
+def worker_main(paths_file, concurrency):
+    with open(paths_file) as f:
+        paths = json.load(f)
+    print(json.dumps(asyncio.run(run_load(paths, concurrency))))
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    client = connect()
+    db = client[BENCH_DB_NAME]
+    seed(db, faculties=500, publications=20_000, authors_per_publication=3)
+    paths = request_paths(db, n, random.Random(7))
+    client.close()
+
+    paths_file = os.path.join(os.path.dirname(__file__), ".async_load_paths.json")
+    with open(paths_file, "w") as f:
+        json.dump(paths, f)
+
+    rows = []
+    try:
+        for driver in DRIVERS:
+            env = {
+                **os.environ,
+                "DB_DRIVER": driver,
+                "MONGO_URI": BENCH_MONGO_URI,
+                "DB_NAME": BENCH_DB_NAME,
+            }
+            out = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "benchmarks.bench_async_load",
+                    "--worker",
+                    paths_file,
+                    str(concurrency),
+                ],
+                env=env,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            r = json.loads(out.strip().splitlines()[-1])
+            rows.append(
+                [
+                    driver,
+                    r["requests"],
+                    r["errors"],
+                    f"{r['rps']:.0f}",
+                    f"{r['p50']:.1f}",
+                    f"{r['p95']:.1f}",
+                    f"{r['p99']:.1f}",
+                ]
+            )
+    finally:
+        os.remove(paths_file)
+
+    print(f"\n{n} requests, {concurrency} concurrent\n")
+    print_table(
+        ["driver", "requests", "errors", "req/s", "p50 ms", "p95 ms", "p99 ms"], rows
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--worker":
+        worker_main(sys.argv[2], int(sys.argv[3]))
+    else:
+        main()
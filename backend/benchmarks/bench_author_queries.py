@@ -0,0 +1,69 @@
+"""
+Counts the MongoDB commands issued per request by the publication list,
+publication detail and search paths, next to the old per-publication author
+lookup for comparison.
+
+    python -m benchmarks.bench_author_queries [publications]
+"""
+
+import sys
+
+from bson import ObjectId
+
+from app.modules.publication import service as publication_service
+from app.modules.search import service as search_service
+from benchmarks.common import BENCH_DB_NAME, QueryCounter, connect, print_table, seed, timed
+
+
+def legacy_list_publications(db, limit):
+    """
+    The previous implementation: one faculties query per publication.
+    """
+    results = []
+    for doc in db["publications"].find({}).limit(limit):
+        authors = []
+        for a in doc.get("authors", []):
+            try:
+                authors.append(ObjectId(a))
+            except Exception:
+                pass
+        faculty_cursor = db["faculties"].find(
+            {"_id": {"$in": authors}}, {"_id": 1, "name": 1, "position": 1}
+        )
+        results.append({"_id": str(doc["_id"]), "authors": list(faculty_cursor)})
+    return results
+
+
+def main():
+    publications = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    counter = QueryCounter()
+    client = connect(counter)
+    db = client[BENCH_DB_NAME]
+    seed(db, publications=publications)
+
+    page_size = publication_service.DEFAULT_PAGE_SIZE
+    some_pub_id = str(db["publications"].find_one({}, {"_id": 1})["_id"])
+
+    cases = [
+        ("legacy list (N+1)", lambda: legacy_list_publications(db, page_size)),
+        ("list", lambda: publication_service.get_publications_page(db, page_size)),
+        ("detail", lambda: publication_service.get_publication_by_id(db, some_pub_id)),
+        ("search", lambda: search_service.search_publications(db, "learning")),
+    ]
+
+    rows = []
+    for name, fn in cases:
+        counter.reset()
+        fn()
+        commands = dict(counter.commands)
+        _, best_ms = timed(fn, repeat=3)
+        rows.append([name, sum(commands.values()), commands, f"{best_ms:.1f}"])
+
+    print(f"\nPublications seeded: {publications}, page size: {page_size}\n")
+    print_table(["path", "commands", "breakdown", "best ms"], rows)
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Latency of the faculty profile: the single `$lookup` aggregation against the
+previous three sequential queries (faculty, departments, publications) with
+their ObjectId -> str -> ObjectId round trips.
+
+    python -m benchmarks.bench_faculty_profile [iterations]
+"""
+
+import statistics
+import sys
+import time
+
+from bson import ObjectId
+
+from app.modules.faculty import service as faculty_service
+from benchmarks.common import BENCH_DB_NAME, QueryCounter, connect, print_table, seed
+
+
+def legacy_get_faculty(db, faculty_id):
+    """
+    The previous controller + service path, kept here for comparison.
+    """
+    doc = db["faculties"].find_one({"_id": ObjectId(faculty_id)})
+    doc["_id"] = str(doc["_id"])
+    for key in ("departmentIds", "articleIds", "conferencePaperIds"):
+        doc[key] = [str(x) for x in doc.get(key, [])]
+
+    dept_ids = [ObjectId(s) for s in doc["departmentIds"]]
+    departments = [
+        {"_id": str(d["_id"]), "name": d["name"], "slug": d["slug"]}
+        for d in db["departments"].find(
+            {"_id": {"$in": dept_ids}}, {"name": 1, "slug": 1}
+        )
+    ]
+
+    pub_ids = [ObjectId(s) for s in doc["articleIds"] + doc["conferencePaperIds"]]
+    publications = [
+        {
+            "_id": str(p["_id"]),
+            "title": p.get("title"),
+            "kind": p.get("kind"),
+            "keywords": p.get("keywords", []),
+        }
+        for p in db["publications"].find(
+            {"_id": {"$in": pub_ids}}, {"title": 1, "kind": 1, "keywords": 1}
+        )
+    ]
+
+    return {
+        "_id": doc["_id"],
+        "name": doc.get("name"),
+        "position": doc.get("position"),
+        "researchInterest": doc.get("researchInterest"),
+        "departments": departments,
+        "articles": [p for p in publications if p.get("kind") == "article"],
+        "conferencePapers": [p for p in publications if p.get("kind") == "conference"],
+    }
+
+
+def latencies(fn, ids, iterations):
+    samples = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        fn(ids[i % len(ids)])
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    counter = QueryCounter()
+    client = connect(counter)
+    db = client[BENCH_DB_NAME]
+    seed(db, faculties=500, publications=20_000, authors_per_publication=3)
+    ids = [str(f["_id"]) for f in db["faculties"].find({}, {"_id": 1}).limit(100)]
+
+    cases = [
+        ("legacy (3 queries)", lambda fid: legacy_get_faculty(db, fid)),
+        ("aggregation", lambda fid: faculty_service.get_faculty_profile(db, fid)),
+    ]
+
+    rows = []
+    for name, fn in cases:
+        fn(ids[0])  # warm up
+        counter.reset()
+        samples = latencies(fn, ids, iterations)
+        rows.append(
+            [
+                name,
+                f"{counter.total / iterations:.1f}",
+                f"{statistics.median(samples):.2f}",
+                f"{samples[int(len(samples) * 0.95) - 1]:.2f}",
+                f"{samples[int(len(samples) * 0.99) - 1]:.2f}",
+            ]
+        )
+
+    print(f"\nFaculty profile, {iterations} requests\n")
+    print_table(["path", "commands/req", "p50 ms", "p95 ms", "p99 ms"], rows)
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
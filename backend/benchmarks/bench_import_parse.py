@@ -0,0 +1,129 @@
+"""
+Throughput of the import's parse/resolve stage (scripts/import_excel.py)
+by number of parse workers, on a synthetic sheet. No database is involved:
+this is the CPU side that `--workers` spreads over a process pool.
+
+- parse: parse_rows alone (departments, titles, keywords, slugs)
+- parse + resolve: the whole resolve_catalogue, including the in-order
+  merge that stays on one core
+
+It also times reading, parsing and merging separately, inline, and prints
+the speed-up those bound parse workers to (Amdahl's law): reading and the
+merge stay on one core.
+
+The sheet is a .csv by default because its reader is fast enough not to
+hide the parse stage; --format xlsx shows the end-to-end picture. Unless
+--chunk-size is given, chunks are sized so every worker gets at least four
+(at most 500 rows each), so small sheets don't collapse into one chunk.
+
+Scaling needs as many free cores as workers; the importer defaults to
+--workers 1 until it has been measured on a multi-core machine. On a
+single core the pool is pure overhead.
+
+    python -m benchmarks.bench_import_parse [--rows 50000] [--workers 1 2 4]
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+from typing import Tuple
+
+from benchmarks.common import BENCH_DB_NAME, BENCH_MONGO_URI, print_table
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "scripts")
+sys.path.insert(0, SCRIPTS_DIR)
+
+# import_excel refuses to load without these
+os.environ.setdefault("MONGO_URI", BENCH_MONGO_URI)
+os.environ.setdefault("DB_NAME", BENCH_DB_NAME)
+
+import import_excel  # noqa: E402
+from benchmarks.bench_sheet_reader import sheet  # noqa: E402
+from sheet_reader import SheetReader  # noqa: E402
+
+
+def run_parse(path: str, workers: int, chunk_size: int) -> int:
+    with SheetReader(path) as rows:
+        return sum(1 for _ in import_excel.parse_rows(rows, workers, chunk_size))
+
+
+def run_resolve(path: str, workers: int, chunk_size: int) -> int:
+    with SheetReader(path) as rows:
+        _, faculties, _ = import_excel.resolve_catalogue(
+            rows, workers=workers, chunk_size=chunk_size
+        )
+    return len(faculties)
+
+
+def serial_share(path: str) -> Tuple[float, float, float]:
+    """
+    (read, inline parse, merge) seconds. Reading the sheet and merging the
+    parsed rows stay on one core whatever --workers is.
+    """
+    start = time.perf_counter()
+    with SheetReader(path) as rows:
+        sheet_rows = list(rows)
+    read = time.perf_counter() - start
+    start = time.perf_counter()
+    parsed = list(import_excel.parse_rows(sheet_rows, 1, 1))
+    parse = time.perf_counter() - start
+    resolver = import_excel.CatalogueResolver()
+    with import_excel.gc_paused():
+        start = time.perf_counter()
+        for row in parsed:
+            resolver.add(row)
+        merge = time.perf_counter() - start
+    return read, parse, merge
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_import_parse")
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+    )
+    parser.add_argument("--chunk-size", type=int)
+    parser.add_argument("--format", choices=["csv", "xlsx"], default="csv")
+    args = parser.parse_args()
+
+    path = sheet(args.rows, "." + args.format)
+    rows = []
+    baseline = {}
+    for workers in args.workers:
+        chunk_size = args.chunk_size or min(500, math.ceil(args.rows / (4 * workers)))
+        for label, fn in (("parse", run_parse), ("parse + resolve", run_resolve)):
+            start = time.perf_counter()
+            fn(path, workers, chunk_size)
+            elapsed = time.perf_counter() - start
+            baseline.setdefault(label, elapsed)
+            rows.append(
+                [
+                    label,
+                    workers,
+                    chunk_size,
+                    f"{elapsed:.2f}",
+                    f"{args.rows / elapsed:,.0f}",
+                    f"{baseline[label] / elapsed:.2f}x",
+                ]
+            )
+
+    read, parse, merge = serial_share(path)
+
+    print(f"\n{args.rows:,} rows ({args.format}), {os.cpu_count()} cores\n")
+    print_table(["stage", "workers", "chunk", "s", "rows/s", "speed-up"], rows)
+    serial = read + merge
+    print(
+        f"\nInline: read {read:.2f}s, parse {parse:.2f}s, merge {merge:.2f}s. "
+        f"Reading and merging stay on one core, so parse workers can speed "
+        f"parse + resolve up by at most {(serial + parse) / serial:.1f}x, "
+        f"less the pickling between processes."
+    )
+
+
+if __name__ == "__main__":
+    main()
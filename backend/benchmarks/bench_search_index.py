@@ -0,0 +1,68 @@
+"""
+Compares the inverted keyword index against the regex scan for publication
+search on a synthetic corpus (100k publications by default).
+
+    python -m benchmarks.bench_search_index [publications]
+"""
+
+import sys
+import time
+
+from app.core.text import tokenize
+from app.modules.search import index
+from app.modules.search import service as search_service
+from benchmarks.common import BENCH_DB_NAME, connect, print_table, seed, timed
+
+QUERIES = [
+    ("learning", "and"),
+    ("neural network", "and"),
+    ("quantum blockchain healthcare", "and"),
+    ("malware forensics", "or"),
+    ("nonexistentterm", "and"),
+]
+
+
+def main():
+    publications = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    client = connect()
+    db = client[BENCH_DB_NAME]
+    print(f"Seeding {publications} publications...")
+    seed(db, faculties=2000, publications=publications)
+
+    start = time.perf_counter()
+    built = index.build_publication_index(db)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"Index build: {build_ms:.0f} ms, {len(built.postings)} terms\n")
+    index.publication_index.get(db)  # warm the shared holder
+
+    rows = []
+    for q, op in QUERIES:
+        _, regex_ms = timed(
+            lambda: search_service.search_publications(db, q, mode="regex"), repeat=3
+        )
+        (_, total, _), index_ms = timed(
+            lambda: search_service.search_publications(db, q, mode="index", op=op),
+            repeat=3,
+        )
+        # the tokens the service looks up for q
+        lookup_ms = timed(lambda: built.search(tokenize(q), op), repeat=10)[1]
+        rows.append(
+            [
+                f"{q} ({op})",
+                total,
+                f"{regex_ms:.1f}",
+                f"{index_ms:.1f}",
+                f"{lookup_ms:.2f}",
+                f"{regex_ms / max(index_ms, 0.001):.1f}x",
+            ]
+        )
+
+    print_table(
+        ["query", "matches", "regex ms", "index ms", "postings ms", "speedup"], rows
+    )
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Cost of turning a page of publications into response bytes. No database is
+involved: the payload is a synthetic list shaped like the service output.
+
+- jsonable_encoder + json: what `response_model=dict` cost on FastAPI
+  versions before the pydantic fast path (encoder walk, then stdlib json)
+- dict model (pydantic): FastAPI's current path for `response_model=dict`,
+  validate then dump_json
+- typed envelope (pydantic): the same for PublicationPage, the declared
+  response_model
+- orjson response: `json_response`, what the handlers return now
+
+Handlers return a Response, so FastAPI never checks them against their
+response_model. Before timing, the payload (built by the service's own
+serialiser) is validated against the declared PublicationPage envelope,
+and the envelope's dump must equal the served bytes key for key.
+
+    python -m benchmarks.bench_serialisation [publications]
+"""
+
+import json
+import random
+import sys
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.core.responses import json_response
+from app.core.utils import encode_cursor, send_response
+from app.modules.publication.schemas import PublicationPage
+from app.modules.publication.service import _join_authors
+from benchmarks.common import WORDS, POSITIONS, print_table, random_title, timed
+
+
+def make_payload(n: int, rng: random.Random) -> dict:
+    faculties = [
+        {"_id": ObjectId(), "name": f"Faculty {i}", "position": rng.choice(POSITIONS)}
+        for i in range(200)
+    ]
+    docs = [
+        {
+            "_id": ObjectId(),
+            "title": random_title(rng),
+            "kind": rng.choice(["article", "conference"]),
+            "keywords": rng.sample(WORDS, 4),
+        }
+        for _ in range(n)
+    ]
+    author_ids = [[f["_id"] for f in rng.sample(faculties, 3)] for _ in docs]
+    # same shape and meta as GET /api/v1/publications
+    return send_response(
+        _join_authors(docs, author_ids, faculties),
+        status_code=200,
+        message="Publications retrieved successfully",
+        meta={
+            "total": n,
+            "limit": n,
+            "count": n,
+            "hasMore": True,
+            "nextCursor": encode_cursor(docs[-1]["_id"]),
+        },
+    )
+
+
+def check_contract(payload: dict, adapter: TypeAdapter, served: bytes) -> None:
+    """
+    Fails unless the served bytes are exactly what the declared envelope
+    would produce from the same payload: same fields, values and key order.
+    """
+    declared = adapter.dump_json(adapter.validate_python(payload), by_alias=True)
+    if declared != served:
+        at = next(
+            (i for i, (a, b) in enumerate(zip(declared, served)) if a != b),
+            min(len(declared), len(served)),
+        )
+        raise SystemExit(
+            "served payload differs from PublicationPage at byte "
+            f"{at}:\n  declared {declared[max(at - 40, 0) : at + 40]!r}"
+            f"\n  served   {served[max(at - 40, 0) : at + 40]!r}"
+        )
+
+
+def stdlib_json(content) -> bytes:
+    # starlette JSONResponse.render
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    payload = make_payload(n, random.Random(42))
+
+    dict_adapter = TypeAdapter(dict)
+    typed_adapter = TypeAdapter(PublicationPage)
+    check_contract(
+        payload,
+        typed_adapter,
+        json_response(
+            payload["data"], message=payload["message"], meta=payload["meta"]
+        ).body,
+    )
+
+    cases = [
+        ("jsonable_encoder + json", lambda: stdlib_json(jsonable_encoder(payload))),
+        (
+            "dict model (pydantic)",
+            lambda: dict_adapter.dump_json(dict_adapter.validate_python(payload)),
+        ),
+        (
+            "typed envelope (pydantic)",
+            lambda: typed_adapter.dump_json(
+                typed_adapter.validate_python(payload), by_alias=True
+            ),
+        ),
+        (
+            "orjson response",
+            lambda: json_response(
+                payload["data"], message=payload["message"], meta=payload["meta"]
+            ).body,
+        ),
+    ]
+
+    rows = []
+    baseline = None
+    for name, fn in cases:
+        body, ms = timed(fn, repeat=5)
+        baseline = baseline or ms
+        rows.append([name, f"{ms:.1f}", f"{ms / baseline:.2f}x", f"{len(body):,}"])
+
+    print(f"\nSerialising {n:,} publications (best of 5)\n")
+    print_table(["path", "ms", "vs baseline", "bytes"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Time and peak memory of reading the spreadsheet the way the import scripts
+used to (pandas read_excel/read_csv/read_parquet + iterrows) versus
+scripts/sheet_reader.py streaming rows, at two sheet sizes so memory growth
+shows up. No database is involved.
+
+Each measurement runs in a fresh process and reports the growth of its peak
+RSS while reading, so C-level allocations (lxml, numpy, Arrow) count too.
+Sheets come from scripts/generate_dataset.py and are cached in the temp
+directory; Parquet is skipped without pyarrow.
+
+    python -m benchmarks.bench_sheet_reader [--rows 10000 50000]
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "scripts")
+sys.path.insert(0, SCRIPTS_DIR)
+
+from benchmarks.common import print_table  # noqa: E402
+from generate_dataset import WRITERS, Generator  # noqa: E402
+from sheet_reader import FORMATS, SheetReader  # noqa: E402
+
+
+def read_pandas(path: str) -> int:
+    import pandas as pd
+
+    if path.endswith(".xlsx"):
+        df = pd.read_excel(path, engine="openpyxl", dtype=str)
+    elif path.endswith(".csv"):
+        df = pd.read_csv(path, dtype=str)
+    else:
+        df = pd.read_parquet(path)
+    df = df.fillna("")
+    chars = 0
+    for _, row in df.iterrows():
+        chars += len(row.get("Article", "")) + len(row.get("Conference Paper", ""))
+    return chars
+
+
+def read_streaming(path: str) -> int:
+    chars = 0
+    with SheetReader(path) as rows:
+        for _, row in rows:
+            chars += len(row.article) + len(row.conference_paper)
+    return chars
+
+
+READERS = {"pandas + iterrows": read_pandas, "sheet_reader": read_streaming}
+
+
+def _status_kb(field: str) -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    raise KeyError(field)
+
+
+def reset_peak_rss() -> int:
+    """
+    Start a new peak-RSS window; returns the baseline in KB. On Linux the
+    high-water mark is reset, so start-up and import peaks don't hide a
+    small reader; elsewhere it falls back to the process-wide peak.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return _status_kb("VmRSS")
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def peak_rss() -> int:
+    try:
+        return _status_kb("VmHWM")
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(reader: str, path: str):
+    """
+    Runs in a fresh process: (seconds, peak RSS growth in MB).
+    """
+    if reader == "pandas + iterrows":
+        import pandas  # noqa: F401  (import cost is not part of the read)
+    else:
+        import openpyxl  # noqa: F401
+    before = reset_peak_rss()
+    start = time.perf_counter()
+    READERS[reader](path)
+    elapsed = time.perf_counter() - start
+    return elapsed, (peak_rss() - before) / 1024
+
+
+def sheet(rows: int, ext: str) -> str:
+    path = os.path.join(tempfile.gettempdir(), f"bench-sheet-{rows}{ext}")
+    if not os.path.exists(path):
+        WRITERS[ext](path + ".partial" + ext, Generator(rows, 32, 0.3, 42).rows())
+        os.replace(path + ".partial" + ext, path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_sheet_reader")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 50_000])
+    args = parser.parse_args()
+
+    try:
+        import pyarrow  # noqa: F401
+
+        formats = FORMATS
+    except ImportError:
+        formats = tuple(f for f in FORMATS if f != ".parquet")
+        print("pyarrow not installed: skipping Parquet")
+
+    spawn = multiprocessing.get_context("spawn")
+    table = []
+    for ext in formats:
+        for rows in args.rows:
+            path = sheet(rows, ext)
+            size_mb = os.path.getsize(path) / 1_048_576
+            for reader in READERS:
+                with ProcessPoolExecutor(1, mp_context=spawn) as pool:
+                    seconds, peak_mb = pool.submit(measure, reader, path).result()
+                table.append(
+                    [
+                        ext,
+                        f"{rows:,}",
+                        f"{size_mb:.1f}",
+                        reader,
+                        f"{seconds:.2f}",
+                        f"{rows / seconds:,.0f}",
+                        f"{peak_mb:.1f}",
+                    ]
+                )
+
+    print()
+    print_table(
+        ["format", "rows", "file MB", "reader", "s", "rows/s", "peak RSS +MB"], table
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Build time and memory footprint of the in-memory catalogue snapshot
+(CATALOGUE_SNAPSHOT=true), and read latency served from it versus MongoDB.
+
+- build: best-of wall time of `Snapshot.build`
+- memory: bytes still allocated after a build (tracemalloc, measured on a
+  separate build since tracing slows it down) and the snapshot's own
+  `approxBytes` estimate reported on /stats
+- reads: mean latency of the service calls behind the read endpoints, with
+  the snapshot on and off
+
+    python -m benchmarks.bench_snapshot [--scale 1k|100k|1m] [--stand-in]
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from benchmarks.bench_api import SCALES, open_backend
+from benchmarks.common import WORDS, QueryCounter, print_table, seed
+
+
+def mean_ms(fn, args_list) -> float:
+    start = time.perf_counter()
+    for args in args_list:
+        fn(*args)
+    return (time.perf_counter() - start) * 1000 / len(args_list)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_snapshot")
+    parser.add_argument("--scale", choices=list(SCALES), default="100k")
+    parser.add_argument(
+        "--stand-in", action="store_true", help="in-process mongomock database"
+    )
+    parser.add_argument("--calls", type=int, default=200, help="per read operation")
+    args = parser.parse_args()
+
+    bench_db = open_backend(args.stand_in, QueryCounter())
+    publications, faculties, departments = SCALES[args.scale]
+    seed(
+        bench_db,
+        departments=departments,
+        faculties=faculties,
+        publications=publications,
+    )
+
+    # imported after open_backend: the services read the environment
+    from app.core import snapshot
+    from app.modules.department import service as departments_service
+    from app.modules.faculty import service as faculty_service
+    from app.modules.publication import service as publication_service
+    from app.modules.search import service as search_service
+
+    builds = []
+    for _ in range(3):
+        start = time.perf_counter()
+        snap = snapshot.Snapshot.build(bench_db, 0)
+        builds.append(time.perf_counter() - start)
+        del snap
+        gc.collect()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    # the snapshot the services read from below
+    snap = snapshot.holder.load(bench_db)
+    traced = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    stats = snap.stats()
+
+    print(
+        f"\nSnapshot of {publications:,} publications, {faculties:,} faculties, "
+        f"{departments} departments ({'mongomock' if args.stand_in else 'mongod'})\n"
+    )
+    print_table(
+        ["build s (best of 3)", "traced MB", "approxBytes MB", "keywords"],
+        [
+            [
+                f"{min(builds):.2f}",
+                f"{traced / 1_048_576:.1f}",
+                f"{stats['approxBytes'] / 1_048_576:.1f}",
+                f"{stats['keywords']:,}",
+            ]
+        ],
+    )
+
+    rng = random.Random(7)
+    slugs = [d["slug"] for d in bench_db["departments"].find({}, {"slug": 1})]
+    pub_ids = [snap.publications.hex(i) for i in range(len(snap.publications))]
+    fac_ids = [snap.faculties.hex(i) for i in range(len(snap.faculties))]
+    n = args.calls
+    queries = [" ".join(rng.sample(WORDS, 2)) for _ in range(n)]
+
+    operations = [
+        (
+            "department detail",
+            departments_service.get_department_detail,
+            [(bench_db, rng.choice(slugs)) for _ in range(n)],
+        ),
+        (
+            "faculty profile",
+            faculty_service.get_faculty_profile,
+            [(bench_db, rng.choice(fac_ids)) for _ in range(n)],
+        ),
+        (
+            "publication by id",
+            publication_service.get_publication_by_id,
+            [(bench_db, rng.choice(pub_ids)) for _ in range(n)],
+        ),
+        (
+            "publications page (50)",
+            publication_service.get_publications_page,
+            [(bench_db, 50) for _ in range(n)],
+        ),
+        (
+            "search (index)",
+            search_service.search_publications,
+            [(bench_db, q) for q in queries],
+        ),
+    ]
+
+    rows = []
+    for label, fn, calls in operations:
+        snapshot.CATALOGUE_SNAPSHOT = True
+        on = mean_ms(fn, calls)
+        snapshot.CATALOGUE_SNAPSHOT = False
+        try:
+            off = f"{mean_ms(fn, calls):.3f}"
+        except NotImplementedError:
+            # mongomock lacks $lookup with a pipeline
+            off = "n/a"
+        rows.append([label, off, f"{on:.3f}"])
+
+    print()
+    print_table(["read (mean ms)", "MongoDB", "snapshot"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Per-call cost of the import's text helpers before and after they moved to
+app.core.text: keyword extraction per title, slugify and the CS-department
+heuristic per affiliation, on titles and affiliations from the synthetic
+dataset generator. The old implementations are copied here verbatim, and
+the two are checked to give identical results before timing.
+
+The generated sheet repeats a few dozen affiliations, which is what the
+CS-department memo is for; "is_cs_department, distinct" gives every call a
+new string, so it times the matcher plus a memo miss rather than cache hits.
+
+Keyword extraction comes out at roughly 2x per title, short of the several
+times the text-module work aimed for: after the translate/split, what is
+left is the dedupe and stop-word filter, already one dict and one set
+lookup per word.
+
+    python -m benchmarks.bench_text [--rows 2000]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+from benchmarks.common import BENCH_DB_NAME, BENCH_MONGO_URI, print_table
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "scripts")
+sys.path.insert(0, SCRIPTS_DIR)
+
+# import_excel refuses to load without these
+os.environ.setdefault("MONGO_URI", BENCH_MONGO_URI)
+os.environ.setdefault("DB_NAME", BENCH_DB_NAME)
+
+import import_excel  # noqa: E402
+from app.core import text  # noqa: E402
+from generate_dataset import Generator  # noqa: E402
+
+# --------------------------------------------------------
+# Before: scripts/import_excel.py as it was
+# --------------------------------------------------------
+# fmt: off
+OLD_STOP_WORDS = set(
+    [
+        "a", "an", "the", "in", "on", "of", "for", "and", "or", "to", "with",
+        "by", "from", "at", "as", "into", "about", "over", "under", "between",
+        "through", "without", "within", "across", "is", "are", "be", "this",
+        "that", "these", "those", "overview",
+    ]
+)
+# fmt: on
+
+
+def old_slugify(value: str) -> str:
+    s = value.strip().lower()
+    s = s.replace("&", "and")
+    s = re.sub(r"[^a-z0-9]+", "-", s)
+    s = re.sub(r"-+", "-", s).strip("-")
+    return s
+
+
+def old_extract_keywords_from_title(title: str):
+    cleaned = re.sub(r"[^a-z0-9]+", " ", title.lower())
+    tokens = [
+        t for t in cleaned.split() if t and t not in OLD_STOP_WORDS and len(t) > 2
+    ]
+    seen = set()
+    result = []
+    for t in tokens:
+        if t not in seen:
+            seen.add(t)
+            result.append(t)
+    return result
+
+
+def old_is_cs_department(name: str) -> bool:
+    lower = name.lower()
+    keywords = [
+        "computer science",
+        "software engineering",
+        "cybersecurity",
+        "cyber security",
+        "artificial intelligence",
+        "applied ai",
+        "ai & robotics",
+        "data science",
+        "computer science research group",
+        "software engineering & cybersecurity",
+        "ai robotics",
+    ]
+    for kw in keywords:
+        if kw in lower:
+            return True
+    return False
+
+
+def per_call_us(fn, inputs, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for value in inputs:
+            fn(value)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6 / len(inputs)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_text")
+    parser.add_argument("--rows", type=int, default=2000)
+    args = parser.parse_args()
+
+    titles, departments = [], []
+    for row in Generator(args.rows, 32, 0.3, 42).rows():
+        departments.extend(import_excel.parse_departments(row[3]))
+        for cell in row[4:6]:
+            titles.extend(import_excel.parse_publication_titles(cell))
+
+    cases = [
+        (
+            "keywords per title",
+            old_extract_keywords_from_title,
+            import_excel.extract_keywords_from_title,
+            titles,
+        ),
+        ("slugify", old_slugify, import_excel.slugify, departments),
+        (
+            "is_cs_department",
+            old_is_cs_department,
+            import_excel.is_cs_department,
+            departments,
+        ),
+        (
+            "is_cs_department, distinct",
+            old_is_cs_department,
+            import_excel.is_cs_department,
+            [f"{d} {i}" for i, d in enumerate(departments)],
+        ),
+    ]
+    for label, old, new, inputs in cases:
+        for value in inputs:
+            if old(value) != new(value):
+                raise SystemExit(f"{label} differs on {value!r}")
+
+    table = []
+    for label, old, new, inputs in cases:
+        before = per_call_us(old, inputs)
+        after = per_call_us(new, inputs)
+        table.append([label, f"{before:.2f}", f"{after:.2f}", f"{before / after:.1f}x"])
+    for label, kwargs in (
+        ("+ stemming", {"stem": True}),
+        ("+ bigrams", {"bigrams": True}),
+        ("+ stemming + bigrams", {"stem": True, "bigrams": True}),
+    ):
+        after = per_call_us(lambda t: text.tokenize(t, **kwargs), titles)
+        table.append([f"keywords per title {label}", "", f"{after:.2f}", ""])
+
+    print(
+        f"\n{len(titles):,} titles, {len(departments):,} affiliations "
+        f"({len(set(departments))} distinct)\n"
+    )
+    print_table(["operation", "before µs", "after µs", "speed-up"], table)
+
+
+if __name__ == "__main__":
+    main()
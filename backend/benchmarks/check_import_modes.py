@@ -0,0 +1,85 @@
+"""
+Parity check across the import modes: a generated sheet imported with
+`--mode row`, `--mode bulk` (inline and with parse workers) and
+`--mode incremental` must serve the same catalogue, keywords included.
+
+Keyword stemming and bigrams are switched on, since bigrams ("neural
+network") are the keywords that contain a space and have to survive the
+trip from the parse workers intact.
+
+Exits non-zero on the first failed check. Writes into BENCH_DB_NAME,
+dropping it first.
+
+    python -m benchmarks.check_import_modes [--rows 300] [--stand-in]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+
+# read by app.core.text when import_excel loads it
+os.environ["KEYWORD_STEMMING"] = "true"
+os.environ["KEYWORD_BIGRAMS"] = "true"
+
+from benchmarks.check_incremental_import import (  # noqa: E402
+    check,
+    open_client,
+    served,
+    write_sheet,
+)
+from benchmarks.common import BENCH_DB_NAME  # noqa: E402
+import import_excel  # noqa: E402
+from generate_dataset import Generator  # noqa: E402
+from sheet_reader import SheetReader  # noqa: E402
+
+MODES = {
+    "row": lambda db, rows: import_excel.import_row_by_row(db, rows),
+    "bulk": lambda db, rows: import_excel.import_bulk(
+        db, rows, 1000, import_excel.PhaseTimer()
+    ),
+    "bulk, 2 workers": lambda db, rows: import_excel.import_bulk(
+        db, rows, 1000, import_excel.PhaseTimer(), workers=2, chunk_size=50
+    ),
+    "incremental": lambda db, rows: import_excel.import_incremental(
+        db, rows, 1000, "auto", 0.3, import_excel.PhaseTimer()
+    ),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.check_import_modes")
+    parser.add_argument("--rows", type=int, default=300)
+    parser.add_argument(
+        "--stand-in", action="store_true", help="in-process mongomock database"
+    )
+    args = parser.parse_args()
+
+    client = open_client(args.stand_in)
+    sheet = os.path.join(tempfile.mkdtemp(prefix="check-modes-"), "sheet.csv")
+    write_sheet(sheet, Generator(args.rows, 8, 0.3, 7).rows())
+
+    catalogues = {}
+    for mode, run in MODES.items():
+        client.drop_database(BENCH_DB_NAME)
+        db = client[BENCH_DB_NAME]
+        with SheetReader(sheet) as rows, contextlib.redirect_stdout(io.StringIO()):
+            run(db, rows)
+        catalogues[mode] = served(db)
+
+    publications = catalogues["row"][2]
+    check(
+        any(" " in keyword for pub in publications for keyword in pub[2]),
+        "row mode stores bigram keywords",
+    )
+    for mode, catalogue in catalogues.items():
+        if mode != "row":
+            check(catalogue == catalogues["row"], f"{mode} matches row mode")
+
+    client.drop_database(BENCH_DB_NAME)
+    print("\nall checks passed")
+
+
+if __name__ == "__main__":
+    main()
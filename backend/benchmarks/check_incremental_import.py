@@ -0,0 +1,231 @@
+"""
+Parity checks for `import_excel.py --mode incremental`, on sheets from the
+synthetic dataset generator, for each --staging choice:
+
+- first run into an empty database: everything is added;
+- repeat run on the same sheet: reports no change and leaves every document
+  (ids included) as it was;
+- a sheet with one row added at the top (shifting every other row down), one
+  removed and one research interest edited: the number of documents written
+  equals the number that actually differ, every differing document belongs
+  to one of those three rows, and the result serves the same catalogue as a
+  fresh import of the edited sheet.
+
+Exits non-zero on the first failed check. Writes into BENCH_DB_NAME (and a
+second, suffixed database for the fresh import), dropping both first.
+
+    python -m benchmarks.check_incremental_import [--rows 300] [--stand-in]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+
+from benchmarks.common import BENCH_DB_NAME, BENCH_MONGO_URI, connect
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "scripts")
+sys.path.insert(0, SCRIPTS_DIR)
+
+# import_excel refuses to load without these
+os.environ.setdefault("MONGO_URI", BENCH_MONGO_URI)
+os.environ.setdefault("DB_NAME", BENCH_DB_NAME)
+
+import import_excel  # noqa: E402
+from generate_dataset import WRITERS, Generator  # noqa: E402
+from sheet_reader import SheetReader  # noqa: E402
+
+COLLECTIONS = (import_excel.COL_DEPT, import_excel.COL_FAC, import_excel.COL_PUB)
+
+
+def open_client(stand_in: bool):
+    if not stand_in:
+        return connect()
+    try:
+        import mongomock
+        from mongomock.collection import BulkOperationBuilder
+    except ImportError:
+        raise SystemExit("--stand-in needs mongomock: pip install mongomock")
+
+    # newer pymongo passes `sort` to the bulk operations; mongomock rejects it
+    for method in ("add_replace", "add_update", "add_delete"):
+        original = getattr(BulkOperationBuilder, method)
+        setattr(
+            BulkOperationBuilder,
+            method,
+            (lambda f: lambda self, *a, sort=None, **kw: f(self, *a, **kw))(original),
+        )
+    return mongomock.MongoClient()
+
+
+def run_incremental(db, path: str, staging: str) -> int:
+    with SheetReader(path) as rows, contextlib.redirect_stdout(io.StringIO()):
+        return import_excel.import_incremental(
+            db, rows, 1000, staging, 0.3, import_excel.PhaseTimer()
+        )
+
+
+def documents(db) -> dict:
+    return {name: {d["_id"]: d for d in db[name].find()} for name in COLLECTIONS}
+
+
+def served(db) -> tuple:
+    """
+    The catalogue with ids replaced by natural keys, for comparing databases
+    whose ids differ.
+    """
+    docs = documents(db)
+    slug = {i: d["slug"] for i, d in docs[import_excel.COL_DEPT].items()}
+    name = {i: d["name"] for i, d in docs[import_excel.COL_FAC].items()}
+    title = {i: (d["kind"], d["title"]) for i, d in docs[import_excel.COL_PUB].items()}
+    faculties = sorted(
+        (
+            f["name"],
+            f["position"] or "",
+            f["researchInterest"] or "",
+            tuple(slug[i] for i in f["departmentIds"]),
+            tuple(title[i] for i in f["articleIds"]),
+            tuple(title[i] for i in f["conferencePaperIds"]),
+        )
+        for f in docs[import_excel.COL_FAC].values()
+    )
+    publications = sorted(
+        (
+            p["kind"],
+            p["title"],
+            tuple(p["keywords"]),
+            tuple(name[a] for a in p["authors"]),
+        )
+        for p in docs[import_excel.COL_PUB].values()
+    )
+    departments = sorted(
+        (d["slug"], d["name"], d["type"]) for d in docs[import_excel.COL_DEPT].values()
+    )
+    return departments, faculties, publications
+
+
+def differing(before: dict, after: dict) -> dict:
+    """
+    Per collection, the ids added, removed or with any field changed.
+    `source` is left out like in document_hash: a staging rebuild rewrites
+    it for every document, in-place writes keep the first one stored.
+    """
+    result = {}
+    for name in COLLECTIONS:
+        old = {i: {**d, "source": None} for i, d in before[name].items()}
+        new = {i: {**d, "source": None} for i, d in after[name].items()}
+        result[name] = {i for i in old.keys() | new.keys() if old.get(i) != new.get(i)}
+    return result
+
+
+def check(ok: bool, message: str) -> None:
+    if not ok:
+        raise SystemExit(f"FAILED: {message}")
+    print(f"ok  {message}")
+
+
+def write_sheet(path: str, rows) -> None:
+    WRITERS[os.path.splitext(path)[1]](path, rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.check_incremental_import"
+    )
+    parser.add_argument("--rows", type=int, default=300)
+    parser.add_argument(
+        "--stand-in", action="store_true", help="in-process mongomock database"
+    )
+    args = parser.parse_args()
+    if args.rows < 10:
+        parser.error("--rows must be at least 10")
+
+    client = open_client(args.stand_in)
+    tmp = tempfile.mkdtemp(prefix="check-incremental-")
+    original = [list(row) for row in Generator(args.rows, 8, 0.3, 7).rows()]
+    sheet = os.path.join(tmp, "original.csv")
+    write_sheet(sheet, original)
+
+    # the edits: a new first row, one removed, one research interest changed
+    added_row = list(original[0])
+    added_row[0] = "Added Person"
+    added_row[4] = "1. A title nobody else lists\n" + added_row[4]
+    removed, edited = original[3], original[5]
+    edited_rows = [added_row] + [
+        (
+            [row[0], row[1], "A rewritten research interest.", *row[3:]]
+            if row is edited
+            else row
+        )
+        for row in original
+        if row is not removed
+    ]
+    edited_sheet = os.path.join(tmp, "edited.csv")
+    write_sheet(edited_sheet, edited_rows)
+
+    for staging in ("never", "auto", "always"):
+        print(f"\n--staging {staging}")
+        client.drop_database(BENCH_DB_NAME)
+        db = client[BENCH_DB_NAME]
+
+        first = run_incremental(db, sheet, staging)
+        initial = documents(db)
+        stored = sum(len(docs) for docs in initial.values())
+        check(first == stored > 0, f"first run adds all {stored} documents")
+
+        check(run_incremental(db, sheet, staging) == 0, "repeat run reports no change")
+        check(documents(db) == initial, "repeat run leaves every document as it was")
+
+        changes = run_incremental(db, edited_sheet, staging)
+        after = documents(db)
+        diff = differing(initial, after)
+        check(
+            changes == sum(len(ids) for ids in diff.values()),
+            f"edited sheet writes exactly the {changes} documents that differ",
+        )
+
+        touched_names = {added_row[0], removed[0], edited[0]}
+        faculties = {**initial[import_excel.COL_FAC], **after[import_excel.COL_FAC]}
+        check(
+            {faculties[i]["name"] for i in diff[import_excel.COL_FAC]} == touched_names,
+            "only the added, removed and edited faculty changed",
+        )
+        touched_ids = {i for i, f in faculties.items() if f["name"] in touched_names}
+        authors = {}  # before and after, so a removed author still counts
+        for docs in (initial[import_excel.COL_PUB], after[import_excel.COL_PUB]):
+            for i, pub in docs.items():
+                authors.setdefault(i, set()).update(pub["authors"])
+        check(
+            all(touched_ids & authors[i] for i in diff[import_excel.COL_PUB]),
+            f"the {len(diff[import_excel.COL_PUB])} changed publications all "
+            "involve those faculty",
+        )
+        departments = {**initial[import_excel.COL_DEPT], **after[import_excel.COL_DEPT]}
+        touched_affiliations = added_row[3] + "\n" + removed[3]
+        check(
+            all(
+                departments[i]["name"] in touched_affiliations
+                for i in diff[import_excel.COL_DEPT]
+            ),
+            f"the {len(diff[import_excel.COL_DEPT])} changed departments all "
+            "come from the added or removed row",
+        )
+
+        fresh = client[BENCH_DB_NAME + "_fresh"]
+        client.drop_database(fresh.name)
+        run_incremental(fresh, edited_sheet, staging)
+        check(served(db) == served(fresh), "result matches a fresh import")
+        client.drop_database(fresh.name)
+        check(
+            run_incremental(db, edited_sheet, staging) == 0,
+            "repeat run on the edited sheet reports no change",
+        )
+
+    client.drop_database(BENCH_DB_NAME)
+    print("\nall checks passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks run against a real MongoDB (BENCH_MONGO_URI, falling back to
+MONGO_URI) and write into a throwaway database (BENCH_DB_NAME) so they never
+touch the catalogue served by the API.
+
+Run them from the backend/ directory, e.g.:
+
+    python -m benchmarks.bench_author_queries
+"""
+
+import os
+import random
+import time
+from collections import Counter
+from typing import Any, Callable, List, Optional, Tuple
+
+from bson import ObjectId
+from dotenv import load_dotenv
+from pymongo import MongoClient, monitoring
+from pymongo.database import Database
+
+load_dotenv()
+
+BENCH_MONGO_URI = os.getenv("BENCH_MONGO_URI") or os.getenv(
+    "MONGO_URI", "mongodb://localhost:27017"
+)
+BENCH_DB_NAME = os.getenv("BENCH_DB_NAME", "aston_cs_research_portal_bench")
+
+WORDS = [
+    "learning", "neural", "network", "deep", "graph", "security", "privacy",
+    "software", "testing", "robotics", "vision", "language", "model", "data",
+    "mining", "cloud", "edge", "quantum", "optimisation", "evolutionary",
+    "federated", "blockchain", "intrusion", "detection", "healthcare",
+    "semantic", "ontology", "reinforcement", "agent", "distributed", "sensor",
+    "wireless", "energy", "fairness", "explainable", "transformer", "speech",
+    "recommendation", "retrieval", "verification", "formal", "compiler",
+    "embedded", "autonomous", "malware", "forensics", "crowdsourcing",
+    "visualisation", "bioinformatics", "genomics", "clustering", "anomaly",
+]
+
+POSITIONS = ["Professor", "Reader", "Senior Lecturer", "Lecturer", "Research Fellow"]
+
+
+class QueryCounter(monitoring.CommandListener):
+    """
+    Counts the commands a MongoClient sends, keyed by command name.
+    """
+
+    def __init__(self):
+        self.commands: Counter = Counter()
+
+    def started(self, event):
+        self.commands[event.command_name] += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+    def reset(self):
+        self.commands.clear()
+
+    @property
+    def total(self) -> int:
+        return sum(self.commands.values())
+
+
+def connect(listener: Optional[monitoring.CommandListener] = None) -> MongoClient:
+    listeners = [listener] if listener else []
+    return MongoClient(BENCH_MONGO_URI, event_listeners=listeners)
+
+
+def random_title(rng: random.Random) -> str:
+    words = rng.sample(WORDS, rng.randint(4, 9))
+    return " ".join(words).capitalize()
+
+
+def seed(
+    db: Database,
+    departments: int = 10,
+    faculties: int = 200,
+    publications: int = 2000,
+    authors_per_publication: int = 3,
+    random_seed: int = 42,
+) -> None:
+    """
+    Replace the benchmark database contents with a synthetic catalogue that has
+    the same document shapes as scripts/import_excel.py produces.
+    """
+    rng = random.Random(random_seed)
+    for col in ("departments", "faculties", "publications"):
+        db[col].delete_many({})
+
+    dept_docs = [
+        {
+            "_id": ObjectId(),
+            "name": f"Department of Computing {i}",
+            "slug": f"department-of-computing-{i}",
+            "type": "other",
+            "description": None,
+            "isComputerScienceRelated": True,
+        }
+        for i in range(departments)
+    ]
+    fac_docs = [
+        {
+            "_id": ObjectId(),
+            "name": f"Faculty Member {i}",
+            "position": rng.choice(POSITIONS),
+            "researchInterest": " ".join(rng.sample(WORDS, 3)),
+            "rawDepartmentAffiliation": "",
+            "departmentIds": [rng.choice(dept_docs)["_id"]],
+            "articleIds": [],
+            "conferencePaperIds": [],
+        }
+        for i in range(faculties)
+    ]
+    fac_by_id = {f["_id"]: f for f in fac_docs}
+    if dept_docs:
+        db["departments"].insert_many(dept_docs)
+
+    # publications go in as they are generated so large scales don't need the
+    # whole collection in memory; faculties follow once their ids are filled
+    pub_docs = []
+    for i in range(publications):
+        title = f"{random_title(rng)} {i}"
+        kind = rng.choice(["article", "conference"])
+        authors = [
+            f["_id"]
+            for f in rng.sample(fac_docs, min(authors_per_publication, len(fac_docs)))
+        ]
+        pub_id = ObjectId()
+        pub_docs.append(
+            {
+                "_id": pub_id,
+                "title": title,
+                "kind": kind,
+                "authors": authors,
+                "keywords": [w for w in title.lower().split() if len(w) > 2],
+            }
+        )
+        key = "articleIds" if kind == "article" else "conferencePaperIds"
+        for a in authors:
+            fac_by_id[a][key].append(pub_id)
+        if len(pub_docs) == 10_000:
+            db["publications"].insert_many(pub_docs)
+            pub_docs = []
+
+    if pub_docs:
+        db["publications"].insert_many(pub_docs)
+    if fac_docs:
+        db["faculties"].insert_many(fac_docs)
+
+
+def timed(fn: Callable[[], Any], repeat: int = 5) -> Tuple[Any, float]:
+    """
+    Run fn `repeat` times and return (last result, best wall time in ms).
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return result, best
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """
+    Nearest-rank percentile of already sorted samples.
+    """
+    return samples[max(int(len(samples) * q) - 1, 0)]
+
+
+def print_table(headers: List[str], rows: List[List[Any]]) -> None:
+    widths = [
+        max(len(str(h)), *(len(str(r[i])) for r in rows)) if rows else len(str(h))
+        for i, h in enumerate(headers)
+    ]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for r in rows:
+        print("  ".join(str(c).ljust(w) for c, w in zip(r, widths)))
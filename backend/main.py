@@ -1,16 +1,87 @@
+import logging
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv
+
+# before any app import: app.core.db and friends read the environment at import
+load_dotenv()
+
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, PlainTextResponse
+from app.core import db, indexes, metrics, singleflight, slowlog, snapshot
 from app.core.error_handlers import http_error_handler, mongo_error_handler
+from app.core.responses import ORJSONResponse
+from app.core.utils import send_response
 
-from app.modules.department.controller import router as department_router
-from app.modules.faculty.controller import router as faculty_router
-from app.modules.publication.controller import router as publication_router
-from app.modules.search.controller import router as search_router
+if db.DB_DRIVER == "async":
+    from app.modules.department.async_controller import router as department_router
+    from app.modules.faculty.async_controller import router as faculty_router
+    from app.modules.publication.async_controller import router as publication_router
+    from app.modules.search.async_controller import router as search_router
+else:
+    from app.modules.department.controller import router as department_router
+    from app.modules.faculty.controller import router as faculty_router
+    from app.modules.publication.controller import router as publication_router
+    from app.modules.search.controller import router as search_router
+from app.modules.search.service import search_cache
 
+logger = logging.getLogger(__name__)
 
-load_dotenv()
 
-app = FastAPI(title="Aston CS Research Portal API")
+# --------------------------------------------------------
+# Startup / shutdown
+# --------------------------------------------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # open the pool now rather than on the first request
+    try:
+        if db.DB_DRIVER == "async":
+            db.open_async_client()
+            warmed = await db.warm_up_async()
+        else:
+            warmed = await run_in_threadpool(db.warm_up)
+        logger.info("MongoDB pool warmed up with %d connection(s)", warmed)
+    except Exception as exc:
+        # serve anyway; /health reports the database as down
+        logger.warning("MongoDB warm-up failed: %s", exc)
+    else:
+        if indexes.ENSURE_INDEXES_ON_STARTUP:
+            await run_in_threadpool(indexes.ensure_indexes, db.get_db())
+        elif db.DB_DRIVER == "async":
+            indexes.warn_missing(await indexes.missing_indexes_async(db.get_async_db()))
+        else:
+            indexes.warn_missing(
+                await run_in_threadpool(indexes.missing_indexes, db.get_db())
+            )
+
+    if snapshot.CATALOGUE_SNAPSHOT:
+        # the snapshot is built over the sync client whatever DB_DRIVER says
+        try:
+            await run_in_threadpool(snapshot.holder.load, db.get_db())
+        except Exception as exc:
+            # reads go to MongoDB until the reload thread manages a build
+            logger.warning("Catalogue snapshot build failed: %s", exc)
+        snapshot.holder.start(db.get_db())
+    yield
+
+    if snapshot.CATALOGUE_SNAPSHOT:
+        snapshot.holder.stop()
+
+    if db.DB_DRIVER == "async":
+        await db.close_async_client()
+    db.close_client()
+
+
+app = FastAPI(
+    title="Aston CS Research Portal API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+if metrics.METRICS_ENABLED:
+    app.add_middleware(metrics.MetricsMiddleware, metrics=metrics.request_metrics)
+if slowlog.SLOW_QUERY_ENABLED:
+    app.add_middleware(slowlog.RequestContextMiddleware)
 
 
 # --------------------------------------------------------
@@ -21,6 +92,90 @@ def root():
     return {"status": "ok", "message": "Aston CS Research Portal Backend Running"}
 
 
+@app.get("/health")
+async def health():
+    """
+    Liveness plus MongoDB ping latency; 503 when the database is unreachable.
+    """
+    try:
+        if db.DB_DRIVER == "async":
+            latency = await db.ping_async()
+        else:
+            latency = await run_in_threadpool(db.ping)
+    except Exception:
+        return JSONResponse(
+            status_code=503,
+            content=send_response(
+                {"status": "down", "driver": db.DB_DRIVER, "pingMs": None},
+                status_code=503,
+                message="Database unreachable",
+                success=False,
+            ),
+        )
+
+    return send_response(
+        {"status": "ok", "driver": db.DB_DRIVER, "pingMs": round(latency, 2)},
+        status_code=200,
+        message="Healthy",
+    )
+
+
+@app.get("/stats")
+def stats():
+    """
+    Request-coalescing counters per single-flight group, and the catalogue
+    snapshot (size, build time, reloads) when snapshot mode is on.
+    """
+    return send_response(
+        {
+            "singleflight": singleflight.stats(),
+            "snapshot": (
+                snapshot.holder.stats() if snapshot.CATALOGUE_SNAPSHOT else None
+            ),
+        },
+        status_code=200,
+        message="Stats retrieved successfully",
+    )
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def prometheus_metrics():
+    """
+    Prometheus text format: request latency/status per route, MongoDB commands
+    per collection, search cache and single-flight counters.
+    """
+    cache = search_cache.stats()
+    flights = singleflight.stats()
+    extra = metrics.render_family(
+        "search_cache_events_total",
+        "Search result cache lookups and evictions",
+        "counter",
+        [
+            (f'event="{event}"', cache[event])
+            for event in ("hits", "misses", "evictions")
+        ],
+    )
+    extra += metrics.render_family(
+        "search_cache_entries",
+        "Entries in the search cache",
+        "gauge",
+        [("", cache["size"])],
+    )
+    extra += metrics.render_family(
+        "singleflight_calls_total",
+        "Single-flight calls by outcome",
+        "counter",
+        [
+            (f'group="{name}",outcome="{outcome}"', group[outcome])
+            for name, group in sorted(flights.items())
+            for outcome in ("executions", "coalesced")
+        ],
+    )
+    return PlainTextResponse(
+        metrics.render(extra), media_type="text/plain; version=0.0.4"
+    )
+
+
 # --------------------------------------------------------
 # Routers
 # --------------------------------------------------------
@@ -4,9 +4,15 @@ Scan MongoDB `publications` collection for duplicates (same title + kind),
 report how many duplicate groups and optionally delete duplicates (keep one per group).
 """
 
+import os
+import sys
 from pymongo import MongoClient, DeleteOne
 from pprint import pprint
 
+# the version marker the API watches to drop caches
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.core.catalogue import bump_catalogue_version  # noqa: E402
+
 # === CONFIG ===
 MONGO_URI = "mongodb://localhost:27017"  # or whatever your URI is
 DB_NAME = "aston_cs_research_portal"  # your database name
@@ -65,6 +71,7 @@ def find_and_cleanup_duplicates():
             if delete_ops:
                 result = coll.bulk_write(delete_ops)
                 print(f"\n🗑 Deleted {result.deleted_count} duplicate documents.")
+                bump_catalogue_version(db)
             else:
                 print("\nNo deletions needed (no extra docs beyond first).")
 
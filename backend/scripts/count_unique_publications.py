@@ -1,15 +1,15 @@
 #!/usr/bin/env python3
-import pandas as pd
+import argparse
 import re
 
+from sheet_reader import SheetReader
+
 EXCEL_FILE = "project-dataset.xlsx"  # or correct path to your Excel file
-SHEET_NAME = 0  # integer index or sheet name — use 0 or sheet name to get a DataFrame
+SHEET_NAME = None  # sheet name, or None for the first sheet
 
 
-def parse_publications_cell(raw):
-    if pd.isna(raw):
-        return []
-    s = str(raw).strip()
+def parse_publications_cell(raw: str):
+    s = raw.strip()
     if not s:
         return []
     s = s.replace("\r\n", "\n").replace("\r", "\n")
@@ -23,17 +23,21 @@ def parse_publications_cell(raw):
 
 
 def main():
-    df = pd.read_excel(EXCEL_FILE, sheet_name=SHEET_NAME, engine="openpyxl")
-    print(f"✅ Read DataFrame: {df.shape[0]} rows, {df.shape[1]} columns")
+    parser = argparse.ArgumentParser(
+        description="Count publication titles in the spreadsheet"
+    )
+    parser.add_argument("file", nargs="?", default=EXCEL_FILE)
+    args = parser.parse_args()
 
     all_titles = []
-    for col in ["Article", "Conference Paper"]:
-        if col not in df.columns:
-            print(f"⚠️ Column '{col}' not found — skipping")
-            continue
-        for raw in df[col]:
-            titles = parse_publications_cell(raw)
-            all_titles.extend(titles)
+    with SheetReader(args.file, SHEET_NAME) as rows:
+        for col in ["Article", "Conference Paper"]:
+            if col in rows.missing:
+                print(f"⚠️ Column '{col}' not found — skipping")
+        for _, row in rows:
+            all_titles.extend(parse_publications_cell(row.article))
+            all_titles.extend(parse_publications_cell(row.conference_paper))
+    print(f"✅ Read {rows.count} rows")
 
     unique_titles = set(all_titles)
     print("📄 Total publication entries (including duplicates):", len(all_titles))
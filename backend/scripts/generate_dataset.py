@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+generate_dataset.py
+
+Writes a synthetic spreadsheet in the project-dataset.xlsx format (Name,
+Position, Research Interest, Departmental Affiliation, Article, Conference
+Paper), at any scale, for load-testing import_excel.py, the count script and
+the API.
+
+    python scripts/generate_dataset.py --faculties 50000 -o synthetic.xlsx
+    python scripts/generate_dataset.py --faculties 50000 -o synthetic.csv
+    python scripts/generate_dataset.py --faculties 50000 -o synthetic.parquet
+
+The format follows the output extension. Rows are streamed (openpyxl
+write-only mode, csv, or Parquet row groups), so memory stays flat however
+many rows are written; Parquet needs pyarrow.
+
+What makes it look like the real sheet:
+- publications per person are heavy-tailed (a few authors with 100+ titles,
+  many with a handful), split roughly 60/40 between articles and papers;
+- faculty belong to research groups, and a share of each person's titles are
+  ones a colleague in the same group already listed, so the importer merges
+  co-authors the way it does on the real data;
+- affiliations follow a skewed distribution over schools, centres and
+  groups (CS-related and not), with the same mix of newline/comma
+  separators, numbering styles ("1. Title", "1.Title") and stray whitespace;
+- some people have no research interest, position or publications.
+
+The same --seed always produces the same file.
+"""
+
+import argparse
+import csv
+import itertools
+import math
+import os
+import random
+import time
+from collections import deque
+from typing import Dict, Iterator, List, Tuple
+
+COLUMNS = [
+    "Name",
+    "Position",
+    "Research Interest",
+    "Departmental Affiliation",
+    "Article",
+    "Conference Paper",
+]
+
+# Excel rejects longer cells
+MAX_CELL_CHARS = 32_767
+
+# fmt: off
+FIRST_NAMES = [
+    "Emeka", "Dan", "Roberto", "Aisha", "Wei", "Priya", "James", "Olivia",
+    "Mohammed", "Sofia", "Chen", "Fatima", "Lucas", "Amara", "Hiroshi", "Elena",
+    "Kwame", "Maria", "Arjun", "Zainab", "Thomas", "Yusuf", "Anna", "Ravi",
+    "Grace", "Ibrahim", "Laura", "Tariq", "Hannah", "Diego", "Mei", "Samuel",
+    "Nadia", "Oliver", "Leila", "Daniel", "Ayesha", "Marco", "Ngozi", "Peter",
+]
+# fmt: on
+
+# fmt: off
+LAST_NAMES = [
+    "Abakasanga", "Abudu", "Alamino", "Khan", "Zhang", "Patel", "Smith", "Jones",
+    "Ali", "Rossi", "Wang", "Ahmed", "Silva", "Okafor", "Tanaka", "Ivanova",
+    "Mensah", "Garcia", "Sharma", "Hussain", "Brown", "Yilmaz", "Novak", "Kumar",
+    "Williams", "Hassan", "Muller", "Iqbal", "Taylor", "Fernandez", "Li", "Adeyemi",
+    "Rahman", "Wilson", "Haddad", "Evans", "Malik", "Bianchi", "Eze", "Clarke",
+]
+# fmt: on
+
+RANKS = [
+    ("Lecturer", 30),
+    ("Senior Lecturer", 25),
+    ("Reader", 8),
+    ("Professor", 8),
+    ("Associate Professor", 4),
+    ("Teaching Fellow", 6),
+    ("Senior Teaching Fellow", 3),
+    ("Research Fellow", 8),
+    ("Teaching Assistant", 3),
+]
+
+SCHOOL = "School of Computer Science and Digital Technologies"
+COLLEGE = "College of Engineering and Physical Sciences"
+UNIVERSITY = "Aston University"
+
+# (unit, weight) — the subject groups people list in their position
+SUBJECT_GROUPS = [
+    ("Applied AI & Robotics", 40),
+    ("Applied Mathematics & Data Science", 30),
+    ("Software Engineering & Cybersecurity", 12),
+    ("Business Analytics and Information Systems", 6),
+    ("Computer Science Research Group", 5),
+    ("Civil Engineering", 3),
+    ("Mechanical, Biomedical and Design Engineering", 2),
+    ("Electrical and Electronic Engineering", 2),
+]
+
+CENTRES = [
+    ("Aston Centre for Artificial Intelligence Research and Application", 40),
+    ("Research Centre for Cyber Security, Privacy and Trust", 15),
+    ("Aston Fluids Group", 8),
+    ("Engineering for Health", 6),
+    ("Smart and Sustainable Manufacturing", 6),
+    ("Engineering for Sustainable Development", 5),
+    ("EPS Education and Professional Practice Academic Research Group", 5),
+    ("Aston India Centre for Applied Research", 3),
+    ("Aston Institute of Photonic Technologies", 4),
+    ("Research Centre for the Humanities", 2),
+]
+
+# extra centres for large scales, some of them CS-related by name
+CENTRE_TOPICS = [
+    "Data Science",
+    "Artificial Intelligence",
+    "Software Engineering",
+    "Cyber Security",
+    "Networks",
+    "Digital Health",
+    "Photonics",
+    "Energy Systems",
+    "Operations Research",
+    "Human-Computer Interaction",
+]
+
+# fmt: off
+TITLE_WORDS = {
+    "method": [
+        "Deep", "Federated", "Explainable", "Bayesian", "Distributed", "Robust",
+        "Scalable", "Unsupervised", "Adaptive", "Privacy-Preserving", "Graph-Based",
+        "Reinforcement", "Evolutionary", "Probabilistic", "Lightweight", "Hybrid",
+        "Transformer-Based", "Semi-Supervised", "Energy-Efficient", "Secure",
+    ],
+    "object": [
+        "learning", "optimisation", "inference", "clustering", "classification",
+        "anomaly detection", "intrusion detection", "clock synchronization",
+        "recommendation", "scheduling", "segmentation", "forecasting", "routing",
+        "verification", "compression", "localisation", "feature selection",
+        "knowledge graphs", "language models", "signal processing",
+    ],
+    "domain": [
+        "wireless networks", "healthcare", "mental health", "smart grids",
+        "autonomous vehicles", "industrial IoT", "edge computing", "cloud systems",
+        "manufacturing", "urban mobility", "remote sensing", "finance", "education",
+        "cyber-physical systems", "social networks", "genomics", "supply chains",
+        "robotic manipulation", "software repositories", "sustainability",
+    ],
+    "venue": [
+        "a case study", "a systematic review", "an empirical study",
+        "theory and practice", "a benchmark", "lessons learned", "a survey",
+        "a comparative analysis", "a statistical physics approach",
+    ],
+}
+# fmt: on
+
+INTEREST_SENTENCES = [
+    "My research focuses on {a} and its applications to {d}.",
+    "I work on {a}, with a particular interest in {b}.",
+    "Current projects include {a} for {d} and {b}.",
+    "I am interested in the theory and practice of {a}.",
+    "I lead work on {b} in collaboration with partners in {d}.",
+    "Before joining Aston I worked on {a} in industry.",
+]
+
+
+def weighted_choice(rng: random.Random, items: List[Tuple[str, int]]) -> str:
+    return rng.choices([i for i, _ in items], weights=[w for _, w in items])[0]
+
+
+class Generator:
+    def __init__(
+        self,
+        faculties: int,
+        mean_publications: float,
+        coauthor_share: float,
+        seed: int,
+    ):
+        self.rng = random.Random(seed)
+        self.faculties = faculties
+        self.coauthor_share = coauthor_share
+        # lognormal with a long tail, like the real sheet (median ~20 titles)
+        self.sigma = 1.0
+        self.mu = math.log(max(mean_publications, 1)) - self.sigma**2 / 2
+
+        extra = [
+            (f"Centre for {self.rng.choice(CENTRE_TOPICS)} {i}", 1)
+            for i in range(faculties // 500)
+        ]
+        self.centres = CENTRES + extra
+        # research groups with Zipf-like sizes; titles are shared within one
+        groups = max(faculties // 15, 1)
+        self.groups = range(groups)
+        self.group_cum_weights = list(
+            itertools.accumulate(1 / (i + 1) for i in range(groups))
+        )
+        # recently listed titles per (group, kind), for co-authors to reuse
+        self.shared: Dict[Tuple[int, str], deque] = {}
+        self.title_count = 0
+        self.lines = 0
+        self.first_names = self.rng.sample(FIRST_NAMES, len(FIRST_NAMES))
+
+    # -- cells -----------------------------------------------------------
+    def name(self, i: int) -> str:
+        # names are unique at any scale, like real staff lists (the importer
+        # keys faculty on them): the first rows each get a different first
+        # name, later ones a numeric suffix
+        rng = self.rng
+        if i < len(self.first_names):
+            return f"{self.first_names[i]} {rng.choice(LAST_NAMES)}"
+        return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {i}"
+
+    def position(self, subject: str) -> str:
+        rng = self.rng
+        if rng.random() < 0.05:
+            return ""
+        unit = rng.choices(
+            [subject, UNIVERSITY, COLLEGE, SCHOOL], weights=[80, 8, 7, 5]
+        )[0]
+        return f"{weighted_choice(rng, RANKS)}, {unit}"
+
+    def research_interest(self) -> str:
+        rng = self.rng
+        if rng.random() < 0.25:
+            return ""
+        sentences = []
+        for _ in range(rng.randint(2, 8)):
+            sentences.append(
+                rng.choice(INTEREST_SENTENCES).format(
+                    a=rng.choice(TITLE_WORDS["object"]),
+                    b=rng.choice(TITLE_WORDS["object"]),
+                    d=rng.choice(TITLE_WORDS["domain"]),
+                )
+            )
+        paragraphs = [
+            " ".join(sentences[i : i + 3]) for i in range(0, len(sentences), 3)
+        ]
+        return "\n\n".join(paragraphs)
+
+    def affiliation(self, subject: str) -> str:
+        rng = self.rng
+        units = []
+        if rng.random() < 0.4:
+            units.append(UNIVERSITY)
+        if rng.random() < 0.95:
+            units.append(SCHOOL)
+        for _ in range(rng.choices([0, 1, 2, 3], weights=[15, 55, 22, 8])[0]):
+            centre = weighted_choice(rng, self.centres)
+            if centre not in units:
+                units.append(centre)
+        if rng.random() < 0.9:
+            units.append(COLLEGE)
+        units.append(subject)
+        separator = rng.choices(["\n", " \n", ", "], weights=[45, 45, 10])[0]
+        return separator.join(units)
+
+    def new_title(self) -> str:
+        rng = self.rng
+        words = TITLE_WORDS
+        title = (
+            f"{rng.choice(words['method'])} {rng.choice(words['object'])} "
+            f"for {rng.choice(words['domain'])}"
+        )
+        if rng.random() < 0.3:
+            title += f": {rng.choice(words['venue'])}"
+        self.title_count += 1
+        # a counter suffix keeps titles distinct at millions of lines
+        return f"{title} ({self.title_count})" if rng.random() < 0.98 else title
+
+    def titles(self, group: int, kind: str, count: int) -> List[str]:
+        rng = self.rng
+        pool = self.shared.setdefault((group, kind), deque(maxlen=500))
+        titles = []
+        for _ in range(count):
+            if pool and rng.random() < self.coauthor_share:
+                title = rng.choice(pool)
+            else:
+                title = self.new_title()
+                pool.append(title)
+            if title not in titles:
+                titles.append(title)
+        return titles
+
+    def numbered(self, titles: List[str]) -> str:
+        rng = self.rng
+        style = rng.choice(["{n}. {t}", "{n}.{t}"])
+        trailing = rng.choice(["", " ", "\n"])
+        lines = []
+        size = 0
+        for n, title in enumerate(titles, start=1):
+            line = style.format(n=n, t=title) + (" " if rng.random() < 0.05 else "")
+            size += len(line) + 1
+            if size > MAX_CELL_CHARS - 1:
+                break
+            lines.append(line)
+        self.lines += len(lines)
+        return "\n".join(lines) + trailing if lines else ""
+
+    # -- rows ------------------------------------------------------------
+    def rows(self) -> Iterator[List[str]]:
+        rng = self.rng
+        for i in range(self.faculties):
+            subject = weighted_choice(rng, SUBJECT_GROUPS)
+            group = rng.choices(self.groups, cum_weights=self.group_cum_weights)[0]
+            total = int(rng.lognormvariate(self.mu, self.sigma))
+            if rng.random() < 0.05:
+                total = 0
+            articles = round(total * rng.uniform(0.45, 0.75))
+            yield [
+                self.name(i),
+                self.position(subject),
+                self.research_interest(),
+                self.affiliation(subject),
+                self.numbered(self.titles(group, "article", articles)),
+                self.numbered(self.titles(group, "conference", total - articles)),
+            ]
+
+
+# --------------------------------------------------------
+# Writers
+# --------------------------------------------------------
+def write_xlsx(path: str, rows: Iterator[List[str]]) -> int:
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(COLUMNS)
+    count = 0
+    for row in rows:
+        ws.append(row)
+        count += 1
+    wb.save(path)
+    return count
+
+
+def write_csv(path: str, rows: Iterator[List[str]]) -> int:
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def write_parquet(path: str, rows: Iterator[List[str]], batch: int = 10_000) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise SystemExit("Parquet output needs pyarrow: pip install pyarrow")
+
+    schema = pa.schema([(c, pa.string()) for c in COLUMNS])
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        buffer: List[List[str]] = []
+        for row in rows:
+            buffer.append(row)
+            if len(buffer) == batch:
+                writer.write_table(
+                    pa.Table.from_pylist(
+                        [dict(zip(COLUMNS, r)) for r in buffer], schema=schema
+                    )
+                )
+                count += len(buffer)
+                buffer = []
+        if buffer:
+            writer.write_table(
+                pa.Table.from_pylist(
+                    [dict(zip(COLUMNS, r)) for r in buffer], schema=schema
+                )
+            )
+            count += len(buffer)
+    return count
+
+
+WRITERS = {".xlsx": write_xlsx, ".csv": write_csv, ".parquet": write_parquet}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic dataset in the project-dataset.xlsx format"
+    )
+    parser.add_argument("--faculties", type=int, default=1000, help="rows to write")
+    parser.add_argument(
+        "--mean-publications",
+        type=float,
+        default=32,
+        help="mean titles per person (articles + conference papers)",
+    )
+    parser.add_argument(
+        "--coauthor-share",
+        type=float,
+        default=0.3,
+        help="share of titles reused from a colleague in the same group",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="synthetic-dataset.xlsx",
+        help=".xlsx, .csv or .parquet",
+    )
+    args = parser.parse_args()
+
+    ext = os.path.splitext(args.output)[1].lower()
+    if ext not in WRITERS:
+        parser.error(f"unsupported output format {ext!r}; use .xlsx, .csv or .parquet")
+
+    gen = Generator(
+        args.faculties, args.mean_publications, args.coauthor_share, args.seed
+    )
+    start = time.perf_counter()
+    rows = WRITERS[ext](args.output, gen.rows())
+    elapsed = time.perf_counter() - start
+
+    size_mb = os.path.getsize(args.output) / 1_048_576
+    print(
+        f"✅ Wrote {rows:,} rows to {args.output} ({size_mb:.1f} MB) in {elapsed:.1f}s"
+    )
+    print(f"📄 Publication lines: {gen.lines:,}")
+    print(f"🔖 New titles (before co-author reuse): {gen.title_count:,}")
+
+
+if __name__ == "__main__":
+    main()
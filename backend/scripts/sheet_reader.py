@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+sheet_reader.py
+
+Streams the rows of a spreadsheet in the project-dataset.xlsx format (Name,
+Position, Research Interest, Departmental Affiliation, Article, Conference
+Paper) for the import scripts, without loading the whole sheet:
+
+- .xlsx through openpyxl's read-only mode, one row at a time;
+- .csv through the csv module;
+- .parquet one record batch at a time (needs pyarrow).
+
+    with SheetReader("project-dataset.xlsx") as rows:
+        for idx, row in rows:
+            row.name, row.article, ...
+
+Rows come out as (idx, SheetRow) pairs like DataFrame.iterrows(), with idx
+the 0-based data row (sheet row idx + 2) and every cell a string, "" when
+empty or when the column is missing. Memory stays flat however long the
+sheet is.
+"""
+
+import csv
+import os
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+# spreadsheet header -> SheetRow field, in SheetRow order
+COLUMNS = {
+    "Name": "name",
+    "Position": "position",
+    "Research Interest": "research_interest",
+    "Departmental Affiliation": "department_affiliation",
+    "Article": "article",
+    "Conference Paper": "conference_paper",
+}
+
+FORMATS = (".xlsx", ".csv", ".parquet")
+
+
+class SheetRow(NamedTuple):
+    name: str
+    position: str
+    research_interest: str
+    department_affiliation: str
+    article: str
+    conference_paper: str
+
+
+def _cell(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+class SheetReader:
+    """
+    Context manager over the rows of one sheet. The header is read on
+    enter, so a missing or unreadable file fails before anything else runs;
+    `missing` lists expected columns the header lacks and `count` the rows
+    yielded so far.
+    """
+
+    def __init__(self, path: str, sheet: Optional[str] = None):
+        self.path = path
+        self.sheet = sheet
+        self.format = os.path.splitext(path)[1].lower()
+        if self.format not in FORMATS:
+            raise SystemExit(
+                f"Unsupported sheet format {self.format!r}; use .xlsx, .csv or .parquet"
+            )
+        self.missing: List[str] = []
+        self.count = 0
+        self._close = None
+        self._rows: Optional[Iterator[Sequence]] = None
+        self._positions: List[Optional[int]] = []
+
+    def __enter__(self) -> "SheetReader":
+        opener = {
+            ".xlsx": self._open_xlsx,
+            ".csv": self._open_csv,
+            ".parquet": self._open_parquet,
+        }[self.format]
+        header, self._rows = opener()
+        header = [_cell(h).strip() for h in header]
+        self._positions = [
+            header.index(column) if column in header else None for column in COLUMNS
+        ]
+        self.missing = [c for c, p in zip(COLUMNS, self._positions) if p is None]
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+    def __iter__(self) -> Iterator[Tuple[int, SheetRow]]:
+        if self._rows is None:
+            raise RuntimeError("use SheetReader as a context manager")
+        positions = self._positions
+        idx = -1
+        for values in self._rows:
+            idx += 1
+            width = len(values)
+            cells = [
+                _cell(values[p]) if p is not None and p < width else ""
+                for p in positions
+            ]
+            if not any(cells):
+                # blank line, or formatting past the last row
+                continue
+            self.count += 1
+            yield idx, SheetRow(*cells)
+
+    # --------------------------------------------------------
+    # Formats: each returns (header, iterator over the data rows)
+    # --------------------------------------------------------
+    def _open_xlsx(self):
+        from openpyxl import load_workbook
+
+        wb = load_workbook(self.path, read_only=True, data_only=True)
+        self._close = wb.close
+        ws = wb[self.sheet] if self.sheet else wb.worksheets[0]
+        rows = ws.iter_rows(values_only=True)
+        return next(rows, ()), rows
+
+    def _open_csv(self):
+        f = open(self.path, newline="", encoding="utf-8-sig")
+        self._close = f.close
+        rows = csv.reader(f)
+        return next(rows, []), rows
+
+    def _open_parquet(self, batch_size: int = 10_000):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("Reading Parquet needs pyarrow: pip install pyarrow")
+
+        pf = pq.ParquetFile(self.path)
+        self._close = pf.close
+        header = pf.schema_arrow.names
+
+        def rows():
+            for batch in pf.iter_batches(batch_size=batch_size):
+                yield from zip(*(column.to_pylist() for column in batch.columns))
+
+        return header, rows()